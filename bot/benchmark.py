@@ -0,0 +1,475 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+import pytz
+
+try:
+    from .utils import setup_logging
+    from .fake_discord import FakeDiscord
+    from .ratelimit import RENAME_BUCKETS, RequestBudget
+    from .registry import DEFAULT_CHANNELS, ChannelRegistry
+    from .rest import RestClient
+    from .retry_queue import PENDING_RENAMES
+    from .render import RENDER_CACHE
+    from .state import AppliedNameStore
+    from .health import ChannelHealth
+    from .plan import compile_plan
+    from .commands import TimeAnswerCache
+    from .importtime import PROJECT_ROOT, profile_imports
+    from .schedule import calculate_next_update_time
+    from .updater import (
+        get_availability_status,
+        get_holiday_info,
+        is_off_day,
+        render_channel_name,
+        update_channel_names,
+    )
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+    from fake_discord import FakeDiscord
+    from ratelimit import RENAME_BUCKETS, RequestBudget
+    from registry import DEFAULT_CHANNELS, ChannelRegistry
+    from rest import RestClient
+    from retry_queue import PENDING_RENAMES
+    from render import RENDER_CACHE
+    from state import AppliedNameStore
+    from health import ChannelHealth
+    from plan import compile_plan
+    from commands import TimeAnswerCache
+    from importtime import PROJECT_ROOT, profile_imports
+    from schedule import calculate_next_update_time
+    from updater import (
+        get_availability_status,
+        get_holiday_info,
+        is_off_day,
+        render_channel_name,
+        update_channel_names,
+    )
+
+# 로깅 설정
+logger = setup_logging("discord_benchmark")
+
+KST = pytz.timezone("Asia/Seoul")
+
+# 기준 결과 파일 기본 위치 - 저장소에 함께 커밋 (BENCHMARK_BASELINE으로 변경)
+DEFAULT_BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json"
+)
+
+# 시뮬레이션 기준 연도
+SIMULATED_YEAR = 2025
+
+# 호출 비용이 작은 조회 함수는 표본을 늘리기 위해 같은 입력을 반복
+MICRO_REPEAT = 10
+
+# 기준 대비 이 비율 이상 느려지면 회귀로 판단
+DEFAULT_TOLERANCE = 0.25
+
+# 봇 프로세스 시작부터 첫 이름 변경(PATCH)까지 허용 시간 (ms, STARTUP_BUDGET_MS로 변경)
+DEFAULT_STARTUP_BUDGET_MS = 1500.0
+
+
+def percentile(sorted_samples, q):
+    """정렬된 표본의 q(0~1) 분위수"""
+    if not sorted_samples:
+        return 0.0
+    index = min(int(q * len(sorted_samples)), len(sorted_samples) - 1)
+    return sorted_samples[index]
+
+
+def year_instants(step_minutes, year=SIMULATED_YEAR):
+    """한국 시간 기준 1년 동안 step_minutes 간격의 시각 목록"""
+    start = KST.localize(datetime(year, 1, 1))
+    end = KST.localize(datetime(year + 1, 1, 1))
+    step = timedelta(minutes=step_minutes)
+    instants = []
+    current = start
+    while current < end:
+        instants.append(current)
+        current = KST.normalize(current + step)
+    return instants
+
+
+def synthetic_registry(count):
+    """기본 채널 설정을 반복해 count개 채널 레지스트리 생성"""
+    templates = list(DEFAULT_CHANNELS.items())
+    channels = {}
+    for i in range(count):
+        region, entry = templates[i % len(templates)]
+        channels[f"{region}_{i}"] = dict(
+            entry, id=10**17 + i, name=f"{entry['name']} {i}", region=region
+        )
+    return ChannelRegistry(channels)
+
+
+def measure(samples, operations, elapsed, peak_bytes):
+    """측정 표본(초 단위 호출별 지연)을 결과 dict로 요약"""
+    samples.sort()
+    return {
+        "operations": operations,
+        "ops_per_sec": operations / elapsed if elapsed else 0.0,
+        "p50_us": percentile(samples, 0.50) * 1e6,
+        "p99_us": percentile(samples, 0.99) * 1e6,
+        "peak_kib": peak_bytes / 1024,
+    }
+
+
+def run_calls(func, args_list, ops_per_call=1):
+    """args_list의 각 인자로 func를 호출하며 호출별 지연 측정"""
+    samples = []
+    perf_counter = time.perf_counter
+    start = perf_counter()
+    for args in args_list:
+        call_start = perf_counter()
+        func(*args)
+        samples.append(perf_counter() - call_start)
+    elapsed = perf_counter() - start
+    return samples, len(args_list) * ops_per_call, elapsed
+
+
+def bench_next_update(options):
+    instants = year_instants(options.step)
+    return run_calls(calculate_next_update_time, [(now,) for now in instants])
+
+
+def year_day_regions(year=SIMULATED_YEAR):
+    """1년의 모든 (날짜, 지역) 조합을 MICRO_REPEAT번 반복한 인자 목록"""
+    first = date(year, 1, 1)
+    days = [first + timedelta(days=offset) for offset in range(365)]
+    return [(day, region) for day in days for region in DEFAULT_CHANNELS] * MICRO_REPEAT
+
+
+def bench_off_day(options):
+    return run_calls(is_off_day, year_day_regions())
+
+
+def bench_holiday_info(options):
+    return run_calls(get_holiday_info, year_day_regions())
+
+
+def bench_availability(options):
+    instants = year_instants(options.step)
+    args = [
+        (now.astimezone(pytz.timezone(info["tz"])), region)
+        for now in instants
+        for region, info in DEFAULT_CHANNELS.items()
+    ] * MICRO_REPEAT
+    return run_calls(get_availability_status, args)
+
+
+def bench_render(options):
+    """N개 채널 전체 렌더링을 1년 동안 step 간격으로 반복 (한 번의 렌더링 = 표본 하나)"""
+    registry = synthetic_registry(options.channels)
+    items = list(registry.items())
+    instants = [now.astimezone(pytz.utc) for now in year_instants(options.step)]
+    RENDER_CACHE.clear()
+
+    def render_all(now):
+        for name, info in items:
+            render_channel_name(name, info, now)
+
+    samples, _, elapsed = run_calls(render_all, [(now,) for now in instants])
+    # 표본은 채널 하나 기준 지연으로 환산
+    samples = [sample / len(items) for sample in samples]
+    return samples, len(instants) * len(items), elapsed
+
+
+async def run_ticks(options):
+    """가짜 Discord 서버에 REST 엔진으로 연속 업데이트(틱) 실행"""
+    fake = FakeDiscord(
+        latency=options.latency / 1000,
+        ratelimit_rate=options.ratelimit_rate,
+        retry_after=options.retry_after,
+    )
+    registry = synthetic_registry(options.channels)
+    for channel_id in registry.ids():
+        fake.add_channel(channel_id)
+    api_base = await fake.start()
+    store = AppliedNameStore(":memory:")
+    health = ChannelHealth(":memory:")
+
+    # 평일 근무 시간에 10분씩 진행 - 이름 변경 제한도 시뮬레이션 시각 기준으로 계산
+    start = KST.localize(datetime(SIMULATED_YEAR, 3, 4, 9, 0)).astimezone(pytz.utc)
+    simulated = {"now": start}
+    original_clock = RENAME_BUCKETS.clock
+    RENAME_BUCKETS.clear()
+    RENAME_BUCKETS.clock = lambda: simulated["now"].timestamp()
+    original_pending_clock = PENDING_RENAMES.clock
+    PENDING_RENAMES.clear()
+    PENDING_RENAMES.clock = RENAME_BUCKETS.clock
+
+    samples = []
+    perf_counter = time.perf_counter
+    try:
+        async with RestClient("benchmark", api_base=api_base) as client:
+            started = perf_counter()
+            for tick in range(options.ticks):
+                simulated["now"] = start + timedelta(minutes=10 * tick)
+                tick_start = perf_counter()
+                await update_channel_names(
+                    client,
+                    night_mode=False,
+                    now=simulated["now"],
+                    registry=registry,
+                    store=store,
+                    health=health,
+                    # 코드 경로만 측정하도록 분산/초당 예산은 끔
+                    spread=0.0,
+                    budget=RequestBudget(None),
+                )
+                samples.append(perf_counter() - tick_start)
+            elapsed = perf_counter() - started
+    finally:
+        RENAME_BUCKETS.clock = original_clock
+        RENAME_BUCKETS.clear()
+        PENDING_RENAMES.clock = original_pending_clock
+        PENDING_RENAMES.clear()
+        store.close()
+        health.close()
+        await fake.stop()
+
+    logger.info(
+        f"[BENCH] 가짜 서버 요청 {fake.stats['requests']}회, PATCH {fake.stats['patches']}회, 429 {fake.stats['rate_limited']}회"
+    )
+    return samples, options.ticks, elapsed
+
+
+def bench_tick(options):
+    return asyncio.run(run_ticks(options))
+
+
+async def run_cold_starts(options):
+    """저장소가 빈 상태로 봇 프로세스(REST 엔진)를 띄워 첫 PATCH까지 걸린 시간 측정"""
+    samples = []
+    for _ in range(options.cold_starts):
+        fake = FakeDiscord()
+        for info in DEFAULT_CHANNELS.values():
+            fake.add_channel(info["id"])
+        api_base = await fake.start()
+
+        env = dict(
+            os.environ,
+            BOT_ENGINE="rest",
+            DISCORD_API_BASE=api_base,
+            DISCORD_BOT_TOKEN="benchmark",
+            BOT_STATE_DB=":memory:",
+        )
+        env.pop("CHANNEL_REGISTRY", None)
+        started = time.perf_counter()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-m",
+                "bot.bot",
+                cwd=PROJECT_ROOT,
+                env=env,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await process.wait()
+        finally:
+            await fake.stop()
+        if fake.first_patch_at is None:
+            raise RuntimeError(
+                f"봇 프로세스가 이름을 변경하지 않았습니다 (exit code: {process.returncode})"
+            )
+        samples.append(fake.first_patch_at - started)
+
+    return samples, len(samples), sum(samples)
+
+
+def bench_cold_start(options):
+    total, packages, _ = profile_imports("bot.bot")
+    heaviest = sorted(packages.items(), key=lambda item: -item[1])[:3]
+    logger.info(
+        f"[BENCH] bot.bot import {total / 1000:.1f}ms (상위: {', '.join(f'{name} {us / 1000:.1f}ms' for name, us in heaviest)})"
+    )
+    return asyncio.run(run_cold_starts(options))
+
+
+def bench_time_command(options):
+    """/time 응답 조회를 1년 동안 step 간격으로 반복 (분마다 지역별 MICRO_REPEAT번 호출, 첫 호출이 응답을 만듦)"""
+    answers = TimeAnswerCache(ChannelRegistry(DEFAULT_CHANNELS))
+    args = [
+        (region, now.astimezone(pytz.utc))
+        for now in year_instants(options.step)
+        for region in [None, *DEFAULT_CHANNELS] * MICRO_REPEAT
+    ]
+    return run_calls(answers.answer, args)
+
+
+def bench_plan_year(options):
+    """N개 채널의 1년치 이름 변경 계획 컴파일 (컴파일 한 번 = 표본 하나, 연산 수 = 변경 수)"""
+    registry = synthetic_registry(options.channels)
+    start = KST.localize(datetime(SIMULATED_YEAR, 1, 1))
+    end = KST.localize(datetime(SIMULATED_YEAR + 1, 1, 1))
+    started = time.perf_counter()
+    plan = compile_plan(registry, start, end)
+    elapsed = time.perf_counter() - started
+    return [elapsed], len(plan), elapsed
+
+
+BENCHMARKS = {
+    "calculate_next_update_time": bench_next_update,
+    "is_off_day": bench_off_day,
+    "get_holiday_info": bench_holiday_info,
+    "get_availability_status": bench_availability,
+    "render_year": bench_render,
+    "time_command": bench_time_command,
+    "plan_year": bench_plan_year,
+    "tick_e2e": bench_tick,
+    "cold_start": bench_cold_start,
+}
+
+
+def run_benchmark(name, options):
+    """시간 측정 후 같은 작업을 tracemalloc으로 한 번 더 실행해 최대 메모리 측정"""
+    samples, operations, elapsed = BENCHMARKS[name](options)
+
+    peak = 0
+    if options.memory:
+        tracemalloc.start()
+        try:
+            BENCHMARKS[name](options)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return measure(samples, operations, elapsed, peak)
+
+
+def compare(results, baseline, tolerance):
+    """기준 결과와 비교해 회귀한 벤치마크 이름 목록 반환"""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        slower = result["ops_per_sec"] < reference["ops_per_sec"] * (1 - tolerance)
+        p99_worse = result["p99_us"] > reference["p99_us"] * (1 + tolerance)
+        change = (result["ops_per_sec"] / reference["ops_per_sec"] - 1) * 100
+        status = "REGRESSION" if slower or p99_worse else "OK"
+        logger.info(
+            f"[BASELINE] {name}: ops/sec {change:+.1f}%, p99 {reference['p99_us']:.1f} -> {result['p99_us']:.1f}us [{status}]"
+        )
+        if status != "OK":
+            regressions.append(name)
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m bot.benchmark",
+        description="스케줄 계산/렌더링/업데이트 경로 벤치마크",
+    )
+    parser.add_argument(
+        "names", nargs="*", help=f"실행할 벤치마크 ({', '.join(BENCHMARKS)})"
+    )
+    parser.add_argument("--channels", type=int, default=100, help="채널 수")
+    parser.add_argument(
+        "--step", type=int, default=120, help="1년 시뮬레이션 간격 (분)"
+    )
+    parser.add_argument("--ticks", type=int, default=10, help="가짜 서버 틱 수")
+    parser.add_argument(
+        "--latency", type=float, default=20.0, help="가짜 서버 응답 지연 (ms)"
+    )
+    parser.add_argument(
+        "--ratelimit-rate", type=float, default=0.05, help="429 응답 비율"
+    )
+    parser.add_argument(
+        "--retry-after", type=float, default=0.05, help="429 retry_after (초)"
+    )
+    parser.add_argument(
+        "--cold-starts", type=int, default=5, help="콜드 스타트 측정 횟수"
+    )
+    parser.add_argument(
+        "--startup-budget",
+        type=float,
+        default=float(os.getenv("STARTUP_BUDGET_MS", DEFAULT_STARTUP_BUDGET_MS)),
+        help="첫 이름 변경까지 허용 시간 (ms, p50 기준)",
+    )
+    parser.add_argument(
+        "--no-memory", dest="memory", action="store_false", help="최대 메모리 측정 생략"
+    )
+    parser.add_argument(
+        "--baseline", default=os.getenv("BENCHMARK_BASELINE", DEFAULT_BASELINE_PATH)
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="이번 결과를 기준으로 저장"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE, help="회귀 판단 허용 비율"
+    )
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """벤치마크 실행: python -m bot.benchmark [이름 ...] [옵션]"""
+    options = parse_args(argv)
+    names = options.names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        logger.error(f"[ERROR] 알 수 없는 벤치마크입니다: {', '.join(unknown)}")
+        return 2
+
+    # 채널별 로그가 측정을 방해하지 않도록 경고 이상만 출력
+    for logger_name in ("discord_updater", "discord_rest", "discord_state"):
+        logging.getLogger(logger_name).setLevel(logging.WARNING)
+
+    results = {}
+    for name in names:
+        result = run_benchmark(name, options)
+        results[name] = result
+        logger.info(
+            f"[BENCH] {name}: {result['ops_per_sec']:,.0f} ops/sec, p50 {result['p50_us']:.1f}us, p99 {result['p99_us']:.1f}us, 최대 메모리 {result['peak_kib']:,.0f}KiB ({result['operations']:,}회)"
+        )
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    # 첫 이름 변경까지의 시간은 기준 결과와 별개로 고정 예산과 비교
+    over_budget = False
+    if "cold_start" in results:
+        startup_ms = results["cold_start"]["p50_us"] / 1000
+        over_budget = startup_ms > options.startup_budget
+        logger.info(
+            f"[BUDGET] 첫 이름 변경까지 p50 {startup_ms:.0f}ms / 예산 {options.startup_budget:.0f}ms [{'OVER' if over_budget else 'OK'}]"
+        )
+
+    if options.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(options.baseline)), exist_ok=True)
+        baseline = {}
+        if os.path.exists(options.baseline):
+            with open(options.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(options.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+        logger.info(f"[BASELINE] 기준 결과 저장: {options.baseline}")
+        return 1 if over_budget else 0
+
+    if not os.path.exists(options.baseline):
+        logger.info("[BASELINE] 저장된 기준 결과가 없습니다 (--save-baseline으로 저장)")
+        return 1 if over_budget else 0
+
+    with open(options.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, options.tolerance)
+    if regressions:
+        logger.warning(f"[BASELINE] 성능 회귀: {', '.join(regressions)}")
+        return 1
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
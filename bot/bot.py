@@ -1,48 +1,128 @@
-import discord
+import asyncio
+import os
 import sys
 
 try:
-    from .utils import setup_logging, check_discord_token
-    from .updater import update_channel_names
+    from .utils import setup_logging, check_discord_token, lazy_import
+    from .updater import (
+        all_names_current,
+        drain_pending_renames,
+        get_channel_ids,
+        reconcile_channels,
+        update_channel_names,
+    )
+    from .footprint import prune_channel_cache, report_memory
+    from .session import create_resumable_client
+    from .rest import RestClient
+    from .state import get_state_store
+    from .registry import get_registry
+    from .metrics import emit_snapshot
 except ImportError:
     # 직접 실행될 때를 위한 대체 import
-    from utils import setup_logging, check_discord_token
-    from updater import update_channel_names
+    from utils import setup_logging, check_discord_token, lazy_import
+    from updater import (
+        all_names_current,
+        drain_pending_renames,
+        get_channel_ids,
+        reconcile_channels,
+        update_channel_names,
+    )
+    from footprint import prune_channel_cache, report_memory
+    from session import create_resumable_client
+    from rest import RestClient
+    from state import get_state_store
+    from registry import get_registry
+    from metrics import emit_snapshot
 
 # 로깅 설정
 logger = setup_logging("discord_timezone_bot")
 
+# 연결이 필요한 경우에만 로드
+discord = lazy_import("discord")
+
 try:
     TOKEN = check_discord_token()
 except ValueError as e:
     logger.error(f"[ERROR] {e}")
     sys.exit(1)
 
-intents = discord.Intents.default()
-client = discord.Client(intents=intents)
 
+def get_channel_keys():
+    """스케줄러(main.py)가 BOT_CHANNELS로 넘긴 이번 실행 대상 채널 키 (미지정 시 전체)
+
+    야간 여부는 채널마다 현지 시각으로 판단하므로 전체 야간 모드 플래그는 없습니다.
+    """
+    value = os.getenv("BOT_CHANNELS")
+    if not value:
+        return None
+    registry = get_registry()
+    return [key for key in value.split(",") if key in registry]
+
+
+def create_client():
+    """한 번 로그인해 채널 이름을 변경하고 종료하는 게이트웨이 클라이언트 생성
+
+    discord 모듈은 이 함수에서 처음 로드되므로, 모든 채널이 최신이라 연결을 생략하는
+    실행은 discord/aiohttp import 비용을 내지 않습니다.
+    """
+    # BOT_LOW_MEMORY=true면 사용하지 않는 인텐트와 캐시를 끈 클라이언트 사용
+    # 직전 실행이 저장한 세션이 있으면 RESUME으로 이어받아 IDENTIFY와 서버 목록 수신을 생략
+    client = create_resumable_client()
+
+    @client.event
+    async def on_ready():
+        logger.info(f"[LOGIN] 봇이 {client.user}로 로그인했습니다")
+        logger.info(f"[CONNECT] {len(client.guilds)}개 서버에 연결되었습니다")
+
+        # 게이트웨이 캐시의 실제 이름으로 저장소 대조 후 채널 업데이트 실행
+        prune_channel_cache(client, get_channel_ids())
+        await reconcile_channels(client)
+        await update_channel_names(client, channels=get_channel_keys())
+        await drain_pending_renames(client)
+        report_memory("게이트웨이 엔진 작업 완료")
+        emit_snapshot()
 
-@client.event
-async def on_ready():
-    logger.info(f"[LOGIN] 봇이 {client.user}로 로그인했습니다")
-    logger.info(f"[CONNECT] {len(client.guilds)}개 서버에 연결되었습니다")
+        logger.info("[DONE] 봇 작업 완료, 연결을 종료합니다")
+        await client.close()
 
-    # 채널 업데이트 실행
-    await update_channel_names(client)
+    @client.event
+    async def on_error(event, *args, **kwargs):
+        logger.error(f"[ERROR] Discord 이벤트 오류 발생: {event}", exc_info=True)
 
-    logger.info("[DONE] 봇 작업 완료, 연결을 종료합니다")
-    await client.close()
+    return client
 
 
-@client.event
-async def on_error(event, *args, **kwargs):
-    logger.error(f"[ERROR] Discord 이벤트 오류 발생: {event}", exc_info=True)
+async def run_rest_once():
+    """게이트웨이 연결 없이 REST API만으로 채널 이름 업데이트"""
+    async with RestClient(TOKEN) as rest_client:
+        # 대조 주기가 된 경우에만 모든 채널을 조회하고, 그 외에는 저장소 기준으로 바로 PATCH
+        if get_state_store().reconcile_due():
+            await reconcile_channels(rest_client)
+        await update_channel_names(rest_client, channels=get_channel_keys())
+        await drain_pending_renames(rest_client)
+    report_memory("REST 엔진 작업 완료")
+    emit_snapshot()
+    logger.info("[DONE] REST 엔진 작업 완료")
 
 
 if __name__ == "__main__":
     try:
         logger.info("[INIT] Discord 타임존 봇을 시작합니다...")
-        client.run(TOKEN)
+        # 모든 채널이 이미 최신이고 대조 주기 전이면 연결하지 않고 종료
+        if not get_state_store().reconcile_due() and all_names_current(
+            channels=get_channel_keys()
+        ):
+            logger.info(
+                "[SKIP] 모든 채널 이름이 마지막 적용 값과 같아 연결을 생략합니다"
+            )
+            sys.exit(0)
+        if os.getenv("BOT_ENGINE", "gateway").lower() == "rest":
+            asyncio.run(run_rest_once())
+        else:
+            create_client().run(TOKEN)
+    except SystemExit:
+        # 연결 생략 종료 - 아래 except 절을 평가하면 discord 모듈이 로드되므로 먼저 처리
+        raise
     except discord.LoginFailure:
         logger.error("[LOGINF] Discord 토큰이 잘못되었습니다")
         sys.exit(1)
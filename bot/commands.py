@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+
+import pytz
+
+try:
+    from .utils import lazy_import, setup_logging
+    from .metrics import TIME_COMMANDS
+    from .profiles import STATUS_EMOJIS
+    from .registry import get_registry
+    from .state import get_state_store
+    from .updater import get_availability_status, get_holiday_info, is_night_time
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import lazy_import, setup_logging
+    from metrics import TIME_COMMANDS
+    from profiles import STATUS_EMOJIS
+    from registry import get_registry
+    from state import get_state_store
+    from updater import get_availability_status, get_holiday_info, is_night_time
+
+# 로깅 설정
+logger = setup_logging("discord_commands")
+
+# 명령 트리를 만들 때만 로드
+discord = lazy_import("discord")
+
+# 근무 상태 이모지별 설명 (profiles.STATUS_EMOJIS 순서)
+STATUS_LABELS = dict(zip(STATUS_EMOJIS, ("업무 시간 외", "업무 중", "점심 시간")))
+
+# 요일 표시 (월요일부터)
+WEEKDAYS = "월화수목금토일"
+
+# 자동 완성으로 보여 줄 최대 지역 수 (Discord 제한)
+MAX_CHOICES = 25
+
+# 런타임 스냅샷 키 (마지막으로 동기화한 명령 정의)
+COMMANDS_SNAPSHOT = "app_commands"
+
+
+def is_time_command_enabled():
+    """/time 명령 사용 여부 (TIME_COMMAND=false로 끔)"""
+    return os.getenv("TIME_COMMAND", "true").lower() == "true"
+
+
+def region_answer(record, now):
+    """지역 하나의 현재 시각/공휴일/근무 상태 응답 (채널 이름과 같은 지역 데이터 사용)"""
+    local_now = now.astimezone(pytz.timezone(record["tz"]))
+    holiday_name, holiday_emoji = get_holiday_info(local_now.date(), record["calendar"])
+    if holiday_name:
+        status = f"{holiday_emoji} {holiday_name} (휴무)"
+    else:
+        emoji = get_availability_status(local_now, record["profile"])
+        status = f"{emoji} {STATUS_LABELS[emoji]}"
+    if is_night_time(now, record):
+        status += " · 🌙 야간"
+    offset = local_now.strftime("%z")
+    return (
+        f"{record['emoji']} **{record['name']}** {local_now:%Y-%m-%d %H:%M} "
+        f"({WEEKDAYS[local_now.weekday()]}, UTC{offset[:3]}:{offset[3:]}) · {status}"
+    )
+
+
+class TimeAnswerCache:
+    """/time 응답을 분 단위로 미리 만들어 두는 캐시
+
+    분이 바뀐 뒤 첫 요청에서 레지스트리의 모든 지역 응답을 한 번에 만들고, 같은 분의 나머지 요청은
+    시간대/공휴일/근무 상태를 다시 조회하지 않고 만들어 둔 문자열을 반환합니다. 지역은 채널의
+    region 값 기준이며, 같은 지역의 채널이 여러 개면 처음 등록된 채널의 설정을 사용합니다.
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry
+        self.minute = None
+        # {지역 키: (표시 이름, 응답)}
+        self.regions = {}
+        # {소문자 별칭(지역 키, 채널 키, 채널 이름): 지역 키}
+        self.aliases = {}
+        self.overview = ""
+
+    def refresh(self, now=None):
+        """현재 분의 응답이 없으면 모든 지역 응답을 새로 만들고, 새로 만들었는지 반환"""
+        if now is None:
+            now = datetime.now(pytz.utc)
+        minute = int(now.timestamp()) // 60
+        if minute == self.minute:
+            return False
+
+        registry = self.registry or get_registry()
+        regions = {}
+        aliases = {}
+        for key, record in registry.items():
+            region = record["region"]
+            if region not in regions:
+                regions[region] = (record["name"], region_answer(record, now))
+            for alias in (region, key, record["name"]):
+                aliases.setdefault(str(alias).lower(), region)
+        self.regions = regions
+        self.aliases = aliases
+        self.overview = "\n".join(answer for _, answer in regions.values())
+        self.minute = minute
+        return True
+
+    def answer(self, query=None, now=None):
+        """지역(키/채널 이름, 없으면 전체)의 현재 응답 - 알 수 없는 지역이면 None"""
+        TIME_COMMANDS.inc("miss" if self.refresh(now) else "hit")
+        if not query:
+            return self.overview
+        region = self.aliases.get(query.strip().lower())
+        if region is None:
+            return None
+        return self.regions[region][1]
+
+    def choices(self, current="", now=None):
+        """입력 중인 문자열과 맞는 (표시 이름, 지역 키) 목록 (자동 완성용)"""
+        self.refresh(now)
+        current = current.strip().lower()
+        return [
+            (f"{name} ({region})", region)
+            for region, (name, _) in self.regions.items()
+            if current in region.lower() or current in name.lower()
+        ][:MAX_CHOICES]
+
+    def clear(self):
+        """설정 변경 후 다음 요청에서 응답을 다시 만들도록 무효화"""
+        self.minute = None
+
+
+# 프로세스 전체에서 공유하는 /time 응답 캐시
+TIME_ANSWERS = TimeAnswerCache()
+
+
+def create_command_tree(client, answers=None):
+    """/time 명령을 등록한 명령 트리 생성 (응답은 answers 캐시에서 조회)"""
+    if answers is None:
+        answers = TIME_ANSWERS
+    app_commands = discord.app_commands
+    tree = app_commands.CommandTree(client)
+
+    async def complete_region(interaction, current):
+        return [
+            app_commands.Choice(name=name, value=value)
+            for name, value in answers.choices(current)
+        ]
+
+    @tree.command(name="time", description="지역별 현재 시각과 공휴일/근무 상태")
+    @app_commands.describe(region="지역 (비우면 전체 지역)")
+    @app_commands.autocomplete(region=complete_region)
+    async def time_command(interaction, region: str = None):
+        answer = answers.answer(region)
+        if answer is None:
+            known = ", ".join(name for name, _ in answers.regions.values())
+            answer = f"알 수 없는 지역입니다: {region} (사용 가능: {known})"
+        await interaction.response.send_message(answer, ephemeral=True)
+
+    return tree
+
+
+def commands_digest(tree):
+    """명령 트리 정의의 해시 (동기화가 필요한지 판단용)"""
+    payload = [command.to_dict(tree) for command in tree.get_commands()]
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False).encode()
+    ).hexdigest()
+
+
+async def sync_commands(tree, store=None):
+    """명령 정의가 마지막으로 동기화한 정의와 다를 때만 Discord에 등록 (전역 명령 갱신 횟수 절약)"""
+    if store is None:
+        store = get_state_store()
+    synced = {
+        "application_id": tree.client.application_id,
+        "digest": commands_digest(tree),
+    }
+    if store.load_snapshot(COMMANDS_SNAPSHOT) == synced:
+        return False
+    commands = await tree.sync()
+    store.save_snapshot(COMMANDS_SNAPSHOT, synced)
+    logger.info(
+        f"[COMMANDS] 애플리케이션 명령 {len(commands)}개를 동기화했습니다: "
+        f"{', '.join('/' + command.name for command in commands)}"
+    )
+    return True
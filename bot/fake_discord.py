@@ -0,0 +1,584 @@
+import asyncio
+import json
+import random
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+from aiohttp import WSMsgType, web
+
+try:
+    from .utils import setup_logging
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+
+# 로깅 설정
+logger = setup_logging("discord_fake")
+
+# 가짜 서버가 만드는 채널의 기본 타입 (음성 채널)
+DEFAULT_CHANNEL_TYPE = 2
+
+# guild_id 없이 추가한 채널이 속하는 서버와 가짜 봇/애플리케이션 ID
+DEFAULT_GUILD_ID = 1 << 22
+FAKE_BOT_ID = 900000000000000001
+FAKE_APPLICATION_ID = 900000000000000002
+
+# Discord 채널 이름 변경 제한 (채널당 10분에 2회)
+DEFAULT_ROUTE_LIMIT = (2, 600.0)
+
+# 게이트웨이 하트비트 간격 (ms)
+HEARTBEAT_INTERVAL_MS = 41250
+
+# 연결이 끊긴 세션이 RESUME 때 다시 보내려고 보관하는 최근 이벤트 수
+SESSION_REPLAY_SIZE = 1000
+
+# 세션을 끝내는 정상 종료 코드 (그 외 코드로 닫힌 세션은 RESUME 가능)
+SESSION_END_CODES = (1000, 1001)
+
+# 가짜 상호작용을 보내는 사용자 ID
+FAKE_INVOKER_ID = 900000000000000003
+
+# 상호작용 타입 (슬래시 명령, 자동 완성)과 문자열 명령 옵션 타입
+INTERACTION_COMMAND = 2
+INTERACTION_AUTOCOMPLETE = 4
+OPTION_STRING = 3
+
+FAKE_USER = {
+    "id": str(FAKE_BOT_ID),
+    "username": "fake-timezone-bot",
+    "discriminator": "0000",
+    "global_name": None,
+    "avatar": None,
+    "bot": True,
+    "flags": 0,
+}
+
+
+def json_response(data, status=200, headers=None):
+    """charset 없는 application/json 응답 (discord.py는 Content-Type을 정확히 비교함)"""
+    return web.Response(
+        body=json.dumps(data).encode(),
+        status=status,
+        headers={**(headers or {}), "Content-Type": "application/json"},
+    )
+
+
+class FakeDiscord:
+    """벤치마크/부하 테스트용 가짜 Discord 서버 (REST + 최소 게이트웨이)
+
+    REST는 GET/PATCH /channels/{id}와 discord.py 로그인에 필요한 경로를 제공하고,
+    게이트웨이(/gateway)는 HELLO/READY/GUILD_CREATE/CHANNEL_UPDATE와 하트비트, RESUME만 처리합니다.
+    1000/1001 외의 코드로 닫힌 세션은 RESUME하면 놓친 이벤트를 다시 보낸 뒤 RESUMED로 응답하고,
+    알 수 없거나 끝난 세션에는 INVALID_SESSION으로 응답합니다. 전역 애플리케이션 명령 등록(PUT)과
+    상호작용 응답 경로도 제공하며, invoke_command로 슬래시 명령 호출(INTERACTION_CREATE)을 보냅니다.
+
+    - latency(초)를 중앙값으로 latency_sigma만큼 퍼진 로그정규 분포로 응답을 늦춤
+    - ratelimit_rate 비율의 요청에 retry_after를 담은 429를 무작위로 돌려줌
+    - cloudflare_rate 비율의 요청에 JSON 본문 없이 Retry-After 헤더만 있는 429(HTML)를 돌려줌
+    - route_limit=(횟수, 초): 채널별 PATCH 제한 (clock 기준, 시뮬레이션 시계 사용 가능)
+    - global_limit: 초당 전체 요청 수 제한 (clock 기준, global 429)
+    - error_rate 비율의 요청과 add_outage로 지정한 구간(clock 기준)의 요청에 5xx 응답
+    - 쓰기 권한이 없는 채널(writable=False)의 PATCH에는 403 응답
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        ratelimit_rate=0.0,
+        retry_after=0.05,
+        seed=0,
+        latency_sigma=0.0,
+        error_rate=0.0,
+        route_limit=None,
+        global_limit=None,
+        clock=None,
+        cloudflare_rate=0.0,
+    ):
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.ratelimit_rate = ratelimit_rate
+        self.cloudflare_rate = cloudflare_rate
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.route_limit = route_limit
+        self.global_limit = global_limit
+        self.clock = clock or time.monotonic
+        self.channels = {}
+        self.stats = {
+            "requests": 0,
+            "patches": 0,
+            "rate_limited": 0,
+            "route_limited": 0,
+            "global_limited": 0,
+            "server_errors": 0,
+            "forbidden": 0,
+            "identifies": 0,
+            "resumes": 0,
+            "invalid_sessions": 0,
+            "command_syncs": 0,
+            "interactions": 0,
+        }
+        # 첫 PATCH를 받은 시각 (time.perf_counter 기준, 콜드 스타트 측정용)
+        self.first_patch_at = None
+        # PATCH 성공 시 호출 (채널 ID, 새 이름) - 부하 테스트의 지연 측정용
+        self.on_patch = None
+        self._random = random.Random(seed)
+        self._runner = None
+        self._base = None
+        self._outages = []
+        # {채널 ID: [PATCH 시각]} (route_limit 창 안의 시각만 보관)
+        self._route_hits = {}
+        self._global_window = (0, 0)
+        # {웹소켓: 세션}, {세션 ID: 세션} - 연결이 끊겨도 RESUME할 수 있도록 세션은 따로 보관
+        self._sockets = {}
+        self._sessions = {}
+        # 등록된 애플리케이션 명령 {이름: 명령}, 응답을 기다리는 상호작용 {ID: Future}
+        self.commands = {}
+        self._interactions = {}
+
+        self.app = web.Application()
+        self.app.router.add_get("/channels/{channel_id}", self.get_channel)
+        self.app.router.add_patch("/channels/{channel_id}", self.patch_channel)
+        self.app.router.add_get("/users/@me", self.get_user)
+        self.app.router.add_get("/oauth2/applications/@me", self.get_application)
+        self.app.router.add_put(
+            "/applications/{application_id}/commands", self.put_commands
+        )
+        self.app.router.add_post(
+            "/interactions/{interaction_id}/{token}/callback", self.interaction_callback
+        )
+        self.app.router.add_get("/gateway", self.get_gateway_url)
+        self.app.router.add_get("/gateway/bot", self.get_gateway_url)
+        self.app.router.add_get("/ws", self.gateway)
+
+    def add_channel(
+        self,
+        channel_id,
+        name="",
+        channel_type=DEFAULT_CHANNEL_TYPE,
+        guild_id=None,
+        writable=True,
+    ):
+        self.channels[int(channel_id)] = {
+            "id": str(channel_id),
+            "name": name,
+            "type": channel_type,
+            "guild_id": str(guild_id or DEFAULT_GUILD_ID),
+            "position": len(self.channels),
+            "permission_overwrites": [],
+            "parent_id": None,
+            "nsfw": False,
+            "bitrate": 64000,
+            "user_limit": 0,
+            "rtc_region": None,
+            "_writable": writable,
+        }
+
+    def set_writable(self, channel_id, writable):
+        """채널 수정 권한 변경 (권한 회수/복구 시뮬레이션)"""
+        self.channels[int(channel_id)]["_writable"] = writable
+
+    def add_outage(self, start, end):
+        """clock 기준 [start, end) 구간의 모든 요청에 503 응답"""
+        self._outages.append((start, end))
+
+    def channel_name(self, channel_id):
+        return self.channels[int(channel_id)]["name"]
+
+    async def start(self, host="127.0.0.1", port=0):
+        """서버 시작 후 API 기본 주소 반환 (port=0이면 빈 포트 사용)"""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self._base = f"{host}:{port}"
+        return f"http://{self._base}"
+
+    @property
+    def gateway_url(self):
+        return f"ws://{self._base}/ws"
+
+    async def stop(self):
+        for ws in list(self._sockets):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _sample_latency(self):
+        if not self.latency:
+            return 0.0
+        if not self.latency_sigma:
+            return self.latency
+        return self.latency * self._random.lognormvariate(0.0, self.latency_sigma)
+
+    def _global_limited(self):
+        """초당 전체 요청 수 제한 초과 시 다음 초까지 남은 시간, 아니면 None"""
+        if not self.global_limit:
+            return None
+        now = self.clock()
+        second, count = self._global_window
+        if int(now) != second:
+            second, count = int(now), 0
+        count += 1
+        self._global_window = (second, count)
+        if count > self.global_limit:
+            return max(second + 1 - now, 0.001)
+        return None
+
+    def _rate_limited(self, retry_after, is_global=False):
+        return json_response(
+            {
+                "message": "You are being rate limited.",
+                "retry_after": round(retry_after, 3),
+                "global": is_global,
+            },
+            status=429,
+            headers={
+                "Retry-After": str(retry_after),
+                "X-RateLimit-Scope": "global" if is_global else "user",
+                "X-RateLimit-Global": "true" if is_global else "false",
+                # discord.py는 Via 헤더가 없는 429를 Cloudflare 차단으로 보고 재시도하지 않음
+                "Via": "1.1 google",
+            },
+        )
+
+    async def _begin(self, request):
+        """공통 처리: 지연, 429/5xx 주입, 채널 조회 - 응답을 바로 돌려줘야 하면 Response 반환"""
+        self.stats["requests"] += 1
+        latency = self._sample_latency()
+        if latency:
+            await asyncio.sleep(latency)
+
+        retry_after = self._global_limited()
+        if retry_after is not None:
+            self.stats["rate_limited"] += 1
+            self.stats["global_limited"] += 1
+            return self._rate_limited(retry_after, is_global=True)
+
+        if self.ratelimit_rate and self._random.random() < self.ratelimit_rate:
+            self.stats["rate_limited"] += 1
+            return self._rate_limited(self.retry_after)
+
+        if self.cloudflare_rate and self._random.random() < self.cloudflare_rate:
+            self.stats["rate_limited"] += 1
+            return web.Response(
+                text="<html><body>error code: 1015</body></html>",
+                status=429,
+                content_type="text/html",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+
+        now = self.clock()
+        if any(start <= now < end for start, end in self._outages) or (
+            self.error_rate and self._random.random() < self.error_rate
+        ):
+            self.stats["server_errors"] += 1
+            return json_response(
+                {"message": "Service Unavailable", "code": 0}, status=503
+            )
+
+        channel = self.channels.get(int(request.match_info["channel_id"]))
+        if channel is None:
+            return json_response(
+                {"message": "Unknown Channel", "code": 10003}, status=404
+            )
+        return channel
+
+    @staticmethod
+    def _public(channel):
+        return {key: value for key, value in channel.items() if not key.startswith("_")}
+
+    async def get_channel(self, request):
+        channel = await self._begin(request)
+        if isinstance(channel, web.Response):
+            return channel
+        return json_response(self._public(channel))
+
+    async def patch_channel(self, request):
+        channel = await self._begin(request)
+        if isinstance(channel, web.Response):
+            return channel
+        if not channel["_writable"]:
+            self.stats["forbidden"] += 1
+            return json_response(
+                {"message": "Missing Permissions", "code": 50013}, status=403
+            )
+
+        channel_id = int(channel["id"])
+        if self.route_limit:
+            limit, window = self.route_limit
+            now = self.clock()
+            hits = [t for t in self._route_hits.get(channel_id, ()) if t > now - window]
+            if len(hits) >= limit:
+                self._route_hits[channel_id] = hits
+                self.stats["rate_limited"] += 1
+                self.stats["route_limited"] += 1
+                return self._rate_limited(hits[0] + window - now)
+            hits.append(now)
+            self._route_hits[channel_id] = hits
+
+        body = await request.json()
+        self.stats["patches"] += 1
+        if self.first_patch_at is None:
+            self.first_patch_at = time.perf_counter()
+        channel["name"] = body.get("name", channel["name"])
+        if self.on_patch is not None:
+            self.on_patch(channel_id, channel["name"])
+        payload = self._public(channel)
+        await self._dispatch("CHANNEL_UPDATE", payload, int(channel["guild_id"]))
+        return json_response(payload)
+
+    async def get_user(self, request):
+        return json_response(FAKE_USER)
+
+    async def get_application(self, request):
+        return json_response(
+            {
+                "id": str(FAKE_APPLICATION_ID),
+                "name": "fake-timezone-bot",
+                "icon": None,
+                "description": "",
+                "summary": "",
+                "bot_public": True,
+                "bot_require_code_grant": False,
+                "verify_key": "",
+                "flags": 0,
+                "owner": FAKE_USER,
+                "team": None,
+            }
+        )
+
+    async def put_commands(self, request):
+        """전역 애플리케이션 명령 일괄 등록 (기존 명령은 모두 교체)"""
+        self.stats["command_syncs"] += 1
+        commands = {}
+        for index, command in enumerate(await request.json(), start=1):
+            commands[command["name"]] = dict(
+                command,
+                id=str(FAKE_APPLICATION_ID + index),
+                application_id=str(FAKE_APPLICATION_ID),
+                type=command.get("type", 1),
+                version="1",
+            )
+        self.commands = commands
+        return json_response(list(commands.values()))
+
+    async def interaction_callback(self, request):
+        """상호작용 응답 - invoke_command가 기다리는 본문으로 전달"""
+        interaction_id = request.match_info["interaction_id"]
+        future = self._interactions.get(interaction_id)
+        if future is None or future.done():
+            return json_response(
+                {"message": "Unknown interaction", "code": 10062}, status=404
+            )
+        future.set_result(await request.json())
+        return json_response({"interaction": {"id": interaction_id, "type": 2}})
+
+    async def invoke_command(
+        self, name, options=None, guild_id=None, autocomplete=False, timeout=5.0
+    ):
+        """등록된 명령 name을 호출하는 INTERACTION_CREATE를 보내고 봇의 응답 본문 반환
+
+        options는 {옵션 이름: 문자열 값}이며, autocomplete=True면 첫 옵션을 입력 중인 자동 완성 요청을 보냅니다.
+        """
+        command = self.commands[name]
+        guild_id = guild_id or DEFAULT_GUILD_ID
+        self.stats["interactions"] += 1
+        interaction_id = str(FAKE_INVOKER_ID + self.stats["interactions"])
+        data = {
+            "id": command["id"],
+            "name": name,
+            "type": command["type"],
+            "options": [
+                dict(
+                    {"name": key, "type": OPTION_STRING, "value": value},
+                    **({"focused": True} if autocomplete and index == 0 else {}),
+                )
+                for index, (key, value) in enumerate((options or {}).items())
+            ],
+        }
+        payload = {
+            "id": interaction_id,
+            "application_id": str(FAKE_APPLICATION_ID),
+            "type": INTERACTION_AUTOCOMPLETE if autocomplete else INTERACTION_COMMAND,
+            "token": f"fake-interaction-{interaction_id}",
+            "version": 1,
+            "guild_id": str(guild_id),
+            "data": data,
+            "member": {
+                "user": dict(
+                    FAKE_USER, id=str(FAKE_INVOKER_ID), username="fake-user", bot=False
+                ),
+                "roles": [],
+                "joined_at": datetime.now(timezone.utc).isoformat(),
+                "deaf": False,
+                "mute": False,
+                "flags": 0,
+                "permissions": "0",
+            },
+            "app_permissions": "0",
+            "attachment_size_limit": 8388608,
+            "locale": "ko",
+            "entitlements": [],
+        }
+        future = asyncio.get_running_loop().create_future()
+        self._interactions[interaction_id] = future
+        try:
+            await self._dispatch("INTERACTION_CREATE", payload, guild_id)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._interactions.pop(interaction_id, None)
+
+    async def get_gateway_url(self, request):
+        return json_response(
+            {
+                "url": self.gateway_url,
+                "shards": 1,
+                "session_start_limit": {
+                    "total": 1000,
+                    "remaining": 1000,
+                    "reset_after": 0,
+                    "max_concurrency": 16,
+                },
+            }
+        )
+
+    def _guilds(self, shard=None):
+        """서버별 채널 목록 (shard=[번호, 수] 지정 시 해당 샤드의 서버만)"""
+        guilds = {}
+        for channel in self.channels.values():
+            guild_id = int(channel["guild_id"])
+            if shard and (guild_id >> 22) % shard[1] != shard[0]:
+                continue
+            guilds.setdefault(guild_id, []).append(self._public(channel))
+        return guilds
+
+    async def _dispatch(self, event, data, guild_id):
+        """guild_id를 맡은 게이트웨이 세션에 이벤트 전송 (연결이 끊긴 세션은 RESUME 때 보내도록 보관)"""
+        for session in list(self._sessions.values()):
+            shard = session["shard"]
+            if shard and (guild_id >> 22) % shard[1] != shard[0]:
+                continue
+            await self._send_event(session, event, data)
+
+    async def _send_event(self, session, event, data):
+        session["seq"] += 1
+        payload = {"op": 0, "t": event, "s": session["seq"], "d": data}
+        session["replay"].append(payload)
+        ws = session["ws"]
+        if ws is None:
+            return
+        try:
+            await ws.send_json(payload)
+        except ConnectionError:
+            self._sockets.pop(ws, None)
+            session["ws"] = None
+
+    async def gateway(self, request):
+        """최소 게이트웨이: HELLO 후 IDENTIFY에 READY와 GUILD_CREATE, RESUME에 놓친 이벤트와 RESUMED로 응답"""
+        ws = web.WebSocketResponse(heartbeat=None)
+        await ws.prepare(request)
+        await ws.send_json({"op": 10, "d": {"heartbeat_interval": HEARTBEAT_INTERVAL_MS}})
+        session = None
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                payload = json.loads(message.data)
+                if payload["op"] == 1:
+                    await ws.send_json({"op": 11})
+                elif payload["op"] == 2:
+                    session = await self._identify(ws, payload["d"].get("shard"))
+                elif payload["op"] == 6:
+                    session = await self._resume(ws, payload["d"])
+        finally:
+            self._sockets.pop(ws, None)
+            if session is not None and session["ws"] is ws:
+                session["ws"] = None
+                if ws.close_code in SESSION_END_CODES:
+                    self._sessions.pop(session["id"], None)
+        return ws
+
+    async def _resume(self, ws, data):
+        """세션 RESUME - 놓친 이벤트를 다시 보내고 RESUMED, 이어받을 수 없으면 INVALID_SESSION"""
+        session = self._sessions.get(data.get("session_id"))
+        if session is None or session["ws"] is not None:
+            self.stats["invalid_sessions"] += 1
+            await ws.send_json({"op": 9, "d": False})
+            return None
+        self.stats["resumes"] += 1
+        session["ws"] = ws
+        self._sockets[ws] = session
+        seq = data.get("seq") or 0
+        for payload in list(session["replay"]):
+            if payload["s"] > seq:
+                await ws.send_json(payload)
+        await self._send_event(session, "RESUMED", {})
+        return session
+
+    async def _identify(self, ws, shard):
+        self.stats["identifies"] += 1
+        session = {
+            "id": f"fake-session-{self.stats['identifies']}",
+            "seq": 0,
+            "shard": shard,
+            "ws": ws,
+            "replay": deque(maxlen=SESSION_REPLAY_SIZE),
+        }
+        self._sessions[session["id"]] = session
+        self._sockets[ws] = session
+        guilds = self._guilds(shard)
+        ready = {
+            "v": 10,
+            "user": FAKE_USER,
+            "guilds": [{"id": str(guild_id), "unavailable": True} for guild_id in guilds],
+            "session_id": session["id"],
+            "resume_gateway_url": self.gateway_url,
+            "application": {"id": str(FAKE_APPLICATION_ID), "flags": 0},
+        }
+        if shard:
+            ready["shard"] = shard
+        joined_at = datetime.now(timezone.utc).isoformat()
+        events = [("READY", ready)] + [
+            (
+                "GUILD_CREATE",
+                {
+                    "id": str(guild_id),
+                    "name": f"fake guild {guild_id}",
+                    "owner_id": str(FAKE_BOT_ID),
+                    "joined_at": joined_at,
+                    "channels": channels,
+                    "roles": [
+                        {
+                            "id": str(guild_id),
+                            "name": "@everyone",
+                            "permissions": "0",
+                            "position": 0,
+                            "color": 0,
+                            "hoist": False,
+                            "managed": False,
+                            "mentionable": False,
+                        }
+                    ],
+                    "members": [],
+                    "member_count": 1,
+                    "emojis": [],
+                    "stickers": [],
+                    "features": [],
+                    "threads": [],
+                    "voice_states": [],
+                    "presences": [],
+                    "stage_instances": [],
+                    "guild_scheduled_events": [],
+                    "large": False,
+                    "unavailable": False,
+                },
+            )
+            for guild_id, channels in guilds.items()
+        ]
+        for event, data in events:
+            await self._send_event(session, event, data)
+        return session
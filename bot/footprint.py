@@ -0,0 +1,129 @@
+import gc
+import os
+
+try:
+    from .utils import lazy_import, setup_logging
+    from .metrics import process_rss_bytes
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import lazy_import, setup_logging
+    from metrics import process_rss_bytes
+
+# 로깅 설정
+logger = setup_logging("discord_footprint")
+
+# 게이트웨이 클라이언트를 만들 때만 로드
+discord = lazy_import("discord")
+
+
+def is_low_memory():
+    """저메모리 모드 여부 (BOT_LOW_MEMORY=true)"""
+    return os.getenv("BOT_LOW_MEMORY", "false").lower() == "true"
+
+
+def get_memory_budget():
+    """RSS 예산 (바이트, BOT_MEMORY_BUDGET_MB 미지정 시 None)"""
+    budget = os.getenv("BOT_MEMORY_BUDGET_MB")
+    return float(budget) * 1024 * 1024 if budget else None
+
+
+def client_options(low_memory=None):
+    """게이트웨이 클라이언트 생성 옵션
+
+    저메모리 모드에서는 채널 캐시에 필요한 guilds 인텐트만 켜고, 메시지 캐시,
+    멤버 캐시, 시작 시 멤버 청킹을 모두 끕니다. 이 봇은 채널 이름만 읽고 바꾸므로
+    이벤트나 멤버 정보를 쓰지 않습니다.
+    """
+    if low_memory is None:
+        low_memory = is_low_memory()
+    if not low_memory:
+        return {"intents": discord.Intents.default()}
+
+    intents = discord.Intents.none()
+    intents.guilds = True
+    return {
+        "intents": intents,
+        "max_messages": None,
+        "member_cache_flags": discord.MemberCacheFlags.none(),
+        "chunk_guilds_at_startup": False,
+    }
+
+
+def set_api_endpoints(api_base=None, gateway_url=None):
+    """discord.py의 REST/게이트웨이 주소 변경 (로컬 가짜 서버로 테스트할 때)
+
+    미지정 시 DISCORD_API_BASE/DISCORD_GATEWAY_URL 환경변수를 사용하고, 둘 다 없으면 그대로 둡니다.
+    """
+    api_base = api_base or os.getenv("DISCORD_API_BASE")
+    gateway_url = gateway_url or os.getenv("DISCORD_GATEWAY_URL")
+    if api_base:
+        discord.http.Route.BASE = api_base.rstrip("/")
+    if gateway_url:
+        import yarl
+
+        discord.gateway.DiscordWebSocket.DEFAULT_GATEWAY = yarl.URL(gateway_url)
+
+
+def create_gateway_client(client_class=None, low_memory=None, **kwargs):
+    """client_options()를 적용한 게이트웨이 클라이언트 생성 (기본 discord.Client)"""
+    set_api_endpoints()
+    if client_class is None:
+        client_class = discord.Client
+    options = client_options(low_memory)
+    options.update(kwargs)
+    return client_class(**options)
+
+
+def prune_channel_cache(client, channel_ids, low_memory=None):
+    """저메모리 모드에서 레지스트리에 없는 채널과 스레드를 게이트웨이 캐시에서 제거 후 제거한 수 반환"""
+    if low_memory is None:
+        low_memory = is_low_memory()
+    if not low_memory:
+        return 0
+
+    keep = set(channel_ids)
+    removed = 0
+    for guild in client.guilds:
+        for channel in list(guild.channels):
+            if channel.id not in keep:
+                guild._remove_channel(channel)
+                removed += 1
+        guild._clear_threads()
+    gc.collect()
+    logger.info(f"[MEMORY] 레지스트리에 없는 채널 {removed}개를 캐시에서 제거했습니다")
+    return removed
+
+
+async def restore_channels(client, channel_ids):
+    """캐시에 없는 채널(저메모리 모드에서 제거된 채널)을 조회해 다시 캐시에 넣고 넣은 수 반환
+
+    실행 중에 레지스트리에 채널이 추가될 때 재연결 없이 바로 이름을 바꿀 수 있게 합니다.
+    """
+    restored = 0
+    for channel_id in channel_ids:
+        if client.get_channel(channel_id) is not None:
+            continue
+        try:
+            channel = await client.fetch_channel(channel_id)
+        except discord.HTTPException as e:
+            logger.warning(f"[WARNING] 채널 조회 실패 (ID: {channel_id}): {e}")
+            continue
+        guild = getattr(channel, "guild", None)
+        if guild is not None:
+            guild._add_channel(channel)
+            restored += 1
+    if restored:
+        logger.info(f"[MEMORY] 추가된 채널 {restored}개를 캐시에 다시 넣었습니다")
+    return restored
+
+
+def report_memory(label):
+    """현재 RSS를 로그로 남기고 BOT_MEMORY_BUDGET_MB를 넘으면 경고, RSS(바이트) 반환"""
+    rss = process_rss_bytes()
+    budget = get_memory_budget()
+    message = f"[MEMORY] {label} RSS {rss / 1024 / 1024:.1f}MB"
+    if budget is not None and rss > budget:
+        logger.warning(f"{message} - 예산 {budget / 1024 / 1024:.0f}MB 초과")
+    else:
+        logger.info(message)
+    return rss
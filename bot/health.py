@@ -0,0 +1,189 @@
+import os
+import sqlite3
+import time
+
+try:
+    from .utils import setup_logging
+    from .metrics import METRICS, Gauge
+    from .state import DEFAULT_STATE_PATH
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+    from metrics import METRICS, Gauge
+    from state import DEFAULT_STATE_PATH
+
+# 로깅 설정
+logger = setup_logging("discord_health")
+
+# 연속으로 이만큼 실패하면 격리 (권한 없음, 채널 없음, 지원하지 않는 타입)
+QUARANTINE_THRESHOLD = 2
+# 격리 후 확인 간격: 10분부터 두 배씩 늘려 최대 하루
+PROBE_BASE_INTERVAL = 600.0
+PROBE_MAX_INTERVAL = 24 * 3600.0
+
+HEALTH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS channel_health (
+    channel_id INTEGER PRIMARY KEY,
+    reason TEXT NOT NULL,
+    failures INTEGER NOT NULL,
+    since REAL NOT NULL,
+    next_probe REAL NOT NULL
+);
+"""
+
+
+class ChannelHealth:
+    """채널별 실패 상태를 추적해 계속 실패하는 채널을 격리하는 서킷 브레이커
+
+    정상 → (연속 실패 QUARANTINE_THRESHOLD회) → 격리 → (확인 시각) → 한 번 시도 →
+    성공하면 정상으로 복귀, 실패하면 더 긴 간격으로 다시 격리합니다.
+    서브프로세스 실행 간에도 유지되도록 적용 이름 저장소와 같은 SQLite 파일에 기록합니다.
+    """
+
+    def __init__(
+        self,
+        path=None,
+        threshold=QUARANTINE_THRESHOLD,
+        base_interval=PROBE_BASE_INTERVAL,
+        max_interval=PROBE_MAX_INTERVAL,
+        clock=time.time,
+    ):
+        self.path = path or os.getenv("BOT_STATE_DB", DEFAULT_STATE_PATH)
+        self.threshold = threshold
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.clock = clock
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # /status와 측정값 수집은 HTTP 서버 스레드에서 읽으므로 스레드 간 공유 허용
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(HEALTH_SCHEMA)
+        self.reload()
+
+    def reload(self):
+        """SQLite에 기록된 상태를 다시 읽음 (다른 프로세스의 기록 반영)"""
+        # {채널 ID: {"reason": 마지막 실패 사유, "failures": 연속 실패 횟수, "since": 첫 실패 시각, "next_probe": 확인 시각}}
+        self._entries = {
+            channel_id: {
+                "reason": reason,
+                "failures": failures,
+                "since": since,
+                "next_probe": next_probe,
+            }
+            for channel_id, reason, failures, since, next_probe in self._connection.execute(
+                "SELECT channel_id, reason, failures, since, next_probe FROM channel_health"
+            )
+        }
+
+    def __len__(self):
+        return len(self.quarantined())
+
+    def get(self, channel_id):
+        return self._entries.get(channel_id)
+
+    def is_quarantined(self, channel_id):
+        entry = self._entries.get(channel_id)
+        return entry is not None and entry["failures"] >= self.threshold
+
+    def admits(self, channel_id):
+        """요청을 보내도 되는지 여부 (정상이거나 격리 채널의 확인 시각이 됨)"""
+        if not self.is_quarantined(channel_id):
+            return True
+        return self._entries[channel_id]["next_probe"] <= self.clock()
+
+    def fail(self, channel_id, reason):
+        """실패 기록 - 격리되면 다음 확인까지 남은 시간(초), 아니면 None 반환"""
+        now = self.clock()
+        entry = self._entries.get(channel_id)
+        if entry is None:
+            entry = self._entries[channel_id] = {
+                "reason": reason,
+                "failures": 0,
+                "since": now,
+                "next_probe": now,
+            }
+        entry["reason"] = reason
+        entry["failures"] += 1
+
+        delay = None
+        if entry["failures"] >= self.threshold:
+            exponent = entry["failures"] - self.threshold
+            delay = min(self.base_interval * 2**exponent, self.max_interval)
+            entry["next_probe"] = now + delay
+        self._connection.execute(
+            "INSERT OR REPLACE INTO channel_health (channel_id, reason, failures, since, next_probe) VALUES (?, ?, ?, ?, ?)",
+            (channel_id, reason, entry["failures"], entry["since"], entry["next_probe"]),
+        )
+        self._connection.commit()
+        return delay
+
+    def recover(self, channel_id):
+        """성공 기록 - 격리 중이었으면 True 반환 (정상으로 복귀)"""
+        entry = self._entries.pop(channel_id, None)
+        if entry is None:
+            return False
+        self._connection.execute(
+            "DELETE FROM channel_health WHERE channel_id = ?", (channel_id,)
+        )
+        self._connection.commit()
+        return entry["failures"] >= self.threshold
+
+    def quarantined(self):
+        """격리된 채널 ID 목록"""
+        return [
+            channel_id
+            for channel_id, entry in self._entries.items()
+            if entry["failures"] >= self.threshold
+        ]
+
+    def status(self):
+        """격리된 채널 상태 목록 (상태 출력용)"""
+        return [
+            {
+                "id": channel_id,
+                "reason": entry["reason"],
+                "failures": entry["failures"],
+                "since": entry["since"],
+                "next_probe": entry["next_probe"],
+            }
+            for channel_id, entry in self._entries.items()
+            if entry["failures"] >= self.threshold
+        ]
+
+    def close(self):
+        self._connection.close()
+
+
+_HEALTH = None
+
+
+def get_channel_health():
+    """프로세스 공용 채널 상태 (최초 호출 시 열기)"""
+    global _HEALTH
+    if _HEALTH is None:
+        _HEALTH = ChannelHealth()
+    return _HEALTH
+
+
+def set_channel_health(health):
+    """프로세스 공용 채널 상태 교체 (None이면 다음 호출 시 다시 열기)"""
+    global _HEALTH
+    _HEALTH = health
+    return health
+
+
+def quarantine_status():
+    """/status에 표시할 격리 채널 목록 (서브프로세스가 기록한 상태 포함)"""
+    health = get_channel_health()
+    health.reload()
+    return health.status()
+
+
+METRICS.register(
+    Gauge(
+        "discord_bot_quarantined_channels",
+        "격리되어 요청을 보내지 않는 채널 수",
+        callback=lambda: len(quarantine_status()),
+    )
+)
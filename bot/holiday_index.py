@@ -0,0 +1,368 @@
+import json
+import os
+import sys
+from array import array
+from datetime import date, datetime
+from importlib import metadata
+
+try:
+    from .utils import setup_logging
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+
+# 로깅 설정
+logger = setup_logging("discord_holiday_index")
+
+# 한국 공휴일별 이모지 매핑
+KR_HOLIDAY_EMOJIS = {
+    # 국경일/기념일 - 국기 사용
+    "현충일": "🇰🇷",  # Memorial Day
+    "광복절": "🇰🇷",  # Liberation Day
+    "삼일절": "🇰🇷",  # Independence Movement Day
+    "제헌절": "🇰🇷",  # Constitution Day
+    "개천절": "🇰🇷",  # National Foundation Day
+    "한글날": "🇰🇷",  # Hangeul Day
+    # 설날 관련 - 복주머니
+    "설날": "🧧",  # Seollal (Lunar New Year)
+    "설날 전날": "🧧",
+    "설날 다음날": "🧧",
+    "설날 대체 휴일": "🧧",
+    # 신정 관련 - 파티/축하
+    "신정": "🎉",  # New Year's Day
+    "신정연휴": "🎉",
+    # 특별한 날들
+    "어린이날": "🎈",  # Children's Day
+    "부처님오신날": "🙏",  # Buddha's Birthday
+    "추석": "🌕",  # Chuseok (Korean Thanksgiving)
+    "추석 전날": "🌕",
+    "추석 다음날": "🌕",
+    "추석 대체 휴일": "🌕",
+    "기독탄신일": "🎄",  # Christmas Day
+    # 선거/정치 관련
+    "국회의원 선거일": "🗳️",  # Election Day
+    "대통령선거": "🗳️",
+    "지방선거": "🗳️",
+}
+
+# 베트남 공휴일별 이모지 매핑
+VN_HOLIDAY_EMOJIS = {
+    # 신정
+    "Tết Dương lịch": "🎉",  # New Year's Day
+    # 구정/설날 (Tết Nguyên Đán)
+    "29 Tết": "🧧",
+    "Giao thừa Tết Nguyên Đán": "🧧",
+    "Tết Nguyên Đán": "🧧",
+    "Mùng hai Tết Nguyên Đán": "🧧",
+    "Mùng ba Tết Nguyên Đán": "🧧",
+    "Mùng bốn Tết Nguyên Đán": "🧧",
+    "Mùng năm Tết Nguyên Đán": "🧧",
+    # 국가 기념일
+    "Ngày Giỗ Tổ Hùng Vương": "🇻🇳",  # Hung Kings' Commemoration Day
+    "Ngày Chiến thắng": "🇻🇳",  # Victory Day
+    "Quốc khánh": "🇻🇳",  # National Day
+    # 노동절
+    "Ngày Quốc tế Lao động": "👷",  # International Workers' Day
+}
+
+# 딕셔너리에 없는 공휴일을 위한 기본 이모지
+DEFAULT_HOLIDAY_EMOJI = "🗓️"
+
+
+# 긴 공휴일명 축약 매핑
+HOLIDAY_SHORT_NAMES = {
+    # 베트남 설날 관련 축약
+    "Giao thừa Tết Nguyên Đán": "Tết Eve",
+    "Mùng hai Tết Nguyên Đán": "Tết Day2",
+    "Mùng ba Tết Nguyên Đán": "Tết Day3",
+    "Mùng bốn Tết Nguyên Đán": "Tết Day4",
+    "Mùng năm Tết Nguyên Đán": "Tết Day5",
+    "Ngày Giỗ Tổ Hùng Vương": "Hùng Vương",
+    "Ngày Quốc tế Lao động": "Labor Day",
+    # 한국 공휴일 축약
+    "국회의원 선거일": "선거일",
+    "설날 대체 휴일": "설날 대체",
+    "추석 대체 휴일": "추석 대체",
+}
+
+# 국가 코드별 공휴일 이모지 매핑 (holidays 패키지 국가 코드 기준)
+CALENDAR_EMOJIS = {
+    "KR": KR_HOLIDAY_EMOJIS,
+    "VN": VN_HOLIDAY_EMOJIS,
+}
+
+# 주말 표시 (공휴일이 아닐 경우에만)
+WEEKEND_ENTRIES = {
+    5: ("Saturday", "🌤️"),  # 토요일
+    6: ("Sunday", "☀️"),  # 일요일
+}
+
+# 일별 플래그 비트
+FLAG_HOLIDAY = 1
+FLAG_WEEKEND = 2
+
+# 스냅샷 파일 형식 버전과 기본 위치
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "holiday_snapshot.json"
+)
+
+
+class HolidayIndex:
+    """연도 범위의 모든 날짜를 일 단위 배열로 색인한 공휴일 달력
+
+    국가 코드별로 날짜 서수(toordinal) 기준 플래그 배열(휴일/주말)과
+    (표시 이름, 이모지) 항목 번호 배열을 만들어 O(1)로 조회합니다.
+    """
+
+    def __init__(self, start_year, end_year, holidays_by_calendar, holidays_version=None):
+        self.start_year = start_year
+        self.end_year = end_year
+        self.start_ordinal = date(start_year, 1, 1).toordinal()
+        self.end_ordinal = date(end_year + 1, 1, 1).toordinal()
+        # 스냅샷 저장용 원본 데이터 {국가 코드: {date: 공휴일명}}
+        self.holidays = holidays_by_calendar
+        # 공휴일을 계산한 holidays 패키지 버전 (스냅샷 재사용 여부 판단용)
+        self.holidays_version = holidays_version
+        self._tables = {}
+        self.rebuild_labels()
+
+    def rebuild_labels(self):
+        """원본 공휴일명으로부터 플래그/표시 이름/이모지 배열을 다시 생성"""
+        size = self.end_ordinal - self.start_ordinal
+        tables = {}
+        for code, holiday_names in self.holidays.items():
+            emojis = CALENDAR_EMOJIS.get(code, {})
+            flags = bytearray(size)
+            entry_ids = array("H", bytes(2 * size))
+            entries = [(None, None)]
+            entry_lookup = {}
+
+            for offset in range(size):
+                day = date.fromordinal(self.start_ordinal + offset)
+                weekday = day.weekday()
+                holiday_name = holiday_names.get(day)
+
+                if holiday_name is not None:
+                    flags[offset] |= FLAG_HOLIDAY
+                    # 축약된 이름이 있으면 사용, 없으면 원래 이름 사용
+                    entry = (
+                        HOLIDAY_SHORT_NAMES.get(holiday_name, holiday_name),
+                        emojis.get(holiday_name, DEFAULT_HOLIDAY_EMOJI),
+                    )
+                elif weekday in WEEKEND_ENTRIES:
+                    entry = WEEKEND_ENTRIES[weekday]
+                else:
+                    entry = None
+
+                if weekday in WEEKEND_ENTRIES:
+                    flags[offset] |= FLAG_WEEKEND
+
+                if entry is not None:
+                    entry_id = entry_lookup.get(entry)
+                    if entry_id is None:
+                        entry_id = entry_lookup[entry] = len(entries)
+                        entries.append(entry)
+                    entry_ids[offset] = entry_id
+
+            tables[code] = (flags, entry_ids, entries)
+        self._tables = tables
+
+    def covers(self, day):
+        return self.start_ordinal <= day.toordinal() < self.end_ordinal
+
+    def is_off_day(self, code, day):
+        """주말 또는 공휴일 여부"""
+        table = self._tables.get(code)
+        if table is None:
+            return day.weekday() in WEEKEND_ENTRIES
+        return table[0][day.toordinal() - self.start_ordinal] != 0
+
+    def holiday_info(self, code, day):
+        """(표시 이름, 이모지) - 평일이면 (None, None)"""
+        table = self._tables.get(code)
+        if table is None:
+            return WEEKEND_ENTRIES.get(day.weekday(), (None, None))
+        flags, entry_ids, entries = table
+        return entries[entry_ids[day.toordinal() - self.start_ordinal]]
+
+    def day_entries(self, code, first_ordinal, count):
+        """연속된 count일의 (플래그 배열, 항목 번호 배열, 항목 목록) - 날짜별 조회 없이 한 번에 슬라이스"""
+        start = first_ordinal - self.start_ordinal
+        if start < 0 or start + count > self.end_ordinal - self.start_ordinal:
+            raise ValueError(f"색인 범위 밖의 날짜입니다: {date.fromordinal(first_ordinal)}")
+        table = self._tables.get(code)
+        if table is None:
+            # 색인에 없는 달력은 주말만 휴일로 취급
+            entries = [(None, None)] + [WEEKEND_ENTRIES[w] for w in sorted(WEEKEND_ENTRIES)]
+            weekend_ids = {w: i + 1 for i, w in enumerate(sorted(WEEKEND_ENTRIES))}
+            flags = bytearray(count)
+            entry_ids = array("H", bytes(2 * count))
+            for offset in range(count):
+                entry_id = weekend_ids.get((first_ordinal + offset - 1) % 7)
+                if entry_id is not None:
+                    flags[offset] = FLAG_WEEKEND
+                    entry_ids[offset] = entry_id
+            return flags, entry_ids, entries
+        flags, entry_ids, entries = table
+        return flags[start : start + count], entry_ids[start : start + count], entries
+
+    def holiday_name(self, code, day):
+        """holidays 패키지 원본 공휴일명 (공휴일이 아니면 None)"""
+        return self.holidays.get(code, {}).get(day)
+
+    def to_snapshot(self):
+        return {
+            "version": SNAPSHOT_VERSION,
+            "holidays_version": self.holidays_version,
+            "start_year": self.start_year,
+            "end_year": self.end_year,
+            "calendars": {
+                code: {day.isoformat(): name for day, name in sorted(names.items())}
+                for code, names in self.holidays.items()
+            },
+        }
+
+    @classmethod
+    def from_snapshot(cls, data):
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전입니다: {data.get('version')}")
+        holidays_by_calendar = {
+            code: {date.fromisoformat(day): name for day, name in names.items()}
+            for code, names in data["calendars"].items()
+        }
+        return cls(
+            data["start_year"],
+            data["end_year"],
+            holidays_by_calendar,
+            data.get("holidays_version"),
+        )
+
+    def is_current(self, calendars, holidays_version):
+        """같은 holidays 버전으로 같은 국가 목록을 계산한 색인인지 여부"""
+        return (
+            self.holidays_version == holidays_version
+            and set(self.holidays) == set(calendars)
+        )
+
+
+def build_index(start_year, end_year, calendars=None):
+    """holidays 패키지로 연도 범위의 공휴일 달력 색인 생성"""
+    import holidays  # 스냅샷이 없을 때만 필요하므로 지연 import
+
+    if calendars is None:
+        calendars = list(CALENDAR_EMOJIS)
+    years = range(start_year, end_year + 1)
+    holidays_by_calendar = {
+        code: dict(holidays.country_holidays(code, years=years)) for code in calendars
+    }
+    return HolidayIndex(
+        start_year, end_year, holidays_by_calendar, holidays.__version__
+    )
+
+
+def installed_holidays_version():
+    """설치된 holidays 패키지 버전 (패키지를 import하지 않고 배포 메타데이터에서 조회)"""
+    try:
+        return metadata.version("holidays")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def save_snapshot(index, path=None):
+    """색인을 스냅샷 파일로 저장 (다음 시작 시 holidays import 생략)"""
+    path = path or os.getenv("HOLIDAY_SNAPSHOT", DEFAULT_SNAPSHOT_PATH)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index.to_snapshot(), f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_snapshot(path=None):
+    """스냅샷 파일에서 색인 로드 (없거나 손상되면 None)"""
+    path = path or os.getenv("HOLIDAY_SNAPSHOT", DEFAULT_SNAPSHOT_PATH)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return HolidayIndex.from_snapshot(json.load(f))
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError) as e:
+        logger.warning(f"[WARNING] 공휴일 스냅샷을 읽을 수 없습니다 ({path}): {e}")
+        return None
+
+
+def default_year_range(today=None):
+    """기본 색인 범위: 작년 ~ 2년 후"""
+    year = (today or date.today()).year
+    return year - 1, year + 2
+
+
+_INDEX = None
+
+
+def get_holiday_index(day=None):
+    """프로세스 공용 공휴일 색인 반환 - day가 범위를 벗어나면 범위를 넓혀 다시 생성"""
+    global _INDEX
+
+    if _INDEX is None:
+        snapshot = load_snapshot()
+        start_year, end_year = default_year_range()
+        if snapshot is not None and not snapshot.is_current(
+            CALENDAR_EMOJIS, installed_holidays_version()
+        ):
+            # 공휴일 규칙이 바뀌었을 수 있으므로 범위가 맞아도 다시 계산
+            logger.info(
+                f"[HOLIDAY] 공휴일 스냅샷이 현재 설정과 다릅니다 "
+                f"(holidays {snapshot.holidays_version}, 국가 {sorted(snapshot.holidays)}) - 다시 생성합니다"
+            )
+            snapshot = None
+        if (
+            snapshot is not None
+            and snapshot.start_year <= start_year
+            and snapshot.end_year >= end_year
+        ):
+            _INDEX = snapshot
+        else:
+            _INDEX = build_index(start_year, end_year)
+            try:
+                save_snapshot(_INDEX)
+            except OSError as e:
+                logger.warning(f"[WARNING] 공휴일 스냅샷 저장 실패: {e}")
+
+    if day is not None and not _INDEX.covers(day):
+        start_year = min(_INDEX.start_year, day.year)
+        end_year = max(_INDEX.end_year, day.year)
+        logger.info(f"[HOLIDAY] 공휴일 색인 범위 확장: {start_year}-{end_year}")
+        _INDEX = build_index(start_year, end_year, list(_INDEX.holidays))
+
+    return _INDEX
+
+
+def refresh_holiday_labels():
+    """이모지/축약 이름 매핑이 바뀌면 이미 만든 색인의 표시 배열만 다시 생성 (공휴일 재계산 없음)"""
+    if _INDEX is not None:
+        _INDEX.rebuild_labels()
+
+
+def main():
+    """스냅샷 생성: python -m bot.holiday_index [시작연도] [종료연도] [출력경로]"""
+    start_year, end_year = default_year_range()
+    if len(sys.argv) > 1:
+        start_year = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        end_year = int(sys.argv[2])
+    path = sys.argv[3] if len(sys.argv) > 3 else None
+
+    started = datetime.now()
+    index = build_index(start_year, end_year)
+    path = save_snapshot(index, path)
+    elapsed = (datetime.now() - started).total_seconds()
+    logger.info(
+        f"[HOLIDAY] {start_year}-{end_year} 공휴일 스냅샷 저장 완료: {path} ({elapsed:.2f}초)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import argparse
+import os
+import subprocess
+import sys
+
+try:
+    from .utils import setup_logging
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+
+# 로깅 설정
+logger = setup_logging("discord_importtime")
+
+# 기본 측정 대상: 스케줄러가 매 실행마다 새로 띄우는 봇 모듈
+DEFAULT_MODULE = "bot.bot"
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력에서 (모듈, 자체 시간 us, 누적 시간 us) 목록 추출"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # 머리글 줄 (self [us] | cumulative | imported package)
+            continue
+        entries.append(
+            (fields[2].strip(), int(fields[0].strip()), int(fields[1].strip()))
+        )
+    return entries
+
+
+def profile_imports(module=DEFAULT_MODULE, env=None):
+    """새 인터프리터에서 module을 import하며 모듈별 import 시간 측정
+
+    반환값: (전체 시간 us, {최상위 패키지: 자체 시간 합계 us}, [(모듈, 자체 us, 누적 us)])
+    """
+    # 봇 모듈은 import 시 토큰을 확인하므로 측정용 값을 넣어 둠
+    run_env = dict(os.environ, DISCORD_BOT_TOKEN="importtime")
+    run_env.update(env or {})
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env=run_env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패: {result.stderr.strip()[-500:]}")
+
+    entries = parse_importtime(result.stderr)
+    packages = {}
+    for name, self_us, _ in entries:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    total = sum(self_us for _, self_us, _ in entries)
+    return total, packages, entries
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m bot.importtime",
+        description="모듈 import 시간 측정 (python -X importtime 요약)",
+    )
+    parser.add_argument(
+        "module", nargs="?", default=DEFAULT_MODULE, help="측정할 모듈"
+    )
+    parser.add_argument("--top", type=int, default=15, help="출력할 항목 수")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """import 시간 요약 출력: python -m bot.importtime [모듈] [--top N]"""
+    options = parse_args(argv)
+    total, packages, entries = profile_imports(options.module)
+
+    logger.info(
+        f"[IMPORT] {options.module}: 전체 {total / 1000:.1f}ms ({len(entries)}개 모듈)"
+    )
+    logger.info("[IMPORT] 패키지별 자체 시간:")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[
+        : options.top
+    ]:
+        logger.info(
+            f"  {package:<24} {self_us / 1000:8.1f}ms {self_us / total * 100:5.1f}%"
+        )
+    logger.info("[IMPORT] 모듈별 누적 시간:")
+    for name, _, cumulative_us in sorted(entries, key=lambda entry: -entry[2])[
+        : options.top
+    ]:
+        logger.info(f"  {name:<40} {cumulative_us / 1000:8.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,507 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import selectors
+import sys
+import tempfile
+import time
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytz
+
+try:
+    from .utils import setup_logging
+    from .fake_discord import DEFAULT_ROUTE_LIMIT, FakeDiscord
+    from .ratelimit import RENAME_BUCKETS, RENAME_BUDGET
+    from .rest import RestClient
+    from .retry_queue import PENDING_RENAMES
+    from .registry import set_registry
+    from .state import AppliedNameStore, set_state_store
+    from .health import ChannelHealth, set_channel_health
+    from .metrics import CHANNEL_UPDATES
+    from .plan import compile_plan
+    from .footprint import create_gateway_client, set_api_endpoints
+    from .benchmark import SIMULATED_YEAR, percentile, synthetic_registry
+    from .runtime import create_transition_scheduler, run_transitions
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+    from fake_discord import DEFAULT_ROUTE_LIMIT, FakeDiscord
+    from ratelimit import RENAME_BUCKETS, RENAME_BUDGET
+    from rest import RestClient
+    from retry_queue import PENDING_RENAMES
+    from registry import set_registry
+    from state import AppliedNameStore, set_state_store
+    from health import ChannelHealth, set_channel_health
+    from metrics import CHANNEL_UPDATES
+    from plan import compile_plan
+    from footprint import create_gateway_client, set_api_endpoints
+    from benchmark import SIMULATED_YEAR, percentile, synthetic_registry
+    from runtime import create_transition_scheduler, run_transitions
+
+# 로깅 설정
+logger = setup_logging("discord_loadtest")
+
+KST = pytz.timezone("Asia/Seoul")
+
+DEFAULT_LOAD_CHANNELS = 10000
+DEFAULT_LOAD_HOURS = 24
+
+# 가짜 서버에서 서버(길드) 하나에 넣는 채널 수 (Discord 서버당 채널 제한)
+CHANNELS_PER_GUILD = 500
+
+# 시뮬레이션이 끝난 뒤 남은 재시도를 처리하는 최대 시간 (초, 시뮬레이션 시각)
+DRAIN_LIMIT = 3600
+
+# 재시도 대기열 크기를 기록하는 간격 (초, 시뮬레이션 시각)
+MONITOR_INTERVAL = 1.0
+
+
+class SimulatedClock:
+    """부하 테스트 시뮬레이션 시각 (타임스탬프)
+
+    실제 경과 시간에 기다리지 않고 건너뛴 시간을 더해 진행하므로, 처리에 걸린 시간은 그대로
+    스케줄러와 이름 변경의 지연으로 남습니다. speed를 지정하면 건너뛰는 대신 1/speed만큼 실제로 기다립니다.
+    """
+
+    def __init__(self, start, speed=0.0):
+        self.start = start
+        self.speed = speed
+        self.skipped = 0.0
+        self._origin = time.monotonic()
+
+    def __call__(self):
+        return self.start + time.monotonic() - self._origin + self.skipped
+
+    @property
+    def now(self):
+        return self()
+
+    def skip(self, seconds):
+        self.skipped += max(seconds, 0.0)
+
+    def datetime(self):
+        return datetime.fromtimestamp(self(), pytz.utc)
+
+
+class SkippingSelector(selectors.DefaultSelector):
+    """처리할 I/O가 없으면 다음 타이머까지 실제로 기다리지 않고 시뮬레이션 시계를 건너뛰는 셀렉터
+
+    가짜 서버가 같은 이벤트 루프의 루프백 연결이므로, 보낸 요청의 응답은 대기 없이 바로 읽을 수 있습니다.
+    """
+
+    def __init__(self, clock):
+        super().__init__()
+        self.clock = clock
+
+    def select(self, timeout=None):
+        events = super().select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None:
+            # 타이머 없이 I/O만 기다리는 중에는 실제로 대기
+            return super().select(None)
+        if not self.clock.speed:
+            self.clock.skip(timeout)
+            return []
+        started = time.monotonic()
+        events = super().select(timeout / self.clock.speed)
+        waited = time.monotonic() - started
+        self.clock.skip(min(waited * self.clock.speed, timeout) - waited)
+        return events
+
+
+class SimulatedEventLoop(asyncio.SelectorEventLoop):
+    """모든 타이머(asyncio.sleep, wait_for, call_later)를 시뮬레이션 시계로 실행하는 이벤트 루프
+
+    분산 구간과 초당 요청 예산 대기, 재시도 백오프, 스케줄러 대기가 모두 이 시계를 따릅니다.
+    """
+
+    def __init__(self, clock):
+        super().__init__(SkippingSelector(clock))
+        self.clock = clock
+
+    def time(self):
+        return self.clock()
+
+
+@contextmanager
+def override_env(values):
+    """values의 환경변수를 잠시 바꾸고 끝나면 되돌림 (값이 None이면 제거)"""
+    saved = {key: os.environ.get(key) for key in values}
+    try:
+        for key, value in values.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = str(value)
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m bot.loadtest",
+        description="가짜 Discord 서버로 하루치 채널 이름 변경을 가속 시뮬레이션하는 부하 테스트",
+    )
+    parser.add_argument(
+        "--channels", type=int, default=DEFAULT_LOAD_CHANNELS, help="채널 수"
+    )
+    parser.add_argument(
+        "--hours", type=float, default=DEFAULT_LOAD_HOURS, help="시뮬레이션 시간 (시간)"
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="시계 배속 - 타이머까지 1/배속만큼 실제로 기다림 (0이면 기다리지 않고 건너뜀)",
+    )
+    parser.add_argument(
+        "--engine", choices=("rest", "gateway"), default="rest", help="Discord 엔진"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=5.0, help="가짜 서버 응답 지연 중앙값 (ms)"
+    )
+    parser.add_argument(
+        "--latency-sigma", type=float, default=0.5, help="응답 지연 로그정규 분포 sigma"
+    )
+    parser.add_argument(
+        "--ratelimit-rate", type=float, default=0.01, help="무작위 429 응답 비율"
+    )
+    parser.add_argument(
+        "--retry-after", type=float, default=0.05, help="무작위 429 retry_after (초)"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.005, help="무작위 5xx 응답 비율"
+    )
+    parser.add_argument(
+        "--global-limit", type=int, default=None, help="초당 전체 요청 수 제한"
+    )
+    parser.add_argument(
+        "--forbidden", type=float, default=0.001, help="수정 권한이 없는 채널 비율"
+    )
+    parser.add_argument(
+        "--outage-at", type=float, default=None, help="서버 장애 시작 (시작 후 시간)"
+    )
+    parser.add_argument(
+        "--outage-minutes", type=float, default=30.0, help="서버 장애 길이 (분)"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=None, help="동시 이름 변경 요청 수"
+    )
+    parser.add_argument(
+        "--rps", type=float, default=0.0, help="봇의 초당 이름 변경 예산 (0이면 무제한)"
+    )
+    parser.add_argument(
+        "--spread",
+        type=float,
+        default=None,
+        help="변경 시점마다 나눠 보내는 구간 (초, 미지정 시 채널 수와 예산으로 결정)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    return parser.parse_args(argv)
+
+
+async def start_client(options, fake, api_base):
+    """엔진별 클라이언트 시작 후 (클라이언트, 종료 코루틴 함수) 반환"""
+    if options.engine == "rest":
+        client = RestClient("loadtest", api_base=api_base)
+        await client.start()
+        return client, client.close
+
+    set_api_endpoints(api_base, fake.gateway_url)
+    client = create_gateway_client(low_memory=True, max_ratelimit_timeout=5.0)
+    await client.login("loadtest")
+    connect_task = asyncio.create_task(client.connect(reconnect=False))
+    await client.wait_until_ready()
+
+    async def close():
+        await client.close()
+        connect_task.cancel()
+
+    return client, close
+
+
+async def simulate(options, registry, plan, clock):
+    """가짜 서버를 상대로 상시 연결 런타임의 스케줄러(run_transitions)를 계획 구간 끝까지 실행하고 결과 반환
+
+    스케줄러, 재시도 루프, 대조 루프는 실제 런타임 코드를 그대로 사용하며, 변경 시점 콜백만 감싸
+    예정 시각 대비 스케줄러 지연과 틱 시간을 측정합니다.
+    """
+    fake = FakeDiscord(
+        latency=options.latency / 1000,
+        latency_sigma=options.latency_sigma,
+        ratelimit_rate=options.ratelimit_rate,
+        retry_after=options.retry_after,
+        error_rate=options.error_rate,
+        route_limit=DEFAULT_ROUTE_LIMIT,
+        global_limit=options.global_limit,
+        clock=clock,
+        seed=options.seed,
+    )
+    rng = random.Random(options.seed)
+    forbidden = set()
+    for index, channel_id in enumerate(registry.ids()):
+        writable = rng.random() >= options.forbidden
+        if not writable:
+            forbidden.add(channel_id)
+        fake.add_channel(
+            channel_id,
+            guild_id=(index // CHANNELS_PER_GUILD + 1) << 22,
+            writable=writable,
+        )
+    outage = None
+    if options.outage_at is not None:
+        outage_start = plan.start + options.outage_at * 3600
+        outage = (outage_start, outage_start + options.outage_minutes * 60)
+        fake.add_outage(*outage)
+
+    def planned_instant(channel_id, instant):
+        """instant 시점에 적용되어야 하는 이름의 계획 시각"""
+        entry = plan.classes[plan.class_by_channel[channel_id]]
+        index = bisect_right(entry["instants"], instant) - 1
+        return entry["instants"][max(index, 0)]
+
+    # 틱 시작부터 PATCH 응답까지의 실제 지연, 계획 시각부터 적용까지의 시뮬레이션 지연
+    wall_drift = array("d")
+    sim_drift = array("d")
+    schedule_lag = array("d")
+    tick = {"started": 0.0, "running": 0}
+
+    def on_patch(channel_id, name):
+        wall_drift.append(time.perf_counter() - tick["started"])
+        now = clock()
+        sim_drift.append(now - planned_instant(channel_id, now))
+
+    fake.on_patch = on_patch
+
+    api_base = await fake.start()
+    store = set_state_store(AppliedNameStore(":memory:"))
+    health = set_channel_health(ChannelHealth(":memory:", clock=clock))
+    set_registry(registry)
+    original_clocks = (RENAME_BUCKETS.clock, PENDING_RENAMES.clock, RENAME_BUDGET.clock)
+    original_rate = RENAME_BUDGET.rate
+    RENAME_BUCKETS.clear()
+    PENDING_RENAMES.clear()
+    RENAME_BUDGET.reset()
+    RENAME_BUCKETS.clock = PENDING_RENAMES.clock = RENAME_BUDGET.clock = clock
+    RENAME_BUDGET.rate = options.rps
+    CHANNEL_UPDATES.clear()
+
+    tick_samples = []
+    pending = {"max": 0, "recovered_at": None}
+    perf_counter = time.perf_counter
+
+    async def monitor():
+        while True:
+            pending["max"] = max(pending["max"], len(PENDING_RENAMES))
+            if (
+                outage is not None
+                and pending["recovered_at"] is None
+                and clock() >= outage[1]
+                and not len(PENDING_RENAMES)
+            ):
+                pending["recovered_at"] = clock()
+            await asyncio.sleep(MONITOR_INTERVAL)
+
+    try:
+        client, close = await start_client(options, fake, api_base)
+        scheduler = create_transition_scheduler(client, registry, clock=clock.datetime)
+        on_transition = scheduler.callback
+
+        async def measured_transition(class_keys, now):
+            # 계획 구간이 끝난 뒤의 변경 시점은 실행하지 않음 (다시 등록되지 않으므로 스케줄러가 멈춤)
+            if now.timestamp() >= plan.end:
+                return
+            actual = clock()
+            for class_key in class_keys:
+                channel_id = registry[registry.class_members(class_key)[0]]["id"]
+                schedule_lag.append(actual - planned_instant(channel_id, now.timestamp()))
+            tick["running"] += 1
+            tick["started"] = perf_counter()
+            try:
+                await on_transition(class_keys, now)
+            finally:
+                tick_samples.append(perf_counter() - tick["started"])
+                tick["running"] -= 1
+
+        scheduler.callback = measured_transition
+        started = perf_counter()
+        monitor_task = asyncio.create_task(monitor())
+        # 시작 시각의 초기 업데이트(모든 채널)부터 실제 런타임 루프로 실행
+        tick["started"] = perf_counter()
+        runtime_task = asyncio.create_task(run_transitions(client, scheduler, registry))
+        try:
+            await asyncio.sleep(plan.end - clock())
+            # 구간 안에서 시작된 변경과 남은 재시도가 끝날 때까지 대기
+            deadline = plan.end + DRAIN_LIMIT
+            while (tick["running"] or len(PENDING_RENAMES)) and clock() < deadline:
+                await asyncio.sleep(MONITOR_INTERVAL)
+        finally:
+            for task in (runtime_task, monitor_task):
+                task.cancel()
+            await asyncio.gather(runtime_task, monitor_task, return_exceptions=True)
+            elapsed = perf_counter() - started
+            await close()
+    finally:
+        RENAME_BUCKETS.clock, PENDING_RENAMES.clock, RENAME_BUDGET.clock = original_clocks
+        RENAME_BUDGET.rate = original_rate
+        RENAME_BUCKETS.clear()
+        PENDING_RENAMES.clear()
+        RENAME_BUDGET.reset()
+        set_registry(None)
+        set_state_store(None)
+        set_channel_health(None)
+        store.close()
+        health.close()
+        await fake.stop()
+
+    # 권한이 없는 채널을 제외하고 가짜 서버의 최종 이름이 계획과 같은지 확인
+    last = plan.end - 1
+    diverged = [
+        channel_id
+        for channel_id in registry.ids()
+        if channel_id not in forbidden
+        and fake.channel_name(channel_id) != plan.name_at(channel_id, last)
+    ]
+
+    tick_samples.sort()
+    wall = sorted(wall_drift)
+    sim = sorted(sim_drift)
+    lag = sorted(schedule_lag)
+    patches = fake.stats["patches"]
+    busy = sum(tick_samples)
+    return {
+        "channels": options.channels,
+        "hours": options.hours,
+        "engine": options.engine,
+        "planned_renames": len(plan),
+        "elapsed_sec": elapsed,
+        "simulated_sec": clock() - plan.start,
+        "ticks": len(tick_samples),
+        "patches": patches,
+        "patches_per_sec": patches / busy if busy else 0.0,
+        "tick_p50_ms": percentile(tick_samples, 0.50) * 1000,
+        "tick_p99_ms": percentile(tick_samples, 0.99) * 1000,
+        "tick_max_ms": (tick_samples[-1] if tick_samples else 0.0) * 1000,
+        "schedule_lag_p50_ms": percentile(lag, 0.50) * 1000,
+        "schedule_lag_p99_ms": percentile(lag, 0.99) * 1000,
+        "schedule_lag_max_ms": (lag[-1] if lag else 0.0) * 1000,
+        "drift_p50_ms": percentile(wall, 0.50) * 1000,
+        "drift_p99_ms": percentile(wall, 0.99) * 1000,
+        "late_renames": sum(1 for value in sim if value > 1.0),
+        "late_p99_sec": percentile(sim, 0.99),
+        "late_max_sec": sim[-1] if sim else 0.0,
+        "max_pending": pending["max"],
+        "recovery_sec": (
+            pending["recovered_at"] - outage[1]
+            if pending["recovered_at"] is not None
+            else None
+        ),
+        "statuses": {key[0]: int(value) for key, value in CHANNEL_UPDATES.snapshot()},
+        "server": dict(fake.stats),
+        "forbidden_channels": len(forbidden),
+        "diverged": len(diverged),
+    }
+
+
+def run_load_test(options):
+    """N개 채널의 계획을 컴파일한 뒤 시뮬레이션 시계의 이벤트 루프에서 런타임 스케줄러를 실행하고 결과 반환"""
+    registry = synthetic_registry(options.channels)
+    start = KST.localize(datetime(SIMULATED_YEAR, 3, 4))
+    end = start + timedelta(hours=options.hours)
+    compile_started = time.perf_counter()
+    plan = compile_plan(registry, start, end)
+    compile_elapsed = time.perf_counter() - compile_started
+
+    with tempfile.TemporaryDirectory() as plan_dir, override_env(
+        {
+            # 런타임이 컴파일한 계획은 임시 디렉터리에 저장하고, 설정 파일 감시는 끔
+            "RENAME_PLAN_DIR": plan_dir,
+            "CONFIG_RELOAD_INTERVAL": 0,
+            "RENAME_SPREAD_WINDOW": options.spread,
+            "MAX_CONCURRENT_RENAMES": options.concurrency,
+        }
+    ):
+        clock = SimulatedClock(plan.start, options.speed)
+        with asyncio.Runner(loop_factory=lambda: SimulatedEventLoop(clock)) as runner:
+            result = runner.run(simulate(options, registry, plan, clock))
+    result["compile_sec"] = compile_elapsed
+    return result
+
+
+def log_result(result):
+    logger.info(
+        f"[LOAD] {result['channels']:,}개 채널, {result['hours']:g}시간 ({result['engine']} 엔진): 계획 {result['planned_renames']:,}건 (컴파일 {result['compile_sec']:.2f}초), 시뮬레이션 {result['simulated_sec'] / 3600:.1f}시간을 {result['elapsed_sec']:.1f}초에 실행"
+    )
+    logger.info(
+        f"[LOAD] 틱 {result['ticks']:,}회, PATCH {result['patches']:,}회 - {result['patches_per_sec']:,.0f}회/초, 틱 p50 {result['tick_p50_ms']:.1f}ms / p99 {result['tick_p99_ms']:.1f}ms / 최대 {result['tick_max_ms']:.1f}ms"
+    )
+    logger.info(
+        f"[LOAD] 스케줄러 지연(예정 시각~콜백 실행): p50 {result['schedule_lag_p50_ms']:.1f}ms / p99 {result['schedule_lag_p99_ms']:.1f}ms / 최대 {result['schedule_lag_max_ms']:.1f}ms"
+    )
+    logger.info(
+        f"[LOAD] 지연: 틱 시작~PATCH 응답 p50 {result['drift_p50_ms']:.1f}ms / p99 {result['drift_p99_ms']:.1f}ms, 계획보다 1초 넘게 늦게 적용 {result['late_renames']:,}건 (p99 {result['late_p99_sec']:.0f}초, 최대 {result['late_max_sec']:.0f}초)"
+    )
+    server = result["server"]
+    logger.info(
+        f"[LOAD] 가짜 서버: 요청 {server['requests']:,}회, 429 {server['rate_limited']:,}회 (경로 {server['route_limited']:,}, 전체 {server['global_limited']:,}), 5xx {server['server_errors']:,}회, 403 {server['forbidden']:,}회"
+    )
+    logger.info(
+        f"[LOAD] 결과: {', '.join(f'{status} {count:,}' for status, count in sorted(result['statuses'].items()))}"
+    )
+    if result["recovery_sec"] is not None:
+        logger.info(
+            f"[LOAD] 장애 복구: 장애 종료 {result['recovery_sec'] / 60:.1f}분 후 재시도 대기열 비움 (최대 대기 {result['max_pending']:,}개)"
+        )
+    if result["diverged"]:
+        logger.error(
+            f"[LOAD] 계획과 다른 이름으로 끝난 채널 {result['diverged']:,}개 (권한 없는 채널 {result['forbidden_channels']:,}개 제외)"
+        )
+    else:
+        logger.info(
+            f"[LOAD] 모든 채널이 계획의 이름으로 수렴했습니다 (권한 없는 채널 {result['forbidden_channels']:,}개 제외)"
+        )
+
+
+def main(argv=None):
+    """부하 테스트 실행: python -m bot.loadtest [옵션] - 계획과 다른 채널이 남으면 1 반환"""
+    options = parse_args(argv)
+
+    # 채널별 로그가 측정을 방해하지 않도록 경고 이상만 출력 (오류 주입으로 인한 경고도 생략)
+    for logger_name in (
+        "discord_updater",
+        "discord_runtime",
+        "discord_schedule",
+        "discord_plan",
+        "discord_footprint",
+        "discord_rest",
+        "discord_state",
+        "discord_health",
+        "discord",
+    ):
+        logging.getLogger(logger_name).setLevel(logging.ERROR)
+
+    result = run_load_test(options)
+    log_result(result)
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return 1 if result["diverged"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,26 +1,137 @@
+import functools
+import json
+import logging
 import subprocess
 import sys
+import threading
 import time
 from datetime import datetime
 import os
-import pytz
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.cron import CronTrigger
 
 try:
-    from .utils import setup_logging, check_discord_token
-    from .updater import calculate_next_update_time, is_off_day
+    from .utils import (
+        RESERVED_RECORD_FIELDS,
+        check_discord_token,
+        log_separator,
+        setup_logging,
+    )
+    from .metrics import (
+        SCHEDULE_LAG,
+        merge_snapshot_line,
+        register_status,
+        start_metrics_server,
+    )
+    from .health import quarantine_status
+    from .registry import get_registry
+    from .schedule import KST, next_transitions
+    from .plan import next_plan_instant
+    from .reload import ConfigReloader, ConfigWatcher, get_reload_interval
 except ImportError:
     # 직접 실행될 때를 위한 대체 import
-    from utils import setup_logging, check_discord_token
-    from updater import calculate_next_update_time, is_off_day
+    from utils import (
+        RESERVED_RECORD_FIELDS,
+        check_discord_token,
+        log_separator,
+        setup_logging,
+    )
+    from metrics import (
+        SCHEDULE_LAG,
+        merge_snapshot_line,
+        register_status,
+        start_metrics_server,
+    )
+    from health import quarantine_status
+    from registry import get_registry
+    from schedule import KST, next_transitions
+    from plan import next_plan_instant
+    from reload import ConfigReloader, ConfigWatcher, get_reload_interval
 
 # 로깅 설정
 logger = setup_logging("discord_main")
 
+# 봇 프로세스 실행 제한 시간 (초, 빠른 실패)
+BOT_TIMEOUT = 30
+
+# 봇 프로세스의 이름 변경 분산 구간 상한 (초) - 로그인과 종료 전 재시도(RETRY_BUDGET)까지
+# BOT_TIMEOUT 안에 끝나도록 최대 분산 구간(300초) 대신 사용
+SUBPROCESS_SPREAD_LIMIT = 10.0
+
+# 프로젝트 루트 (봇 프로세스를 모듈로 실행하는 위치)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 설정 다시 로드와 변경 시점 작업이 레지스트리를 동시에 다루지 않도록 하는 잠금
+CONFIG_LOCK = threading.Lock()
+
+
+def relay_bot_line(line):
+    """봇 프로세스의 출력 한 줄을 로그로 전달 (JSON 로그는 필드를 유지, 측정값은 합산만)"""
+    if not line or merge_snapshot_line(line):
+        return
+    if line.startswith("{"):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            entry = None
+        if isinstance(entry, dict) and "message" in entry:
+            level = logging.getLevelName(entry.get("level", "INFO"))
+            fields = {
+                key: value
+                for key, value in entry.items()
+                if key not in RESERVED_RECORD_FIELDS
+                and key not in ("ts", "level", "logger")
+            }
+            fields["source"] = entry.get("logger", "bot")
+            logger.log(
+                level if isinstance(level, int) else logging.INFO,
+                f"[BOT] {entry['message']}",
+                extra=fields,
+            )
+            return
+    logger.info(f"  [BOT] {line}")
+
+
+def stream_bot_process(env, timeout=BOT_TIMEOUT):
+    """봇 프로세스를 실행하며 stdout을 줄 단위로 바로 로그에 전달하고 (종료 코드, stderr 줄 목록) 반환
+
+    출력 전체를 모아 두었다가 종료 후에 한꺼번에 남기지 않으므로 긴 실행도 진행 상황이 바로 보입니다.
+    """
+    process = subprocess.Popen(
+        [sys.executable, "-m", "bot.bot"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        cwd=PROJECT_ROOT,
+    )
+    stderr_lines = []
+    readers = [
+        threading.Thread(
+            target=lambda: [relay_bot_line(line.strip()) for line in process.stdout],
+            daemon=True,
+        ),
+        threading.Thread(
+            target=lambda: stderr_lines.extend(
+                line.strip() for line in process.stderr if line.strip()
+            ),
+            daemon=True,
+        ),
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join(timeout=5)
+    return process.returncode, stderr_lines
+
 
-def run_bot():
-    """봇을 실행하는 함수"""
+def run_bot(channels=None):
+    """봇을 실행하는 함수 (channels 지정 시 해당 채널 키만 업데이트)"""
     start_time = time.time()
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger.info(f"[TIME] 봇 실행 시작: {current_time}")
@@ -33,18 +144,19 @@ def run_bot():
             logger.error(f"[ERROR] {e}")
             return False
 
-        # 봇 실행 - 모듈로 실행
-        result = subprocess.run(
-            [sys.executable, "-m", "bot.bot"],
-            capture_output=True,
-            text=True,
-            timeout=30,  # 타임아웃 단축 (빠른 실패)
-            cwd=os.path.dirname(
-                os.path.dirname(os.path.abspath(__file__))
-            ),  # 프로젝트 루트
-        )
-
-        if result.returncode == 0:
+        # 이번 실행에서 이름이 바뀌는 채널만 넘김 (야간인 지역의 채널은 포함되지 않음)
+        env = os.environ.copy()
+        env.pop("BOT_CHANNELS", None)
+        # 분산 구간이 실행 제한 시간을 넘으면 남은 이름 변경이 강제 종료로 끊기므로 상한 지정
+        spread_limit = float(env.get("RENAME_SPREAD_LIMIT", SUBPROCESS_SPREAD_LIMIT))
+        env["RENAME_SPREAD_LIMIT"] = str(min(spread_limit, SUBPROCESS_SPREAD_LIMIT))
+        if channels is not None:
+            env["BOT_CHANNELS"] = ",".join(channels)
+
+        # 봇 실행 - 모듈로 실행 (봇의 로그는 실행 중에 바로 전달됨)
+        returncode, stderr_lines = stream_bot_process(env)
+
+        if returncode == 0:
             execution_time = time.time() - start_time
             logger.info(
                 f"[SUCCESS] 봇이 성공적으로 실행되었습니다 (실행시간: {execution_time:.2f}초)"
@@ -58,26 +170,18 @@ def run_bot():
             elif execution_time > 10:
                 logger.info(f"[PERFORMANCE] 실행 시간: {execution_time:.2f}초")
 
-            # stdout 출력 (봇의 로그)
-            if result.stdout.strip():
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip():
-                        logger.info(f"  [BOT] {line.strip()}")
-
             return True
         else:
-            logger.error(f"[FAIL] 봇 실행 실패 (exit code: {result.returncode})")
+            logger.error(f"[FAIL] 봇 실행 실패 (exit code: {returncode})")
 
             # stderr 출력
-            if result.stderr.strip():
-                for line in result.stderr.strip().split("\n"):
-                    if line.strip():
-                        logger.error(f"  [ERROR] {line.strip()}")
+            for line in stderr_lines:
+                logger.error(f"  [ERROR] {line}")
 
             return False
 
     except subprocess.TimeoutExpired:
-        logger.error("[TIMEOUT] 봇 실행이 타임아웃되었습니다 (30초)")
+        logger.error(f"[TIMEOUT] 봇 실행이 타임아웃되었습니다 ({BOT_TIMEOUT}초)")
         return False
     except FileNotFoundError:
         logger.error("[ERROR] Python 인터프리터를 찾을 수 없습니다")
@@ -87,213 +191,166 @@ def run_bot():
         return False
 
 
-def run_bot_night_mode():
-    """야간 모드용 봇 실행 함수"""
-    start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[NIGHT_TIME] 야간 모드 봇 실행 시작: {current_time}")
+def job_wrapper(channels):
+    """스케줄 작업 래퍼 함수 - 이름이 바뀌는 채널만 봇 프로세스로 업데이트"""
+    logger.info(f"[START] 스케줄 작업 시작 ({len(channels)}개 채널)")
 
-    try:
-        # 환경변수 확인
-        try:
-            check_discord_token()
-        except ValueError as e:
-            logger.error(f"[ERROR] {e}")
-            return False
+    success = run_bot(channels)
 
-        # 야간 모드 봇 실행 - 특별한 환경변수로 구분
-        env = os.environ.copy()
-        env["NIGHT_MODE"] = "true"  # 야간 모드 플래그 설정
-
-        result = subprocess.run(
-            [sys.executable, "-m", "bot.bot"],
-            capture_output=True,
-            text=True,
-            timeout=30,  # 타임아웃 단축 (빠른 실패)
-            env=env,  # 환경변수 전달
-            cwd=os.path.dirname(
-                os.path.dirname(os.path.abspath(__file__))
-            ),  # 프로젝트 루트
-        )
-
-        if result.returncode == 0:
-            execution_time = time.time() - start_time
-            logger.info(
-                f"[SUCCESS] 야간 모드 봇이 성공적으로 실행되었습니다 (실행시간: {execution_time:.2f}초)"
-            )
-
-            # 성능 경고
-            if execution_time > 20:
-                logger.warning(
-                    f"[PERFORMANCE] 야간 모드 실행 시간이 길어지고 있습니다: {execution_time:.2f}초"
-                )
-            elif execution_time > 10:
-                logger.info(
-                    f"[PERFORMANCE] 야간 모드 실행 시간: {execution_time:.2f}초"
-                )
-
-            # stdout 출력 (봇의 로그)
-            if result.stdout.strip():
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip():
-                        logger.info(f"  [NIGHT_BOT] {line.strip()}")
-
-            return True
-        else:
-            logger.error(
-                f"[FAIL] 야간 모드 봇 실행 실패 (exit code: {result.returncode})"
-            )
+    if success:
+        logger.info("[COMPLETE] 스케줄 작업 완료")
+    else:
+        logger.warning("[WARNING] 스케줄 작업 중 오류 발생")
 
-            # stderr 출력
-            if result.stderr.strip():
-                for line in result.stderr.strip().split("\n"):
-                    if line.strip():
-                        logger.error(f"  [ERROR] {line.strip()}")
 
-            return False
+def sharded_job_wrapper(supervisor, channels):
+    """샤드 워커들에 스케줄 실행을 나눠 보내는 작업 래퍼 (sharded 모드)"""
+    logger.info(f"[START] 샤드 스케줄 작업 시작 ({len(channels)}개 채널)")
+    statuses = supervisor.tick(datetime.now(KST), channels=channels)
+    if statuses.get("error"):
+        logger.warning(f"[WARNING] {statuses['error']}개 채널 업데이트 중 오류 발생")
 
-    except subprocess.TimeoutExpired:
-        logger.error("[TIMEOUT] 야간 모드 봇 실행이 타임아웃되었습니다 (30초)")
-        return False
-    except FileNotFoundError:
-        logger.error("[ERROR] Python 인터프리터를 찾을 수 없습니다")
-        return False
-    except Exception as e:
-        logger.error(f"[ERROR] 야간 모드 봇 실행 중 예상치 못한 오류 발생: {e}")
-        return False
 
+def transition_job(scheduler, registry, channels, instant, job):
+    """예정된 변경 시점에 job(채널 키 목록) 실행 후 다음 변경 시점 등록"""
+    now = datetime.now(KST)
+    SCHEDULE_LAG.observe(max((now - instant).total_seconds(), 0.0))
+    with CONFIG_LOCK:
+        try:
+            job(channels)
+        finally:
+            schedule_next_transition(scheduler, registry, max(now, instant), job)
+            log_separator(logger)
+
+
+def schedule_next_transition(scheduler, registry, now, job):
+    """다음 변경 시점에 그 시점 이름이 바뀌는 채널만 실행하는 일회성 작업 등록
+
+    야간 시간은 채널 시간대 기준으로 채널마다 따로 계산되므로, 깨어 있는 지역의 채널은
+    계속 갱신되고 잠든 지역의 채널은 깨어날 때까지 실행 대상에 오르지 않습니다.
+    """
+    instant, class_keys = next_transitions(registry, now, next_plan_instant)
+    if instant is None:
+        logger.warning("[WAIT] 등록된 채널이 없어 예정된 변경이 없습니다")
+        return None
+
+    channels = [
+        key for class_key in class_keys for key in registry.class_members(class_key)
+    ]
+    scheduler.add_job(
+        transition_job,
+        trigger="date",
+        run_date=instant,
+        args=(scheduler, registry, channels, instant, job),
+        id="discord_bot_transition",
+        replace_existing=True,
+        # 늦게 깨어나도 건너뛰지 않고 실행해야 다음 시점이 다시 등록됨
+        misfire_grace_time=None,
+    )
+    logger.info(
+        f"[WAIT] 다음 변경 예정: {instant.astimezone(KST).strftime('%Y-%m-%d %H:%M:%S')} ({len(channels)}개 채널)"
+    )
+    return instant
 
-def job_wrapper():
-    """스케줄 작업 래퍼 함수"""
-    now = datetime.now(pytz.timezone("Asia/Seoul"))
-    current_hour = now.hour
-    current_minute = now.minute
 
-    # 특별 처리: 22:00에는 야간 모드로 전환
-    if current_hour == 22 and current_minute == 0:
-        logger.info("[NIGHT_MODE] 22:00 - 야간 모드로 전환합니다")
-        success = run_bot_night_mode()
-        if success:
-            logger.info("[COMPLETE] 야간 모드 전환 완료")
-        else:
-            logger.warning("[WARNING] 야간 모드 전환 중 오류 발생")
-        logger.info("[WAIT] 다음 실행까지 대기 중...")
-        print("-" * 50)
+def config_reload_job(scheduler, reloader, watcher, job):
+    """설정 파일이 바뀌었으면 달라진 채널만 바로 업데이트하고 다음 변경 시점을 다시 등록"""
+    if not watcher.poll():
         return
+    now = datetime.now(KST)
+    with CONFIG_LOCK:
+        change = reloader.reload(now)
+        if change is None:
+            return
+        if change["channels"]:
+            job(change["channels"])
+        schedule_next_transition(scheduler, reloader.registry, now, job)
+
+
+def schedule_config_reload(scheduler, registry, job):
+    """설정 파일(CHANNEL_REGISTRY, BOT_CONFIG) 변경 감시 작업 등록 (감시할 파일이 없거나 간격이 0이면 생략)"""
+    interval = get_reload_interval()
+    reloader = ConfigReloader(registry)
+    watcher = ConfigWatcher(reloader.paths())
+    if interval <= 0 or not watcher.paths:
+        return None
+    logger.info(
+        f"[CONFIG] 설정 파일 변경 감시 시작: {', '.join(watcher.paths)} ({interval:g}초 간격)"
+    )
+    return scheduler.add_job(
+        config_reload_job,
+        trigger="interval",
+        seconds=interval,
+        args=(scheduler, reloader, watcher, job),
+        id="discord_bot_config_reload",
+        max_instances=1,
+        coalesce=True,
+    )
 
-    # 특별 처리: 07:00~07:59에는 정상 모드로 복구 (야간 모드 해제)
-    if current_hour == 7:
-        logger.info(
-            f"[MORNING_MODE] {current_hour:02d}:{current_minute:02d} - 정상 모드로 복구합니다"
-        )
-        minute = now.minute
-        logger.info(f"[START] 스케줄 작업 시작 (현재 시간: {minute}분)")
-        success = run_bot()
-        if success:
-            logger.info("[COMPLETE] 정상 모드 복구 완료")
-        else:
-            logger.warning("[WARNING] 정상 모드 복구 중 오류 발생")
-        logger.info("[WAIT] 다음 실행까지 대기 중...")
-        print("-" * 50)
-        return
 
-    # 한국 시간 기준 22:01 ~ 06:59 사이에는 실행하지 않음 (7시대는 위에서 이미 처리됨)
-    if (
-        (current_hour == 22 and current_minute > 0)
-        or (current_hour > 22)
-        or current_hour < 7
-    ):
-        logger.info(
-            f"[SKIP] 현재 시간({now.strftime('%H:%M')})이 야간 시간이므로 건너뜁니다"
-        )
-        logger.info("[WAIT] 다음 실행까지 대기 중...")
-        print("-" * 50)
-        return
+def create_scheduler():
+    """APScheduler 블로킹 스케줄러 생성 (필요한 실행 방식에서만 apscheduler를 로드)"""
+    from apscheduler.schedulers.blocking import BlockingScheduler
 
-    # 점진적 개선: 실제 업데이트가 필요한 시점인지 체크
-    try:
-        next_update_time = calculate_next_update_time(now)
-        time_until_update = (next_update_time - now).total_seconds()
-
-        # 평일 업무시간(07:00-21:50)에는 정확히 10분 단위로 실행해야 함
-        # 두 지역 중 하나라도 평일이면 업데이트 필요
-        seoul_is_off_day = is_off_day(now.date(), "SEOUL")
-        hcmc_is_off_day = is_off_day(now.date(), "HCMC")
-
-        # 두 지역 중 하나라도 평일이면 업무시간으로 간주
-        is_workday_hours = (
-            7 <= current_hour <= 21
-            and not (seoul_is_off_day and hcmc_is_off_day)  # 둘 다 휴일이 아닌 경우
-        )
-
-        # 평일 업무시간이면 5분 기준 무시하고 실행
-        if is_workday_hours:
-            logger.info(f"[WORKDAY] 업무시간 - 정확한 시간 업데이트를 위해 실행")
-            logger.info(
-                f"[DEBUG] 서울 휴일: {seoul_is_off_day}, 베트남 휴일: {hcmc_is_off_day}"
-            )
-            logger.info(
-                f"[DEBUG] 다음 업데이트 예정: {next_update_time.strftime('%Y-%m-%d %H:%M:%S')}"
-            )
-        # 평일 업무시간이 아니면 5분 기준 효율성 체크
-        elif time_until_update > 300:  # 5분 = 300초
-            logger.info(
-                f"[EFFICIENCY] 다음 업데이트까지 {time_until_update / 60:.1f}분 남음 - 실행 스킵"
-            )
-            logger.info(
-                f"[NEXT_UPDATE] 다음 업데이트 예정: {next_update_time.strftime('%Y-%m-%d %H:%M:%S')}"
-            )
-            logger.info(
-                f"[DEBUG] 서울 휴일: {seoul_is_off_day}, 베트남 휴일: {hcmc_is_off_day}"
-            )
-            logger.info("[WAIT] 다음 실행까지 대기 중...")
-            print("-" * 50)
-            return
-        else:
-            logger.info(
-                f"[EFFICIENCY] 다음 업데이트까지 {time_until_update / 60:.1f}분 - 실행 필요"
-            )
-            logger.info(
-                f"[DEBUG] 서울 휴일: {seoul_is_off_day}, 베트남 휴일: {hcmc_is_off_day}"
-            )
-            logger.info(
-                f"[DEBUG] 다음 업데이트 예정: {next_update_time.strftime('%Y-%m-%d %H:%M:%S')}"
-            )
-    except Exception as e:
-        logger.warning(f"[WARNING] 업데이트 시점 계산 실패: {e} - 기본 로직으로 진행")
+    return BlockingScheduler(timezone=KST)
 
-    minute = now.minute
-    logger.info(f"[START] 스케줄 작업 시작 (현재 시간: {minute}분)")
 
-    success = run_bot()
+def run_sharded(engine):
+    """레지스트리를 서버 기준 샤드로 나눠 워커 프로세스들이 처리하고 감독자가 스케줄을 배분"""
+    try:
+        from .sharding import ShardSupervisor
+    except ImportError:
+        from sharding import ShardSupervisor
 
-    if success:
-        logger.info("[COMPLETE] 스케줄 작업 완료")
-    else:
-        logger.warning("[WARNING] 스케줄 작업 중 오류 발생")
+    supervisor = ShardSupervisor(engine=engine)
+    supervisor.start()
 
-    logger.info("[WAIT] 다음 실행까지 대기 중...")
-    print("-" * 50)  # 구분선
+    scheduler = create_scheduler()
+    # 실행 사이에 비정상 종료된 워커도 바로 다시 시작
+    scheduler.add_job(
+        supervisor.ensure_alive,
+        trigger="interval",
+        seconds=30,
+        id="discord_bot_supervisor",
+        max_instances=1,
+        coalesce=True,
+    )
 
+    # 봇 초기 실행 시 무조건 한번 업데이트
+    current_time = datetime.now(KST)
+    logger.info(
+        f"[IMMEDIATE] 봇 초기 실행 - 모든 샤드를 현재 상태로 업데이트합니다 ({current_time.strftime('%H:%M')})"
+    )
+    supervisor.tick(current_time)
+    schedule_next_transition(
+        scheduler,
+        get_registry(),
+        current_time,
+        functools.partial(sharded_job_wrapper, supervisor),
+    )
 
-# APScheduler 사용으로 대체하여 제거됨
+    try:
+        logger.info("[SCHEDULER] APScheduler 시작 (샤드 감독자)...")
+        scheduler.start()
+    except KeyboardInterrupt:
+        logger.info("[STOP] 사용자에 의해 스케줄러가 중지되었습니다")
+        scheduler.shutdown()
+    finally:
+        supervisor.stop()
 
 
 def main():
     """메인 스케줄러 함수 - APScheduler 사용"""
     logger.info("[INIT] Discord 타임존 봇 스케줄러를 시작합니다 (APScheduler)")
     logger.info(
-        "[SCHEDULE] 업무 시간(07:00-21:50): 정확히 10분 단위로 실행 (0, 10, 20, 30, 40, 50분)"
+        "[SCHEDULE] 채널별 이름이 실제로 바뀌는 시점(시간 표시 갱신, 근무 상태 경계, 휴일/주말 전환)에만 실행"
     )
-    logger.info("[SCHEDULE] 야간 모드(22:00): 수면 상태로 전환")
     logger.info(
-        "[SCHEDULE] 정상 모드(07:00): 야간 모드 해제 시 평일/주말 자동 감지하여 복구"
+        "[SCHEDULE] 야간 모드: 채널 시간대 기준 현지 야간 시간(기본 22:00-07:00)에 지역별로 전환/복구"
     )
-    logger.info("[SCHEDULE] 휴일/주말은 자동으로 감지되어 처리됩니다")
 
     # 현재 시간대 정보 출력
     current_time = datetime.now()
-    kst = pytz.timezone("Asia/Seoul")
     logger.info(
         f"[TIMEZONE] 현재 시스템 시간: {current_time.strftime('%Y-%m-%d %H:%M:%S %Z')}"
     )
@@ -307,80 +364,56 @@ def main():
         logger.error("[HELP] .env 파일을 생성하거나 환경변수를 설정해주세요")
         sys.exit(1)
 
-    # APScheduler 설정
-    scheduler = BlockingScheduler(timezone=kst)
-
-    # 일반 업무 시간 (07:00-21:50) - 매 10분마다 실행
-    normal_trigger = CronTrigger(
-        minute="0,10,20,30,40,50",
-        hour="7-21",  # 07시부터 21시까지만
-        second=0,
-        timezone=kst,
-    )
+    # 실행 방식 선택: subprocess(기본, 매 실행마다 새 프로세스) / persistent(상시 연결) / sharded(샤드별 워커 프로세스)
+    runtime_mode = os.getenv("BOT_RUNTIME", "subprocess").lower()
+    # 채널 변경 엔진 선택: gateway(기본, 웹소켓 로그인) / rest(REST API만 사용)
+    engine = os.getenv("BOT_ENGINE", "gateway").lower()
+    logger.info(f"[RUNTIME] 실행 방식: {runtime_mode}, 엔진: {engine}")
 
-    # 야간 모드 전환 (22:00 정확히)
-    night_trigger = CronTrigger(
-        minute="0",
-        hour="22",  # 22시 정확히
-        second=0,
-        timezone=kst,
-    )
+    # METRICS_PORT 지정 시 /metrics, /status(격리된 채널 목록) 엔드포인트 제공
+    register_status("quarantined", quarantine_status)
+    start_metrics_server()
 
-    # 정상 모드 복구 (07:00 정확히) - 별도 잡으로 처리하지 않고 normal_trigger가 처리
+    if runtime_mode == "persistent":
+        try:
+            from .runtime import run_persistent
+        except ImportError:
+            from runtime import run_persistent
 
-    scheduler.add_job(
-        job_wrapper,
-        trigger=normal_trigger,
-        id="discord_bot_normal",
-        max_instances=1,
-        coalesce=True,
-        misfire_grace_time=180,  # 3분으로 증가
-    )
+        logger.info("[RUNTIME] 상시 연결 모드로 실행합니다 (단일 연결 유지)")
+        run_persistent(engine=engine)
+        return
 
-    scheduler.add_job(
-        job_wrapper,
-        trigger=night_trigger,
-        id="discord_bot_night",
-        max_instances=1,
-        coalesce=True,
-        misfire_grace_time=180,  # 3분으로 증가
-    )
+    if runtime_mode == "sharded":
+        logger.info("[RUNTIME] 샤드 모드로 실행합니다 (워커 프로세스별 샤드 연결)")
+        run_sharded(engine)
+        return
+
+    # APScheduler 설정
+    scheduler = create_scheduler()
 
     # 현재 시간에 따른 즉시 실행 처리
-    current_time = datetime.now(kst)
-    current_hour = current_time.hour
-    current_minute = current_time.minute
+    current_time = datetime.now(KST)
 
     # 봇 초기 실행 시 무조건 한번 업데이트 (사용자 요구사항)
     logger.info(
         f"[IMMEDIATE] 봇 초기 실행 - 현재 상태로 무조건 업데이트합니다 ({current_time.strftime('%H:%M')})"
     )
-
-    # 야간 시간대는 야간 모드로, 그 외는 일반 모드로 업데이트
-    if (
-        (current_hour == 22 and current_minute > 0)
-        or (current_hour > 22)
-        or current_hour < 7
-    ):
-        logger.info("[IMMEDIATE] 야간 시간대 - 야간 모드로 업데이트")
-        success = run_bot_night_mode()
-    else:
-        logger.info("[IMMEDIATE] 일반 시간대 - 일반 모드로 업데이트")
-        success = run_bot()
+    success = run_bot()
 
     if success:
         logger.info("[IMMEDIATE] 초기 업데이트 완료")
     else:
         logger.warning("[IMMEDIATE] 초기 업데이트 실패")
 
-    logger.info("[IMMEDIATE] 이제 스케줄러로 전환하여 효율성 체크가 적용됩니다")
-    print("-" * 50)
+    # 이후에는 다음 변경 시점마다 그 시점에 바뀌는 채널만 업데이트
+    schedule_next_transition(scheduler, get_registry(), current_time, job_wrapper)
+    # 설정 파일이 바뀌면 재시작 없이 바뀐 채널만 다시 반영
+    schedule_config_reload(scheduler, get_registry(), job_wrapper)
+    log_separator(logger)
 
     try:
         logger.info("[SCHEDULER] APScheduler 시작...")
-        logger.info(
-            "[SCHEDULER] 업무 시간: 매 10분마다, 야간 전환: 22:00, 정상 복구: 07:00"
-        )
         scheduler.start()
     except KeyboardInterrupt:
         logger.info("[STOP] 사용자에 의해 스케줄러가 중지되었습니다")
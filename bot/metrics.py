@@ -0,0 +1,383 @@
+import json
+import os
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from .utils import setup_logging
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+
+# 로깅 설정
+logger = setup_logging("discord_metrics")
+
+# 지연 시간용 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# 예정 시각 대비 지연용 히스토그램 구간 (초)
+DRIFT_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+# 서브프로세스가 부모 프로세스에 측정값을 넘길 때 쓰는 출력 줄 접두어
+SNAPSHOT_PREFIX = "[METRICS] "
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# /status에 JSON으로 표시할 상태 항목 {이름: 값을 반환하는 함수}
+STATUS_PROVIDERS = {}
+
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ""
+    return (
+        "{" + ",".join(f'{name}="{escape_label(value)}"' for name, value in pairs) + "}"
+    )
+
+
+def format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """증가만 하는 값 (라벨 값 조합별)"""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+
+    def inc(self, *label_values, amount=1.0):
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values):
+        return self._values.get(label_values, 0.0)
+
+    def samples(self):
+        for label_values, value in list(self._values.items()):
+            yield self.name, format_labels(self.labelnames, label_values), value
+
+    def snapshot(self):
+        return [[list(key), value] for key, value in list(self._values.items())]
+
+    def merge(self, data):
+        for key, value in data:
+            self.inc(*key, amount=value)
+
+    def clear(self):
+        self._values.clear()
+
+
+class Gauge(Counter):
+    """현재 값 - callback 지정 시 수집할 때마다 계산"""
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(), callback=None):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def set(self, value, *label_values):
+        self._values[label_values] = value
+
+    def samples(self):
+        if self.callback is not None:
+            self._values[()] = self.callback()
+        return super().samples()
+
+    def snapshot(self):
+        return []
+
+
+class Histogram:
+    """구간별 누적 개수와 합계를 보관하는 분포"""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+
+    def observe(self, value, *label_values):
+        entry = self._values.get(label_values)
+        if entry is None:
+            entry = self._values[label_values] = [[0] * len(self.buckets), 0.0, 0]
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            entry[0][index] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def count(self, *label_values):
+        entry = self._values.get(label_values)
+        return entry[2] if entry else 0
+
+    def samples(self):
+        for label_values, (counts, total, count) in list(self._values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield (
+                    f"{self.name}_bucket",
+                    format_labels(
+                        self.labelnames, label_values, [("le", format_value(bound))]
+                    ),
+                    cumulative,
+                )
+            yield (
+                f"{self.name}_bucket",
+                format_labels(self.labelnames, label_values, [("le", "+Inf")]),
+                count,
+            )
+            labels = format_labels(self.labelnames, label_values)
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+    def snapshot(self):
+        return [
+            [list(key), [list(counts), total, count]]
+            for key, (counts, total, count) in list(self._values.items())
+        ]
+
+    def merge(self, data):
+        for key, (counts, total, count) in data:
+            entry = self._values.setdefault(
+                tuple(key), [[0] * len(self.buckets), 0.0, 0]
+            )
+            entry[0] = [a + b for a, b in zip(entry[0], counts)]
+            entry[1] += total
+            entry[2] += count
+
+    def clear(self):
+        self._values.clear()
+
+
+class MetricsRegistry:
+    """측정값 모음 - Prometheus 텍스트 형식으로 출력"""
+
+    def __init__(self):
+        self.metrics = {}
+
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self):
+        """다른 프로세스로 넘길 수 있는 측정값 (게이지 제외)"""
+        return {
+            name: metric.snapshot()
+            for name, metric in self.metrics.items()
+            if metric.snapshot()
+        }
+
+    def merge(self, snapshot):
+        """다른 프로세스의 snapshot()을 현재 측정값에 더함"""
+        for name, data in snapshot.items():
+            metric = self.metrics.get(name)
+            if metric is not None:
+                metric.merge(data)
+
+    def reset(self):
+        """게이지를 제외한 측정값 초기화 (snapshot() 전달 후 변화량만 다시 모을 때 사용)"""
+        for metric in self.metrics.values():
+            if metric.kind != "gauge":
+                metric.clear()
+
+
+def process_rss_bytes():
+    """현재 프로세스의 상주 메모리(RSS) 바이트"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        # /proc이 없는 환경에서는 최대 RSS로 대체 (Linux: KiB 단위)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# 프로세스 공용 측정값
+METRICS = MetricsRegistry()
+
+TICK_DURATION = METRICS.register(
+    Histogram(
+        "discord_bot_tick_duration_seconds",
+        "채널 이름 업데이트 한 번(틱)의 소요 시간",
+    )
+)
+SCHEDULE_LAG = METRICS.register(
+    Histogram(
+        "discord_bot_schedule_lag_seconds",
+        "예정 시각 대비 스케줄러가 실제로 실행된 지연",
+        buckets=DRIFT_BUCKETS,
+    )
+)
+RENAME_DRIFT = METRICS.register(
+    Histogram(
+        "discord_bot_rename_drift_seconds",
+        "이름 기준 시각 대비 실제 이름 변경이 완료된 지연",
+        buckets=DRIFT_BUCKETS,
+    )
+)
+DISPATCH_DELAY = METRICS.register(
+    Histogram(
+        "discord_bot_dispatch_delay_seconds",
+        "이름 변경을 분산 구간과 초당 요청 예산 때문에 늦춰 보낸 시간",
+        buckets=DRIFT_BUCKETS,
+    )
+)
+PATCH_LATENCY = METRICS.register(
+    Histogram(
+        "discord_bot_patch_latency_seconds",
+        "채널별 이름 변경 요청(PATCH) 지연",
+        ("channel",),
+    )
+)
+CHANNEL_UPDATES = METRICS.register(
+    Counter(
+        "discord_bot_channel_updates_total",
+        "채널 업데이트 결과 수 (unchanged는 변경 없이 건너뜀)",
+        ("status",),
+    )
+)
+RATE_LIMITED = METRICS.register(
+    Counter(
+        "discord_bot_rate_limited_total",
+        "Discord가 돌려준 429 응답 수",
+        ("route",),
+    )
+)
+RETRY_AFTER = METRICS.register(
+    Counter(
+        "discord_bot_retry_after_seconds_total",
+        "429 응답의 retry_after 합계 (초)",
+        ("route",),
+    )
+)
+GATEWAY_SESSIONS = METRICS.register(
+    Counter(
+        "discord_bot_gateway_sessions_total",
+        "게이트웨이 연결 시작 방식 수 (identified: 새 세션, resumed: 저장된 세션 이어받음, invalidated: 저장된 세션 만료)",
+        ("result",),
+    )
+)
+TIME_COMMANDS = METRICS.register(
+    Counter(
+        "discord_bot_time_commands_total",
+        "/time 명령 응답 수 (hit: 이번 분에 만든 응답 재사용, miss: 이번 분의 응답을 새로 만듦)",
+        ("cache",),
+    )
+)
+LOOKUPS = METRICS.register(
+    Counter(
+        "discord_bot_lookups_total",
+        "공휴일/근무 상태 조회 수",
+        ("kind",),
+    )
+)
+METRICS.register(
+    Gauge(
+        "process_resident_memory_bytes",
+        "프로세스 상주 메모리(RSS) 바이트",
+        callback=process_rss_bytes,
+    )
+)
+
+
+def register_status(name, callback):
+    """/status 응답에 포함할 상태 항목 등록"""
+    STATUS_PROVIDERS[name] = callback
+
+
+def render_status():
+    """등록된 상태 항목을 JSON 문자열로 반환"""
+    status = {}
+    for name, callback in STATUS_PROVIDERS.items():
+        try:
+            status[name] = callback()
+        except Exception as e:
+            logger.warning(f"[WARNING] 상태 항목을 읽을 수 없습니다 ({name}): {e}")
+            status[name] = None
+    return json.dumps(status, ensure_ascii=False)
+
+
+def emit_snapshot():
+    """서브프로세스 종료 전 측정값을 표준 출력으로 전달 (부모가 merge_snapshot_line으로 합산)"""
+    print(SNAPSHOT_PREFIX + json.dumps(METRICS.snapshot()), flush=True)
+
+
+def merge_snapshot_line(line):
+    """측정값 출력 줄이면 합산 후 True 반환"""
+    if not line.startswith(SNAPSHOT_PREFIX):
+        return False
+    try:
+        METRICS.merge(json.loads(line[len(SNAPSHOT_PREFIX) :]))
+    except (ValueError, TypeError) as e:
+        logger.warning(f"[WARNING] 측정값을 읽을 수 없습니다: {e}")
+    return True
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/metrics":
+            body = METRICS.render().encode("utf-8")
+            content_type = CONTENT_TYPE
+        elif path == "/status":
+            body = render_status().encode("utf-8")
+            content_type = "application/json; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 수집 요청마다 로그를 남기지 않음
+        pass
+
+
+def start_metrics_server(port=None, host=None):
+    """METRICS_PORT가 지정되면 /metrics HTTP 서버를 백그라운드 스레드로 시작"""
+    port = int(port if port is not None else os.getenv("METRICS_PORT", "0") or 0)
+    if not port:
+        return None
+    host = host or os.getenv("METRICS_HOST", "127.0.0.1")
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, name="metrics-server", daemon=True
+    )
+    thread.start()
+    logger.info(
+        f"[METRICS] http://{host}:{server.server_port}/metrics 에서 측정값, /status 에서 상태 제공"
+    )
+    return server
@@ -0,0 +1,588 @@
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+
+import pytz
+
+try:
+    from .utils import setup_logging
+    from .profiles import MINUTES_PER_DAY, STATUS_BOUNDARIES, STATUS_TABLES
+    from .render import EPOCH_ORDINAL, SECONDS_PER_DAY, get_offset_cache, local_date
+    from .registry import get_registry
+    from .schedule import next_class_change_time
+    from .updater import (
+        day_text_status,
+        get_holiday_info,
+        is_night_hour,
+        night_window,
+        render_night_name,
+    )
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+    from profiles import MINUTES_PER_DAY, STATUS_BOUNDARIES, STATUS_TABLES
+    from render import EPOCH_ORDINAL, SECONDS_PER_DAY, get_offset_cache, local_date
+    from registry import get_registry
+    from schedule import next_class_change_time
+    from updater import (
+        day_text_status,
+        get_holiday_info,
+        is_night_hour,
+        night_window,
+        render_night_name,
+    )
+
+# 로깅 설정
+logger = setup_logging("discord_plan")
+
+KST = pytz.timezone("Asia/Seoul")
+
+# 계획 형식 버전 - 이름 결정 규칙이 바뀌면 올려서 디스크 캐시를 무효화
+PLAN_VERSION = 3
+
+# 컴파일한 계획 캐시 기본 위치 (RENAME_PLAN_DIR로 변경)
+DEFAULT_PLAN_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "plans"
+)
+
+# 스케줄러가 한 번에 컴파일하는 일 수 (RENAME_PLAN_DAYS로 변경)
+DEFAULT_PLAN_DAYS = 2
+
+# 계획 캐시에 남겨 둘 최근 계획 파일 수 (RENAME_PLAN_KEEP으로 변경)
+DEFAULT_PLAN_KEEP = 8
+
+# 야간 모드 상태 (채널별 야간 문구는 펼칠 때 적용)
+NIGHT_STATE = ("night",)
+
+
+def local_midnight(offsets, day_ordinal):
+    """시간대 오프셋 캐시 기준 현지 날짜의 자정 UTC 타임스탬프"""
+    base = (day_ordinal - EPOCH_ORDINAL) * SECONDS_PER_DAY
+    midnight = base - offsets.offset_at(base)
+    # 자정 직전에 오프셋이 바뀌는 날은 바뀐 오프셋으로 한 번 더 보정
+    return base - offsets.offset_at(midnight)
+
+
+def local_instant(offsets, midnight, minute):
+    """현지 자정(UTC 타임스탬프)으로부터 현지 시각 minute분의 UTC 타임스탬프
+
+    서머타임이 바뀌는 날에는 자정의 오프셋과 그 시각의 오프셋이 다르므로 다시 보정합니다.
+    """
+    instant = midnight + minute * 60
+    shift = offsets.offset_at(midnight) - offsets.offset_at(instant)
+    if shift:
+        instant += shift
+    return instant
+
+
+def compile_class(info, start_ts, end_ts):
+    """스케줄 클래스 하나의 [start_ts, end_ts) 구간 상태 변경 목록 [(시각, 상태)]
+
+    후보 시각(현지 자정, 갱신 간격, 근무 상태 경계, 현지 야간 시작/종료)마다 상태를 계산하고
+    직전과 달라진 시각만 남깁니다. 상태는 채널별 이모지/형식을 뺀 (문구, 상태 이모지)입니다.
+    """
+    offsets = get_offset_cache(info["tz"])
+    _, night_start, night_end = night_window(info)
+    calendar = info["calendar"]
+    profile = info["profile"]
+
+    day_minutes = sorted(
+        {0}
+        | set(range(0, MINUTES_PER_DAY, info["interval"]))
+        | set(STATUS_BOUNDARIES[profile])
+    )
+    first_day, _ = offsets.local_day_minute(start_ts)
+    last_day, _ = offsets.local_day_minute(end_ts)
+
+    # 공휴일/주말은 하루에 한 번만 조회하고, 휴일에는 자정만 후보로 사용
+    holidays = {}
+    candidates = {start_ts}
+    for day in range(first_day, last_day + 1):
+        holiday = holidays[day] = get_holiday_info(local_date(day), calendar)
+        midnight = local_midnight(offsets, day)
+        minutes = (0,) if holiday[0] else day_minutes
+        candidates.update(local_instant(offsets, midnight, m) for m in minutes)
+        candidates.add(local_instant(offsets, midnight, night_start * 60))
+        candidates.add(local_instant(offsets, midnight, night_end * 60))
+
+    changes = []
+    previous = None
+    for instant in sorted(c for c in candidates if start_ts <= c < end_ts):
+        day, minute = offsets.local_day_minute(instant)
+        if is_night_hour(minute // 60, night_start, night_end):
+            state = NIGHT_STATE
+        else:
+            holiday = holidays.get(day)
+            if holiday is None:
+                holiday = get_holiday_info(local_date(day), calendar)
+            state = day_text_status(holiday, profile, minute)
+        if state != previous:
+            changes.append((instant, state))
+            previous = state
+    return changes
+
+
+def expand_name(channel, state):
+    """채널 설정과 상태로 채널 이름 생성 (render_channel_name과 같은 결과)"""
+    if state == NIGHT_STATE:
+        return render_night_name(
+            channel["region"],
+            channel["emoji"],
+            channel["template"],
+            channel.get("night_text"),
+        )
+    text, status = state
+    return channel["template"].format(emoji=channel["emoji"], text=text, status=status)
+
+
+def plan_fingerprint(registry, start_ts, end_ts):
+    """계획 결과를 결정하는 입력(레지스트리, 근무 시간 프로필, 구간 내 공휴일)의 해시"""
+    digest = hashlib.sha256()
+    digest.update(f"{PLAN_VERSION}:{start_ts}:{end_ts}".encode())
+    records = sorted(registry.channels.values(), key=lambda record: record["id"])
+    digest.update(json.dumps(records, sort_keys=True, ensure_ascii=False).encode())
+    for profile in sorted({record["profile"] for record in records}):
+        digest.update(profile.encode() + STATUS_TABLES[profile])
+
+    first = datetime.fromtimestamp(start_ts, pytz.utc).date() - timedelta(days=1)
+    last = datetime.fromtimestamp(end_ts, pytz.utc).date() + timedelta(days=1)
+    for calendar in sorted({record["calendar"] for record in records}):
+        day = first
+        while day <= last:
+            digest.update(repr(get_holiday_info(day, calendar)).encode())
+            day += timedelta(days=1)
+    return digest.hexdigest()[:16]
+
+
+class RenamePlan:
+    """구간 내 모든 채널의 (시각, 채널 ID, 새 이름) 계획
+
+    스케줄 클래스마다 상태가 바뀌는 시각과 상태만 보관하고, 채널별 이름은
+    필요할 때 채널 설정(이모지, 형식, 야간 문구)으로 펼칩니다.
+    """
+
+    def __init__(self, start, end, states, classes, channels, fingerprint=None):
+        self.start = start
+        self.end = end
+        self.fingerprint = fingerprint
+        # 상태 목록 (클래스 타임라인은 이 목록의 번호를 가리킴)
+        self.states = states
+        # [{"members": [채널 ID], "instants": [시각], "states": [상태 번호]}]
+        self.classes = classes
+        # {채널 ID: {"region", "emoji", "template", "night_text"}}
+        self.channels = channels
+        self.reindex()
+
+    def reindex(self):
+        """채널 ID별 클래스 번호 색인 다시 생성 (클래스 목록을 바꾼 뒤 호출)"""
+        self.class_by_channel = {
+            channel_id: index
+            for index, entry in enumerate(self.classes)
+            for channel_id in entry["members"]
+        }
+
+    def __len__(self):
+        """전체 이름 변경 수 (채널 기준)"""
+        return sum(
+            len(entry["instants"]) * len(entry["members"]) for entry in self.classes
+        )
+
+    def covers(self, instant):
+        return self.start <= instant < self.end
+
+    def next_instant(self, channel_id, after):
+        """after(타임스탬프) 이후 채널 이름이 바뀌는 첫 시각 (계획 구간 밖이면 None)"""
+        entry = self.classes[self.class_by_channel[channel_id]]
+        index = bisect_right(entry["instants"], after)
+        if index < len(entry["instants"]):
+            return entry["instants"][index]
+        return None
+
+    def name_at(self, channel_id, instant):
+        """instant(타임스탬프) 시점에 채널에 표시할 이름"""
+        entry = self.classes[self.class_by_channel[channel_id]]
+        index = bisect_right(entry["instants"], instant) - 1
+        if index < 0:
+            raise ValueError(f"계획 구간 밖의 시각입니다: {instant}")
+        return expand_name(
+            self.channels[channel_id], self.states[entry["states"][index]]
+        )
+
+    def class_entries(self, entry, start, end):
+        lo = bisect_left(entry["instants"], start)
+        hi = bisect_left(entry["instants"], end)
+        for instant, state_index in zip(
+            entry["instants"][lo:hi], entry["states"][lo:hi]
+        ):
+            state = self.states[state_index]
+            for channel_id in entry["members"]:
+                yield instant, channel_id, expand_name(self.channels[channel_id], state)
+
+    def entries(self, start=None, end=None):
+        """[start, end) 구간의 (시각, 채널 ID, 새 이름)을 시각 순서로 생성"""
+        start = self.start if start is None else start
+        end = self.end if end is None else end
+        return heapq.merge(
+            *(self.class_entries(entry, start, end) for entry in self.classes)
+        )
+
+    def to_dict(self):
+        return {
+            "version": PLAN_VERSION,
+            "fingerprint": self.fingerprint,
+            "start": self.start,
+            "end": self.end,
+            "states": [list(state) for state in self.states],
+            "classes": [
+                {
+                    "members": entry["members"],
+                    # 시각은 직전 시각과의 차이로 저장 (대부분 갱신 간격과 같아 파일이 작아짐)
+                    "deltas": [
+                        b - a
+                        for a, b in zip(
+                            [self.start] + entry["instants"][:-1], entry["instants"]
+                        )
+                    ],
+                    "states": entry["states"],
+                }
+                for entry in self.classes
+            ],
+            "channels": {
+                str(channel_id): channel
+                for channel_id, channel in sorted(self.channels.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != PLAN_VERSION:
+            raise ValueError(f"지원하지 않는 계획 버전입니다: {data.get('version')}")
+        classes = []
+        for entry in data["classes"]:
+            instants = []
+            instant = data["start"]
+            for delta in entry["deltas"]:
+                instant += delta
+                instants.append(instant)
+            classes.append(
+                {
+                    "members": entry["members"],
+                    "instants": instants,
+                    "states": entry["states"],
+                }
+            )
+        return cls(
+            data["start"],
+            data["end"],
+            [tuple(state) for state in data["states"]],
+            classes,
+            {int(channel_id): channel for channel_id, channel in data["channels"].items()},
+            data.get("fingerprint"),
+        )
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def write_text(self, f, start=None, end=None):
+        """한 줄에 한 변경씩 텍스트로 출력 (diff 도구로 비교 가능)"""
+        for instant, channel_id, name in self.entries(start, end):
+            moment = datetime.fromtimestamp(instant, KST).isoformat()
+            f.write(f"{moment}\t{channel_id}\t{name}\n")
+
+
+def intern_states(changes, states, state_ids):
+    """상태 변경 목록의 상태를 상태 목록 번호로 바꾼 클래스 타임라인 (instants, states)"""
+    indices = []
+    for _, state in changes:
+        index = state_ids.get(state)
+        if index is None:
+            index = state_ids[state] = len(states)
+            states.append(state)
+        indices.append(index)
+    return [instant for instant, _ in changes], indices
+
+
+def plan_channel(record):
+    """계획에 보관하는 채널별 이름 펼치기 정보"""
+    channel = {
+        "region": record["region"],
+        "emoji": record["emoji"],
+        "template": record["template"],
+    }
+    if record.get("night_text"):
+        channel["night_text"] = record["night_text"]
+    return channel
+
+
+def compile_plan(registry, start, end):
+    """[start, end) 구간(aware datetime)의 레지스트리 전체 이름 변경 계획 컴파일"""
+    start_ts = int(start.timestamp())
+    end_ts = int(end.timestamp())
+    state_ids = {}
+    states = []
+    classes = []
+    for members in registry.by_class.values():
+        changes = compile_class(registry[members[0]], start_ts, end_ts)
+        instants, indices = intern_states(changes, states, state_ids)
+        classes.append(
+            {
+                "members": [registry[key]["id"] for key in members],
+                "instants": instants,
+                "states": indices,
+            }
+        )
+
+    channels = {
+        record["id"]: plan_channel(record) for record in registry.channels.values()
+    }
+
+    return RenamePlan(
+        start_ts,
+        end_ts,
+        states,
+        classes,
+        channels,
+        plan_fingerprint(registry, start_ts, end_ts),
+    )
+
+
+def patch_plan(plan, registry, stale=(), moved=()):
+    """레지스트리가 바뀐 뒤 필요한 스케줄 클래스만 다시 컴파일해 계획을 제자리에서 갱신
+
+    stale은 타임라인이 달라진 클래스 키(근무 시간/공휴일 표시 변경), moved는 새로 추가되었거나
+    클래스가 바뀐 채널 ID입니다. 클래스에 그대로 남은 채널이 있으면 그 채널의 기존 타임라인을
+    재사용하고, 없거나 stale이면 그 클래스만 컴파일합니다. 다시 컴파일한 클래스 수를 반환합니다.
+    """
+    state_ids = {state: index for index, state in enumerate(plan.states)}
+    classes = []
+    compiled = 0
+    for class_key, members in registry.by_class.items():
+        ids = [registry[key]["id"] for key in members]
+        previous = None
+        if class_key not in stale:
+            previous = next(
+                (
+                    plan.classes[plan.class_by_channel[channel_id]]
+                    for channel_id in ids
+                    if channel_id not in moved and channel_id in plan.class_by_channel
+                ),
+                None,
+            )
+        if previous is None:
+            changes = compile_class(registry[members[0]], plan.start, plan.end)
+            instants, indices = intern_states(changes, plan.states, state_ids)
+            compiled += 1
+        else:
+            instants, indices = previous["instants"], previous["states"]
+        classes.append({"members": ids, "instants": instants, "states": indices})
+
+    plan.classes = classes
+    plan.channels = {
+        record["id"]: plan_channel(record) for record in registry.channels.values()
+    }
+    plan.reindex()
+    plan.fingerprint = plan_fingerprint(registry, plan.start, plan.end)
+    return compiled
+
+
+def day_range(first_day, days):
+    """한국 시간 기준 first_day 자정부터 days일 구간 (start, end)"""
+    start = KST.localize(datetime.combine(first_day, datetime.min.time()))
+    end = KST.localize(
+        datetime.combine(first_day + timedelta(days=days), datetime.min.time())
+    )
+    return start, end
+
+
+def prune_plan_cache(plan_dir, keep=None):
+    """계획 캐시에서 최근에 쓰거나 읽은 keep개 파일만 남기고 삭제 후 삭제한 수 반환"""
+    if keep is None:
+        keep = int(os.getenv("RENAME_PLAN_KEEP", DEFAULT_PLAN_KEEP))
+    paths = []
+    for entry in os.scandir(plan_dir):
+        if entry.name.endswith(".json") and entry.is_file():
+            paths.append((entry.stat().st_mtime_ns, entry.path))
+    paths.sort(reverse=True)
+    removed = 0
+    for _, path in paths[max(keep, 1) :]:
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def load_or_compile(registry, first_day, days=1, plan_dir=None):
+    """디스크 캐시에 같은 입력의 계획이 있으면 읽고, 없으면 컴파일 후 저장"""
+    plan_dir = plan_dir or os.getenv("RENAME_PLAN_DIR", DEFAULT_PLAN_DIR)
+    start, end = day_range(first_day, days)
+    fingerprint = plan_fingerprint(
+        registry, int(start.timestamp()), int(end.timestamp())
+    )
+    path = os.path.join(plan_dir, f"{first_day.isoformat()}-{days}d-{fingerprint}.json")
+
+    if os.path.exists(path):
+        try:
+            plan = RenamePlan.load(path)
+            # 다시 쓴 계획은 정리 대상에서 가장 최근 파일로 취급
+            os.utime(path)
+            return plan
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"[PLAN] 계획 캐시를 읽을 수 없어 다시 컴파일합니다: {e}")
+
+    started = time.perf_counter()
+    plan = compile_plan(registry, start, end)
+    logger.info(
+        f"[PLAN] {first_day.isoformat()}부터 {days}일 계획 컴파일 - 변경 {len(plan):,}건 ({time.perf_counter() - started:.3f}초)"
+    )
+    try:
+        plan.save(path)
+        # 날짜가 바뀌거나 설정을 다시 읽을 때마다 파일이 쌓이지 않도록 오래된 계획 삭제
+        prune_plan_cache(plan_dir)
+    except OSError as e:
+        logger.warning(f"[PLAN] 계획 캐시를 저장할 수 없습니다: {e}")
+    return plan
+
+
+def diff_plans(old, new):
+    """두 계획의 차이 [(시각, 채널 ID, 이전 이름, 새 이름)] - 한쪽에만 있으면 None"""
+    old_entries = {(instant, channel_id): name for instant, channel_id, name in old.entries()}
+    new_entries = {(instant, channel_id): name for instant, channel_id, name in new.entries()}
+    changes = []
+    for key in sorted(old_entries.keys() | new_entries.keys()):
+        before = old_entries.get(key)
+        after = new_entries.get(key)
+        if before != after:
+            changes.append((key[0], key[1], before, after))
+    return changes
+
+
+def get_plan_days():
+    """스케줄러가 한 번에 컴파일하는 일 수"""
+    return int(os.getenv("RENAME_PLAN_DAYS", DEFAULT_PLAN_DAYS))
+
+
+_PLAN = None
+_PLAN_REGISTRY = None
+
+
+def get_rename_plan(registry, now):
+    """now를 포함하는 프로세스 공용 계획 (구간 마지막 날에 들어서면 다음 구간으로 교체)"""
+    global _PLAN, _PLAN_REGISTRY
+    instant = now.timestamp()
+    if (
+        _PLAN is None
+        or _PLAN_REGISTRY is not registry
+        or len(_PLAN.channels) != len(registry)
+        or not _PLAN.covers(instant)
+        or (
+            _PLAN.end - _PLAN.start > SECONDS_PER_DAY
+            and instant >= _PLAN.end - SECONDS_PER_DAY
+        )
+    ):
+        _PLAN = load_or_compile(registry, now.astimezone(KST).date(), get_plan_days())
+        _PLAN_REGISTRY = registry
+    return _PLAN
+
+
+def refresh_rename_plan(registry, stale=(), moved=()):
+    """설정이 다시 로드되면 프로세스 공용 계획에서 바뀐 클래스만 다시 컴파일 (계획이 없으면 다음 조회 때 컴파일)"""
+    if _PLAN is None or _PLAN_REGISTRY is not registry:
+        return 0
+    started = time.perf_counter()
+    compiled = patch_plan(_PLAN, registry, stale, moved)
+    logger.info(
+        f"[PLAN] 설정 변경으로 스케줄 클래스 {compiled}/{len(registry.by_class)}개만 다시 컴파일 ({time.perf_counter() - started:.3f}초)"
+    )
+    return compiled
+
+
+def plan_names(registry, keys, now):
+    """컴파일된 계획에서 now 시점의 채널별 이름 조회"""
+    plan = get_rename_plan(registry, now)
+    instant = now.timestamp()
+    return {key: plan.name_at(registry[key]["id"], instant) for key in keys}
+
+
+def next_plan_instant(registry, class_key, now):
+    """계획에서 스케줄 클래스의 다음 변경 시점 조회 (계획 밖이면 직접 계산)"""
+    members = registry.by_class.get(class_key)
+    if not members:
+        return None
+    plan = get_rename_plan(registry, now)
+    instant = plan.next_instant(registry[members[0]]["id"], now.timestamp())
+    if instant is None:
+        return next_class_change_time(registry, class_key, now)
+    return datetime.fromtimestamp(instant, pytz.utc)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m bot.plan",
+        description="채널 이름 변경 계획 컴파일/출력/비교",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="계획 컴파일 후 저장")
+    build.add_argument("--start", type=date.fromisoformat, help="시작 날짜 (기본 오늘)")
+    build.add_argument("--days", type=int, default=1, help="일 수")
+    build.add_argument("--output", help="저장 경로 (기본 캐시 디렉터리)")
+    build.add_argument(
+        "--text", action="store_true", help="변경 목록을 텍스트로 출력"
+    )
+
+    diff = subparsers.add_parser("diff", help="저장된 두 계획 비교")
+    diff.add_argument("old")
+    diff.add_argument("new")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """python -m bot.plan build [--start 날짜] [--days N] [--output 경로] [--text]
+    python -m bot.plan diff 이전.json 새.json"""
+    options = parse_args(argv)
+
+    if options.command == "diff":
+        changes = diff_plans(RenamePlan.load(options.old), RenamePlan.load(options.new))
+        for instant, channel_id, before, after in changes:
+            moment = datetime.fromtimestamp(instant, KST).isoformat()
+            print(f"{moment}\t{channel_id}\t{before or '-'} -> {after or '-'}")
+        logger.info(f"[PLAN] 차이 {len(changes)}건")
+        return 1 if changes else 0
+
+    registry = get_registry()
+    first_day = options.start or datetime.now(KST).date()
+    if options.output:
+        start, end = day_range(first_day, options.days)
+        started = time.perf_counter()
+        plan = compile_plan(registry, start, end)
+        logger.info(
+            f"[PLAN] {len(registry)}개 채널, {options.days}일 계획 컴파일 - 변경 {len(plan):,}건 ({time.perf_counter() - started:.3f}초)"
+        )
+        plan.save(options.output)
+    else:
+        plan = load_or_compile(registry, first_day, options.days)
+
+    if options.text:
+        plan.write_text(sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+from bisect import bisect_right
+
+import pytz
+
+# 하루 분 수 (00:00 ~ 23:59)
+MINUTES_PER_DAY = 1440
+
+# 근무 상태 코드 - 테이블에는 1바이트 코드로 저장
+STATUS_OFF = 0  # 출근 전/퇴근 후 (연락 불가)
+STATUS_WORK = 1  # 업무 중 (연락 가능)
+STATUS_LUNCH = 2  # 점심 시간 (연락 불가)
+
+STATUS_CODES = {"off": STATUS_OFF, "work": STATUS_WORK, "lunch": STATUS_LUNCH}
+STATUS_EMOJIS = ("🏠", "💼", "🍜")
+
+# 지역별 근무 시간 프로필 (현지 시간 기준 [시작, 종료) 구간, 나머지 시간은 off)
+WORKING_HOURS = {
+    "SEOUL": [
+        ("09:30", "11:30", "work"),
+        ("11:30", "12:30", "lunch"),
+        ("12:30", "18:30", "work"),
+    ],
+    "HCMC": [
+        ("08:30", "12:00", "work"),
+        ("12:00", "13:30", "lunch"),
+        ("13:30", "17:30", "work"),
+    ],
+}
+
+
+def parse_minute(value):
+    """HH:MM 형식 문자열을 하루 중 분(0~1440)으로 변환"""
+    hour, minute = (int(part) for part in value.split(":"))
+    minute_of_day = hour * 60 + minute
+    if not 0 <= minute_of_day <= MINUTES_PER_DAY or not 0 <= minute < 60:
+        raise ValueError(f"잘못된 시간 형식입니다: {value}")
+    return minute_of_day
+
+
+def compile_profile(periods):
+    """근무 시간 구간 목록을 1440칸 상태 코드 테이블(bytes)로 컴파일"""
+    table = bytearray(MINUTES_PER_DAY)
+    for start, end, status in periods:
+        if status not in STATUS_CODES:
+            raise ValueError(f"알 수 없는 근무 상태입니다: {status}")
+        start_minute = parse_minute(start)
+        end_minute = parse_minute(end)
+        if end_minute <= start_minute:
+            raise ValueError(f"종료 시간이 시작 시간보다 빠릅니다: {start}-{end}")
+        table[start_minute:end_minute] = bytes([STATUS_CODES[status]]) * (
+            end_minute - start_minute
+        )
+    return bytes(table)
+
+
+def find_boundaries(table):
+    """상태 코드가 바뀌는 분 목록 (해당 분부터 새 상태)"""
+    return [
+        minute
+        for minute in range(1, MINUTES_PER_DAY)
+        if table[minute] != table[minute - 1]
+    ]
+
+
+# 시작 시 한 번 컴파일한 지역별 상태 테이블과 경계 목록
+STATUS_TABLES = {}
+STATUS_BOUNDARIES = {}
+
+
+def register_profile(profile, periods, table=None):
+    """근무 시간 프로필을 컴파일해 등록 (새 지역은 코드 변경 없이 데이터로 추가, table 지정 시 그대로 사용)"""
+    if table is None:
+        table = compile_profile(periods)
+    STATUS_TABLES[profile] = table
+    STATUS_BOUNDARIES[profile] = find_boundaries(table)
+    return table
+
+
+for _profile, _periods in WORKING_HOURS.items():
+    register_profile(_profile, _periods)
+
+
+def get_status_table(profile):
+    """프로필의 하루 전체 상태 코드 테이블 (1440바이트)"""
+    try:
+        return STATUS_TABLES[profile]
+    except KeyError:
+        raise ValueError(f"알 수 없는 근무 시간 프로필입니다: {profile}") from None
+
+
+def get_status_code(profile, minute_of_day):
+    """하루 중 분에 해당하는 상태 코드 (O(1) 조회)"""
+    return get_status_table(profile)[minute_of_day]
+
+
+def get_status_emoji(profile, local_now):
+    """현지 시간 기준 상태 이모지"""
+    return STATUS_EMOJIS[
+        get_status_code(profile, local_now.hour * 60 + local_now.minute)
+    ]
+
+
+def next_status_boundary(profile, minute_of_day):
+    """minute_of_day 이후 같은 날 상태가 처음 바뀌는 분 (없으면 None)"""
+    boundaries = STATUS_BOUNDARIES[profile]
+    index = bisect_right(boundaries, minute_of_day)
+    if index < len(boundaries):
+        return boundaries[index]
+    return None
+
+
+def day_status_emojis(profile):
+    """하루 전체(1440분)의 상태 이모지 목록"""
+    return [STATUS_EMOJIS[code] for code in get_status_table(profile)]
+
+
+def bulk_status_codes(channels, now):
+    """여러 채널의 상태 코드를 한 번에 조회 (시간대별 현지 분은 한 번만 계산)
+
+    channels는 {키: {"tz": ..., "profile": ...}} 형식이며 profile이 없으면 키를 프로필로 사용합니다.
+    """
+    minutes_by_tz = {}
+    statuses = {}
+    for key, info in channels.items():
+        tz_name = info["tz"]
+        minute_of_day = minutes_by_tz.get(tz_name)
+        if minute_of_day is None:
+            local_now = now.astimezone(pytz.timezone(tz_name))
+            minute_of_day = local_now.hour * 60 + local_now.minute
+            minutes_by_tz[tz_name] = minute_of_day
+        statuses[key] = get_status_code(info.get("profile", key), minute_of_day)
+    return statuses
@@ -0,0 +1,179 @@
+import asyncio
+import os
+import time
+from collections import deque
+
+# Discord 채널 이름 변경 제한: 채널당 10분에 2회
+CHANNEL_RENAME_LIMIT = 2
+CHANNEL_RENAME_PERIOD = 600.0
+
+# 이름 변경 요청의 초당 전체 예산 - Discord 전역 제한(초당 50회)보다 낮게 잡음 (RENAME_RPS로 변경, 0이면 무제한)
+DEFAULT_RENAME_RPS = 40.0
+
+# 같은 시점에 바뀌는 이름 변경을 나눠 보내는 최대 구간 (초)
+MAX_SPREAD_WINDOW = 300.0
+
+# 분산 구간 중 표시 값이 크게 바뀐 채널에 배정하는 앞부분 비율
+PRIORITY_SHARE = 0.25
+
+
+class RenameBuckets:
+    """채널별 이름 변경 횟수를 추적하는 슬라이딩 윈도우 버킷"""
+
+    def __init__(
+        self,
+        limit=CHANNEL_RENAME_LIMIT,
+        period=CHANNEL_RENAME_PERIOD,
+        clock=time.monotonic,
+    ):
+        self.limit = limit
+        self.period = period
+        self.clock = clock
+        self._history = {}
+        self._blocked_until = {}
+
+    def _prune(self, key, now):
+        history = self._history.get(key)
+        if history is None:
+            return None
+        while history and now - history[0] >= self.period:
+            history.popleft()
+        return history
+
+    def acquire(self, key):
+        """요청 가능하면 기록 후 0 반환, 불가능하면 남은 대기 시간(초) 반환"""
+        now = self.clock()
+
+        blocked_until = self._blocked_until.get(key, 0.0)
+        if blocked_until > now:
+            return blocked_until - now
+
+        history = self._prune(key, now)
+        if history is None:
+            history = self._history[key] = deque()
+        if len(history) >= self.limit:
+            return history[0] + self.period - now
+
+        history.append(now)
+        return 0.0
+
+    def release(self, key):
+        """요청이 적용되지 않았을 때 마지막 기록을 되돌림"""
+        history = self._history.get(key)
+        if history:
+            history.pop()
+
+    def block(self, key, retry_after):
+        """Discord가 알려준 retry_after 동안 해당 채널 요청 차단"""
+        self._blocked_until[key] = self.clock() + retry_after
+
+    def clear(self):
+        """모든 채널의 기록과 차단 상태 초기화"""
+        self._history.clear()
+        self._blocked_until.clear()
+
+    def remaining(self, key):
+        """현재 윈도우에서 남은 요청 가능 횟수"""
+        now = self.clock()
+        if self._blocked_until.get(key, 0.0) > now:
+            return 0
+        history = self._prune(key, now)
+        return self.limit - len(history or ())
+
+
+class RequestBudget:
+    """초당 요청 수 예산 (GCRA) - 요청마다 허용 시각을 예약하고 그때까지 기다려 고르게 보냄
+
+    rate가 0 또는 None이면 제한하지 않습니다. burst만큼은 기다리지 않고 바로 보낼 수 있습니다.
+    """
+
+    def __init__(self, rate, burst=1, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        # 다음 요청의 이론적 도착 시각 (theoretical arrival time)
+        self._tat = 0.0
+
+    def reserve(self):
+        """요청 하나의 허용 시각을 예약하고 그때까지 기다려야 하는 시간(초) 반환"""
+        if not self.rate:
+            return 0.0
+        interval = 1.0 / self.rate
+        now = self.clock()
+        self._tat = max(self._tat, now) + interval
+        return max(self._tat - now - self.burst * interval, 0.0)
+
+    async def acquire(self):
+        """허용 시각까지 대기 후 기다린 시간(초) 반환"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def reset(self):
+        self._tat = 0.0
+
+
+def get_rename_rps():
+    """이름 변경 요청의 초당 예산 (RENAME_RPS 환경변수, 기본 40)"""
+    return float(os.getenv("RENAME_RPS", DEFAULT_RENAME_RPS))
+
+
+def get_spread_limit():
+    """분산 구간 상한 (초) - 실행 제한 시간이 있는 실행 방식은 RENAME_SPREAD_LIMIT로 낮춤"""
+    return min(
+        float(os.getenv("RENAME_SPREAD_LIMIT", MAX_SPREAD_WINDOW)), MAX_SPREAD_WINDOW
+    )
+
+
+def get_spread_window(count, rate=None):
+    """count개 채널이 같은 시점에 바뀔 때 나눠 보낼 구간 (초)
+
+    RENAME_SPREAD_WINDOW 환경변수가 있으면 그 값을, 없으면 예산(rate) 안에서 보내는 데
+    걸리는 시간을 사용합니다 (예산 안에 모두 보낼 수 있으면 0). 최대 get_spread_limit()초입니다.
+    """
+    limit = get_spread_limit()
+    window = os.getenv("RENAME_SPREAD_WINDOW")
+    if window is not None:
+        return min(float(window), limit)
+    if rate is None:
+        rate = get_rename_rps()
+    if not rate or count <= rate:
+        return 0.0
+    return min(count / rate, limit)
+
+
+def channel_offset(channel_id):
+    """채널 ID로 정한 [0, 1) 범위의 고정 위치 (프로세스/실행이 달라도 같은 값)"""
+    # 피보나치 해싱 - 연속된 ID도 고르게 퍼짐
+    return ((channel_id * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) / 2**64
+
+
+def is_major_change(old_name, new_name):
+    """시계 숫자 외의 표시 값(근무 상태, 공휴일, 야간 문구)이 바뀌었는지 여부 (이전 이름을 모르면 True)"""
+    if old_name is None or len(old_name) != len(new_name):
+        return True
+    return any(
+        a != b and not (a.isdigit() and b.isdigit()) for a, b in zip(old_name, new_name)
+    )
+
+
+def spread_delay(channel_id, old_name, new_name, window):
+    """분산 구간 안에서 채널의 이름 변경을 보낼 시각 (구간 시작부터 초)
+
+    근무 상태/공휴일/야간 문구가 바뀐 이름은 앞부분(PRIORITY_SHARE)에, 시계 숫자만 바뀐 이름은
+    나머지 구간에 채널 ID로 정한 고정 위치에 배정하므로 같은 채널은 항상 비슷한 시각에 바뀝니다.
+    """
+    if window <= 0:
+        return 0.0
+    offset = channel_offset(channel_id)
+    if is_major_change(old_name, new_name):
+        return window * PRIORITY_SHARE * offset
+    return window * (PRIORITY_SHARE + (1 - PRIORITY_SHARE) * offset)
+
+
+# 프로세스 전체에서 공유하는 채널 이름 변경 버킷 (상시 연결 모드에서 실행 간 유지)
+RENAME_BUCKETS = RenameBuckets()
+
+# 프로세스 전체에서 공유하는 이름 변경 요청 예산 (샤드 워커는 맡은 샤드 비율만큼 나눠 가짐)
+RENAME_BUDGET = RequestBudget(get_rename_rps())
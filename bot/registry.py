@@ -0,0 +1,269 @@
+import json
+import os
+import sqlite3
+
+import pytz
+
+try:
+    from .utils import setup_logging
+    from .profiles import STATUS_TABLES
+    from .settings import ensure_settings
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+    from profiles import STATUS_TABLES
+    from settings import ensure_settings
+
+# 로깅 설정
+logger = setup_logging("discord_registry")
+
+# 기본 채널 설정 (CHANNEL_REGISTRY 미지정 시 사용)
+DEFAULT_CHANNELS = {
+    "SEOUL": {
+        "id": 1384147639293055036,
+        "tz": "Asia/Seoul",
+        "emoji": "🇰🇷",
+        "name": "서울",
+        "profile": "SEOUL",  # 근무 시간 프로필 (profiles.WORKING_HOURS)
+    },
+    "HCMC": {
+        "id": 1384147698747445401,
+        "tz": "Asia/Ho_Chi_Minh",
+        "emoji": "🇻🇳",
+        "name": "호치민",
+        "profile": "HCMC",
+    },
+}
+
+# 지역별 공휴일 달력 국가 코드
+REGION_CALENDARS = {
+    "SEOUL": "KR",
+    "HCMC": "VN",
+}
+
+# 채널 이름 형식 기본값 - Discord 호환을 위해 | 대신 ∥(double vertical line) 사용
+DEFAULT_TEMPLATE = "{emoji}∥{text}-{status}"
+
+# 평일 시간 표시 갱신 간격 기본값 (분)
+DEFAULT_INTERVAL = 10
+
+# 야간(수면) 시간 기본값 - 채널 시간대 기준 현지 시각 (22:00 ~ 07:00)
+DEFAULT_NIGHT_START = 22
+DEFAULT_NIGHT_END = 7
+
+# SQLite 레지스트리 테이블 구조
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS channels (
+    id INTEGER PRIMARY KEY,
+    guild_id INTEGER,
+    name TEXT NOT NULL,
+    tz TEXT NOT NULL,
+    calendar TEXT,
+    emoji TEXT NOT NULL,
+    profile TEXT,
+    region TEXT,
+    template TEXT,
+    interval INTEGER,
+    night_start INTEGER,
+    night_end INTEGER
+)
+"""
+
+
+def normalize_channel(key, entry):
+    """채널 설정의 누락 값을 채우고 검증한 레코드 반환"""
+    missing = [field for field in ("id", "tz", "emoji") if entry.get(field) is None]
+    if missing:
+        raise ValueError(
+            f"채널 설정에 필수 값이 없습니다 ({key}): {', '.join(missing)}"
+        )
+
+    region = entry.get("region") or key
+    record = {
+        "id": int(entry["id"]),
+        "guild_id": int(entry["guild_id"]) if entry.get("guild_id") else None,
+        "name": entry.get("name") or entry.get("label") or str(key),
+        "tz": entry["tz"],
+        "emoji": entry["emoji"],
+        "region": region,
+        "calendar": entry.get("calendar") or REGION_CALENDARS.get(region, region),
+        "profile": entry.get("profile") or region,
+        "template": entry.get("template") or DEFAULT_TEMPLATE,
+        "interval": int(entry.get("interval") or DEFAULT_INTERVAL),
+        "night_start": int(
+            DEFAULT_NIGHT_START
+            if entry.get("night_start") is None
+            else entry["night_start"]
+        ),
+        "night_end": int(
+            DEFAULT_NIGHT_END if entry.get("night_end") is None else entry["night_end"]
+        ),
+    }
+    if entry.get("night_text"):
+        record["night_text"] = entry["night_text"]
+
+    try:
+        pytz.timezone(record["tz"])
+    except pytz.UnknownTimeZoneError:
+        raise ValueError(f"알 수 없는 시간대입니다 ({key}): {record['tz']}") from None
+    if record["profile"] not in STATUS_TABLES:
+        raise ValueError(
+            f"알 수 없는 근무 시간 프로필입니다 ({key}): {record['profile']}"
+        )
+    if not 1 <= record["interval"] <= 1440:
+        raise ValueError(f"갱신 간격은 1~1440분이어야 합니다 ({key})")
+    if not (
+        0 <= record["night_start"] <= 23
+        and 0 <= record["night_end"] <= 23
+        and record["night_start"] != record["night_end"]
+    ):
+        raise ValueError(f"야간 시간은 서로 다른 0~23시여야 합니다 ({key})")
+    try:
+        record["template"].format(emoji="", text="", status="")
+    except (KeyError, IndexError, ValueError) as e:
+        raise ValueError(f"잘못된 이름 형식입니다 ({key}): {e}") from None
+
+    return record
+
+
+def schedule_class_key(record):
+    """이름이 바뀌는 시점을 결정하는 값의 조합 - 같은 클래스의 채널은 항상 함께 바뀜"""
+    return (
+        record["tz"],
+        record["calendar"],
+        record["profile"],
+        record["region"],
+        record["interval"],
+        record["template"],
+        record["night_start"],
+        record["night_end"],
+    )
+
+
+class ChannelRegistry:
+    """채널 설정 모음 - 시간대별, 스케줄 클래스별 색인 제공"""
+
+    def __init__(self, channels=None):
+        self.channels = {}
+        self.by_timezone = {}
+        self.by_class = {}
+        self.by_id = {}
+        for key, entry in (channels or {}).items():
+            self.add(key, entry)
+
+    def __len__(self):
+        return len(self.channels)
+
+    def __iter__(self):
+        return iter(self.channels)
+
+    def __contains__(self, key):
+        return key in self.channels
+
+    def __getitem__(self, key):
+        return self.channels[key]
+
+    def items(self):
+        return self.channels.items()
+
+    def get(self, key, default=None):
+        return self.channels.get(key, default)
+
+    def ids(self):
+        return [record["id"] for record in self.channels.values()]
+
+    def add(self, key, entry):
+        """채널 추가 (같은 키가 있으면 교체) 후 정규화된 레코드 반환"""
+        record = normalize_channel(key, entry)
+        if key in self.channels:
+            self.remove(key)
+        self.channels[key] = record
+        self.by_id[record["id"]] = key
+        self.by_timezone.setdefault(record["tz"], []).append(key)
+        self.by_class.setdefault(schedule_class_key(record), []).append(key)
+        return record
+
+    def remove(self, key):
+        """채널 제거 - 비게 된 색인 항목도 정리"""
+        record = self.channels.pop(key, None)
+        if record is None:
+            return None
+        self.by_id.pop(record["id"], None)
+        for index, index_key in (
+            (self.by_timezone, record["tz"]),
+            (self.by_class, schedule_class_key(record)),
+        ):
+            members = index.get(index_key, [])
+            if key in members:
+                members.remove(key)
+            if not members:
+                index.pop(index_key, None)
+        return record
+
+    def class_of(self, key):
+        return schedule_class_key(self.channels[key])
+
+    def class_members(self, class_key):
+        """스케줄 클래스에 속한 채널 키 목록"""
+        return list(self.by_class.get(class_key, ()))
+
+
+def load_json_channels(path):
+    """JSON 파일에서 채널 목록 로드: {"channels": [{"id": ..., "tz": ..., ...}, ...]}"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    entries = data["channels"] if isinstance(data, dict) else data
+    if isinstance(entries, dict):
+        return dict(entries)
+    return {str(entry["id"]): entry for entry in entries}
+
+
+def load_sqlite_channels(path):
+    """SQLite 데이터베이스의 channels 테이블에서 채널 목록 로드"""
+    connection = sqlite3.connect(path)
+    try:
+        connection.row_factory = sqlite3.Row
+        connection.execute(SQLITE_SCHEMA)
+        rows = connection.execute("SELECT * FROM channels").fetchall()
+    finally:
+        connection.close()
+    return {str(row["id"]): dict(row) for row in rows}
+
+
+def load_registry(path=None):
+    """CHANNEL_REGISTRY(JSON 또는 SQLite) 또는 기본 채널 설정으로 레지스트리 생성"""
+    path = path or os.getenv("CHANNEL_REGISTRY")
+    if not path:
+        return ChannelRegistry(DEFAULT_CHANNELS)
+
+    if path.endswith((".db", ".sqlite", ".sqlite3")):
+        entries = load_sqlite_channels(path)
+    else:
+        entries = load_json_channels(path)
+
+    registry = ChannelRegistry(entries)
+    logger.info(
+        f"[REGISTRY] {path}에서 {len(registry)}개 채널 로드 "
+        f"(시간대 {len(registry.by_timezone)}개, 스케줄 클래스 {len(registry.by_class)}개)"
+    )
+    return registry
+
+
+_REGISTRY = None
+
+
+def get_registry():
+    """프로세스 공용 채널 레지스트리 (최초 호출 시 로드)"""
+    global _REGISTRY
+    if _REGISTRY is None:
+        # 설정 파일(BOT_CONFIG)의 근무 시간 프로필이 채널 검증 전에 등록되어야 함
+        ensure_settings()
+        _REGISTRY = load_registry()
+    return _REGISTRY
+
+
+def set_registry(registry):
+    """프로세스 공용 채널 레지스트리 교체"""
+    global _REGISTRY
+    _REGISTRY = registry
+    return registry
@@ -0,0 +1,220 @@
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+import pytz
+
+try:
+    from .utils import setup_logging
+    from .registry import load_registry, schedule_class_key
+    from .settings import apply_settings, get_settings_path, load_settings
+    from .holiday_index import get_holiday_index
+    from .plan import get_plan_days, refresh_rename_plan
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+    from registry import load_registry, schedule_class_key
+    from settings import apply_settings, get_settings_path, load_settings
+    from holiday_index import get_holiday_index
+    from plan import get_plan_days, refresh_rename_plan
+
+# 로깅 설정
+logger = setup_logging("discord_reload")
+
+# 설정 파일 변경 확인 간격 기본값 (초, 0이면 감시하지 않음)
+DEFAULT_RELOAD_INTERVAL = 5.0
+
+# 마지막 변경 후 이 시간(초) 동안 더 바뀌지 않아야 다시 읽음 (저장 도중의 파일을 읽지 않도록)
+DEFAULT_RELOAD_DEBOUNCE = 2.0
+
+
+def get_reload_interval():
+    return float(os.getenv("CONFIG_RELOAD_INTERVAL", DEFAULT_RELOAD_INTERVAL))
+
+
+def get_reload_debounce():
+    return float(os.getenv("CONFIG_RELOAD_DEBOUNCE", DEFAULT_RELOAD_DEBOUNCE))
+
+
+def file_signature(path):
+    """파일 변경 판단용 (수정 시각 ns, 크기) - 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def watched_paths(registry_path=None, settings_path=None):
+    """감시할 설정 파일 목록 (SQLite 레지스트리는 WAL 파일도 포함)"""
+    registry_path = registry_path or os.getenv("CHANNEL_REGISTRY")
+    settings_path = settings_path or get_settings_path()
+    paths = []
+    if registry_path:
+        paths.append(registry_path)
+        if registry_path.endswith((".db", ".sqlite", ".sqlite3")):
+            paths.append(f"{registry_path}-wal")
+    if settings_path:
+        paths.append(settings_path)
+    return paths
+
+
+class ConfigWatcher:
+    """설정 파일의 (수정 시각, 크기)를 주기적으로 비교하는 변경 감지기
+
+    파일 하나를 stat 하는 비용만 들고 별도 의존성이 없습니다. 변경이 보이면 바로 알리지 않고
+    debounce초 동안 같은 상태로 머문 뒤에 알려, 편집기가 여러 번 나눠 저장해도 한 번만 다시 읽습니다.
+    """
+
+    def __init__(self, paths, debounce=None, clock=None):
+        self.paths = list(paths)
+        self.debounce = get_reload_debounce() if debounce is None else debounce
+        self.clock = clock or time.monotonic
+        self._applied = {path: file_signature(path) for path in self.paths}
+        # {경로: (새 상태, 그 상태를 처음 본 시각)}
+        self._pending = {}
+
+    def poll(self):
+        """변경 후 debounce초 동안 더 바뀌지 않은 파일 목록 반환 (반환한 변경은 적용된 것으로 기록)"""
+        now = self.clock()
+        ready = []
+        for path in self.paths:
+            signature = file_signature(path)
+            if signature == self._applied[path]:
+                self._pending.pop(path, None)
+                continue
+            pending = self._pending.get(path)
+            if pending is None or pending[0] != signature:
+                self._pending[path] = (signature, now)
+                continue
+            if now - pending[1] >= self.debounce:
+                self._applied[path] = signature
+                del self._pending[path]
+                ready.append(path)
+        return ready
+
+
+def calendar_labels(calendars, now, days):
+    """now 전후 구간의 달력별 일별 (표시 이름, 이모지) 목록 - 공휴일 표시 변경 영향 판단용"""
+    first_day = now.date() - timedelta(days=1)
+    count = days + 3
+    # 구간 양 끝이 색인 범위 안에 들도록 (필요하면 범위를 넓힘)
+    get_holiday_index(first_day)
+    index = get_holiday_index(first_day + timedelta(days=count - 1))
+    first = first_day.toordinal()
+    labels = {}
+    for calendar in calendars:
+        _, entry_ids, entries = index.day_entries(calendar, first, count)
+        labels[calendar] = [entries[entry_id] for entry_id in entry_ids]
+    return labels
+
+
+class ConfigReloader:
+    """설정 파일을 다시 읽어 달라진 채널/스케줄 클래스만 레지스트리와 이름 변경 계획에 반영
+
+    레지스트리는 제자리에서 채널 단위로 추가/교체/제거하므로 연결, 저장소, 스케줄러는 그대로이고,
+    계획은 타임라인이 달라진 스케줄 클래스만 다시 컴파일합니다.
+    """
+
+    def __init__(self, registry, registry_path=None, settings_path=None):
+        self.registry = registry
+        self.registry_path = registry_path or os.getenv("CHANNEL_REGISTRY")
+        self.settings_path = settings_path or get_settings_path()
+
+    def paths(self):
+        return watched_paths(self.registry_path, self.settings_path)
+
+    def reload_settings(self, now):
+        """설정 파일을 다시 적용하고 타임라인이 달라진 스케줄 클래스 키 집합 반환"""
+        registry = self.registry
+        calendars = {record["calendar"] for record in registry.channels.values()}
+        before = calendar_labels(calendars, now, get_plan_days())
+
+        labels_changed, changed_profiles = apply_settings(
+            load_settings(self.settings_path)
+        )
+        changed_calendars = set()
+        if labels_changed:
+            after = calendar_labels(calendars, now, get_plan_days())
+            changed_calendars = {c for c in calendars if before[c] != after[c]}
+        if changed_profiles or labels_changed:
+            logger.info(
+                f"[CONFIG] 설정 변경 - 근무 시간 프로필 {sorted(changed_profiles)}, "
+                f"공휴일 표시가 바뀐 달력 {sorted(changed_calendars)}"
+            )
+        return {
+            class_key
+            for class_key, members in registry.by_class.items()
+            if registry[members[0]]["profile"] in changed_profiles
+            or registry[members[0]]["calendar"] in changed_calendars
+        }
+
+    def reload_registry(self):
+        """레지스트리 파일을 다시 읽어 달라진 채널만 반영하고 (바뀐 채널 키, 제거된 채널 키, 클래스가 바뀐 채널 ID) 반환"""
+        registry = self.registry
+        candidate = load_registry(self.registry_path)
+        changed = [
+            key
+            for key, record in candidate.items()
+            if registry.get(key) != record
+        ]
+        removed = [key for key in registry if key not in candidate]
+
+        moved = set()
+        for key in removed:
+            registry.remove(key)
+        for key in changed:
+            previous = registry.get(key)
+            record = registry.add(key, candidate[key])
+            if previous is None or (
+                previous["id"] != record["id"]
+                or schedule_class_key(previous) != schedule_class_key(record)
+            ):
+                moved.add(record["id"])
+        return changed, removed, moved
+
+    def reload(self, now=None):
+        """설정을 다시 읽어 변경 내용 반환 - 잘못된 설정이면 기존 설정을 유지하고 None 반환
+
+        반환값: {"channels": 지금 이름을 다시 적용할 채널 키, "classes": 다음 변경 시점을 다시
+        계산할 스케줄 클래스 키, "removed_classes": 더 이상 없는 스케줄 클래스 키}
+        """
+        if now is None:
+            now = datetime.now(pytz.utc)
+        registry = self.registry
+        started = time.perf_counter()
+        classes_before = set(registry.by_class)
+
+        try:
+            stale = self.reload_settings(now)
+        except (OSError, ValueError) as e:
+            logger.error(f"[CONFIG] 설정 파일을 다시 읽지 못해 기존 설정을 유지합니다: {e}")
+            return None
+        try:
+            changed, removed, moved = self.reload_registry()
+        except (OSError, ValueError, KeyError, sqlite3.Error) as e:
+            logger.error(f"[CONFIG] 채널 레지스트리를 다시 읽지 못해 기존 채널을 유지합니다: {e}")
+            changed, removed, moved = [], [], set()
+
+        new_classes = set(registry.by_class) - classes_before
+        if stale or changed or removed:
+            refresh_rename_plan(registry, stale, moved)
+
+        keys = set(changed)
+        for class_key in stale:
+            keys.update(registry.class_members(class_key))
+        change = {
+            "channels": [key for key in registry if key in keys],
+            "classes": [
+                class_key
+                for class_key in registry.by_class
+                if class_key in stale or class_key in new_classes
+            ],
+            "removed_classes": list(classes_before - set(registry.by_class)),
+        }
+        logger.info(
+            f"[CONFIG] 설정 다시 로드 - 채널 변경 {len(changed)}개, 제거 {len(removed)}개, "
+            f"다시 계산할 스케줄 클래스 {len(change['classes'])}개 ({time.perf_counter() - started:.3f}초)"
+        )
+        return change
@@ -0,0 +1,103 @@
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import lru_cache
+
+import pytz
+
+# 유닉스 기준 시각 (1970-01-01)의 날짜 서수
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+SECONDS_PER_DAY = 86400
+
+# 렌더링 결과 캐시 크기 기본값
+DEFAULT_RENDER_CACHE_SIZE = 4096
+
+
+class OffsetCache:
+    """시간대의 UTC 오프셋 전환 시점 목록을 보관해 현지 시간을 빠르게 계산"""
+
+    def __init__(self, tz_name):
+        tz = pytz.timezone(tz_name)
+        self.tz_name = tz_name
+
+        transition_times = getattr(tz, "_utc_transition_times", None)
+        transition_info = getattr(tz, "_transition_info", None)
+        if transition_times and transition_info:
+            # 오프셋이 바뀌는 UTC 시점(초)과 그 시점부터의 오프셋(초)
+            self._transitions = [
+                (moment - EPOCH).total_seconds() for moment in transition_times
+            ]
+            self._offsets = [int(info[0].total_seconds()) for info in transition_info]
+        else:
+            # 고정 오프셋 시간대 (UTC 등)
+            self._transitions = [float("-inf")]
+            self._offsets = [int(tz.utcoffset(datetime(2000, 1, 1)).total_seconds())]
+
+    def offset_at(self, timestamp):
+        """UTC 타임스탬프(초) 시점의 오프셋(초)"""
+        index = bisect_right(self._transitions, timestamp) - 1
+        return self._offsets[max(index, 0)]
+
+    def local_day_minute(self, timestamp):
+        """현지 날짜 서수와 하루 중 분"""
+        local_seconds = int(timestamp) + self.offset_at(timestamp)
+        days, seconds = divmod(local_seconds, SECONDS_PER_DAY)
+        return EPOCH_ORDINAL + days, seconds // 60
+
+
+@lru_cache(maxsize=None)
+def get_offset_cache(tz_name):
+    """시간대별 오프셋 캐시 (시간대 수만큼만 생성)"""
+    return OffsetCache(tz_name)
+
+
+def local_day_minute(tz_name, now):
+    """now(aware datetime)의 현지 날짜 서수와 하루 중 분"""
+    return get_offset_cache(tz_name).local_day_minute(now.timestamp())
+
+
+def local_date(day_ordinal):
+    return date.fromordinal(day_ordinal)
+
+
+def format_minute(minute_of_day):
+    """하루 중 분을 채널 이름용 시간 문자열로 변환 (: 대신 ：fullwidth colon 사용)"""
+    return f"{minute_of_day // 60:02d}：{minute_of_day % 60:02d}"
+
+
+class RenderCache:
+    """렌더링된 채널 이름을 (지역, 현지 분, 모드) 키로 보관하는 크기 제한 LRU 캐시"""
+
+    def __init__(self, maxsize=DEFAULT_RENDER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_render(self, key, render):
+        """키에 해당하는 이름이 있으면 반환, 없으면 render()로 생성해 저장"""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = render()
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def clear(self):
+        """설정 변경 등으로 렌더링 결과가 달라질 때 전체 무효화"""
+        self._entries.clear()
+
+
+# 프로세스 전체에서 공유하는 렌더링 캐시
+RENDER_CACHE = RenderCache()
@@ -0,0 +1,213 @@
+import asyncio
+import os
+
+try:
+    from .utils import lazy_import, setup_logging
+    from .metrics import RATE_LIMITED, RETRY_AFTER
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import lazy_import, setup_logging
+    from metrics import RATE_LIMITED, RETRY_AFTER
+
+# 로깅 설정
+logger = setup_logging("discord_rest")
+
+# 세션을 시작하거나 오류를 변환할 때만 로드
+aiohttp = lazy_import("aiohttp")
+discord = lazy_import("discord")
+
+# Discord REST API 기본 주소 (로컬 가짜 서버로 테스트할 때 DISCORD_API_BASE로 변경)
+DEFAULT_API_BASE = "https://discord.com/api/v10"
+
+# 이름 변경을 지원하는 채널 타입 (텍스트, 음성, 카테고리)
+SUPPORTED_CHANNEL_TYPES = (0, 2, 4)
+
+# 429 응답에서 이 시간(초) 이상 기다려야 하면 재시도하지 않고 예외 발생 (재시도 대기열이 처리)
+MAX_RATELIMIT_WAIT = 5.0
+MAX_RETRIES = 3
+
+
+def parse_rate_limit(headers, data):
+    """429 응답의 (대기 시간(초), 전역 제한 여부)
+
+    본문이 JSON 객체면 retry_after/global을, 아니면(Cloudflare 차단 등 HTML/텍스트 응답)
+    X-RateLimit-Reset-After, Retry-After 헤더를 사용하며 둘 다 없으면 1초를 기다립니다.
+    전역 제한은 본문의 global 또는 X-RateLimit-Global 헤더로 판단합니다.
+    """
+    body = data if isinstance(data, dict) else {}
+    retry_after = body.get("retry_after")
+    for header in ("X-RateLimit-Reset-After", "Retry-After"):
+        if retry_after is not None:
+            break
+        retry_after = headers.get(header)
+    try:
+        retry_after = float(retry_after)
+    except (TypeError, ValueError):
+        retry_after = 1.0
+    is_global = bool(body.get("global")) or (
+        headers.get("X-RateLimit-Global", "").lower() == "true"
+    )
+    return max(retry_after, 0.0), is_global
+
+
+class RestChannel:
+    """REST API로 조회한 채널 - update_channel_names가 사용하는 name/edit만 제공"""
+
+    def __init__(self, client, channel_id, name=None, channel_type=None):
+        self._client = client
+        self.id = channel_id
+        self.name = name
+        self.type = channel_type
+
+    @property
+    def is_supported(self):
+        # 조회하지 않은 채널(타입 미확인)은 PATCH 응답으로 판단
+        return self.type is None or self.type in SUPPORTED_CHANNEL_TYPES
+
+    async def edit(self, *, name):
+        """PATCH /channels/{id}로 채널 이름 변경"""
+        data = await self._client.request(
+            "PATCH",
+            f"/channels/{self.id}",
+            json={"name": name},
+            route="PATCH /channels/{id}",
+        )
+        self.name = data.get("name", name)
+        self.type = data.get("type", self.type)
+        return self
+
+
+class RestClient:
+    """게이트웨이 연결 없이 Discord REST API만 사용하는 채널 이름 변경 엔진"""
+
+    def __init__(self, token, api_base=None, max_connections=10):
+        self.token = token
+        self.api_base = (
+            api_base or os.getenv("DISCORD_API_BASE", DEFAULT_API_BASE)
+        ).rstrip("/")
+        self.max_connections = max_connections
+        self._session = None
+        self._channels = {}
+        # 전역 429가 풀리는 시각 (이벤트 루프 시간) - 그 전에는 모든 요청이 대기
+        self._global_reset = 0.0
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def start(self):
+        """연결 풀을 가진 HTTP 세션 생성"""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections, keepalive_timeout=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    "Authorization": f"Bot {self.token}",
+                    "User-Agent": "DiscordBot (discord-timezone-bot, 0.1.0)",
+                },
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def is_ready(self):
+        return self._session is not None and not self._session.closed
+
+    async def request(self, method, path, json=None, route=None):
+        """REST 요청 실행 - 429/5xx는 재시도하고 그 외 오류는 discord 예외로 변환
+
+        route는 측정값 라벨로 쓰는 경로 형식입니다 (예: "PATCH /channels/{id}").
+        """
+        url = f"{self.api_base}{path}"
+        route = route or f"{method} {path}"
+
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(MAX_RETRIES + 1):
+            global_wait = self._global_reset - loop.time()
+            if global_wait > 0:
+                await asyncio.sleep(global_wait)
+
+            async with self._session.request(method, url, json=json) as response:
+                if response.content_type == "application/json":
+                    data = await response.json()
+                else:
+                    data = await response.text()
+
+                if 200 <= response.status < 300:
+                    return data if isinstance(data, dict) else {}
+
+                if response.status == 429:
+                    retry_after, is_global = parse_rate_limit(response.headers, data)
+                    RATE_LIMITED.inc(route)
+                    RETRY_AFTER.inc(route, amount=retry_after)
+                    if is_global:
+                        # 전역 제한은 이 경로뿐 아니라 같은 클라이언트의 모든 요청을 멈춤
+                        self._global_reset = max(
+                            self._global_reset, loop.time() + retry_after
+                        )
+                    if retry_after > MAX_RATELIMIT_WAIT or attempt == MAX_RETRIES:
+                        raise discord.RateLimited(retry_after)
+                    logger.warning(
+                        f"[RATELIMIT] {method} {path} - {retry_after:.2f}초 후 재시도"
+                        + (" (전역 제한)" if is_global else "")
+                    )
+                    if not is_global:
+                        await asyncio.sleep(retry_after)
+                    continue
+
+                if response.status >= 500 and attempt < MAX_RETRIES:
+                    await asyncio.sleep(1 + attempt * 2)
+                    continue
+
+                if response.status == 401:
+                    raise discord.LoginFailure("Discord 토큰이 잘못되었습니다")
+                if response.status == 403:
+                    raise discord.Forbidden(response, data)
+                if response.status == 404:
+                    raise discord.NotFound(response, data)
+                if response.status >= 500:
+                    raise discord.DiscordServerError(response, data)
+                raise discord.HTTPException(response, data)
+
+    async def fetch_channel(self, channel_id):
+        """GET /channels/{id}로 채널 조회 후 캐시에 저장"""
+        data = await self.request(
+            "GET", f"/channels/{channel_id}", route="GET /channels/{id}"
+        )
+        channel = RestChannel(
+            self, channel_id, name=data.get("name"), channel_type=data.get("type")
+        )
+        self._channels[channel_id] = channel
+        return channel
+
+    async def fetch_channels(self, channel_ids):
+        """여러 채널을 동시에 조회 - 실패한 채널은 캐시에 넣지 않음"""
+        results = await asyncio.gather(
+            *(self.fetch_channel(channel_id) for channel_id in channel_ids),
+            return_exceptions=True,
+        )
+        for channel_id, result in zip(channel_ids, results):
+            if isinstance(result, discord.LoginFailure):
+                raise result
+            if isinstance(result, Exception):
+                logger.warning(f"[WARNING] 채널 조회 실패 (ID: {channel_id}): {result}")
+        return [channel for channel in results if isinstance(channel, RestChannel)]
+
+    def get_channel(self, channel_id):
+        """캐시된 채널 반환 (discord.Client.get_channel과 같은 인터페이스)
+
+        조회하지 않은 채널은 이름을 모르는 채널 객체를 만들어 GET 없이 바로 PATCH할 수 있게 합니다.
+        """
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = self._channels[channel_id] = RestChannel(self, channel_id)
+        return channel
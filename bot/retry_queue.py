@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+try:
+    from .metrics import METRICS, Gauge
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from metrics import METRICS, Gauge
+
+# 재시도 대기 시간: 2초부터 두 배씩 늘려 최대 5분
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 300.0
+
+
+class PendingRenames:
+    """실패한 채널 이름 변경을 채널별로 하나만 보관하는 재시도 대기열
+
+    같은 채널에 새 이름이 들어오면 이전 이름을 덮어쓰므로(마지막 이름 우선)
+    장애가 길어져도 복구 후에는 채널마다 최신 이름으로 한 번만 요청합니다.
+    """
+
+    def __init__(
+        self, base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY, clock=None
+    ):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.clock = clock or time.monotonic
+        # {채널 키: {"name": 적용할 이름, "attempts": 실패 횟수, "due": 재시도 시각}}
+        self._entries = {}
+        self._wakeup = asyncio.Event()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def is_waiting(self, key):
+        """재시도 대기 중(아직 시각이 되지 않음)인지 여부"""
+        entry = self._entries.get(key)
+        return entry is not None and entry["due"] > self.clock()
+
+    def submit(self, key, name):
+        """대기 중인 채널의 적용할 이름을 최신 값으로 교체 (재시도 시각은 유지)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {"name": name, "attempts": 0, "due": 0.0}
+            self._wakeup.set()
+        entry["name"] = name
+        return entry
+
+    def fail(self, key, name, retry_after=None):
+        """실패 기록 후 지수 백오프(또는 더 긴 retry_after) 뒤로 재시도 예약, 대기 시간(초) 반환"""
+        entry = self.submit(key, name)
+        entry["attempts"] += 1
+        delay = min(self.base_delay * 2 ** (entry["attempts"] - 1), self.max_delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        entry["due"] = self.clock() + delay
+        self._wakeup.set()
+        return delay
+
+    def discard(self, key):
+        """적용 완료 또는 재시도할 필요가 없는 채널 제거"""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """모든 대기 항목 제거"""
+        self._entries.clear()
+
+    def due(self):
+        """재시도 시각이 된 채널 키 목록"""
+        now = self.clock()
+        return [key for key, entry in self._entries.items() if entry["due"] <= now]
+
+    def next_due(self):
+        """가장 빠른 재시도 시각 (없으면 None)"""
+        if not self._entries:
+            return None
+        return min(entry["due"] for entry in self._entries.values())
+
+    async def wait(self, timeout=None):
+        """재시도 시각이 된 채널이 생기거나 대기열이 바뀔 때까지 대기"""
+        self._wakeup.clear()
+        next_due = self.next_due()
+        if next_due is not None:
+            delay = next_due - self.clock()
+            if delay <= 0:
+                return
+            timeout = delay if timeout is None else min(timeout, delay)
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+# 프로세스 전체에서 공유하는 재시도 대기열
+PENDING_RENAMES = PendingRenames()
+
+METRICS.register(
+    Gauge(
+        "discord_bot_pending_renames",
+        "재시도를 기다리는 채널 이름 변경 수",
+        callback=lambda: len(PENDING_RENAMES),
+    )
+)
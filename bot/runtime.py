@@ -0,0 +1,394 @@
+import asyncio
+import signal
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pytz
+
+try:
+    from .utils import setup_logging, check_discord_token, lazy_import
+    from .updater import (
+        update_channel_names,
+        get_channel_ids,
+        reconcile_channels,
+        retry_pending_renames,
+    )
+    from .retry_queue import PENDING_RENAMES
+    from .rest import RestClient
+    from .registry import get_registry
+    from .state import get_reconcile_interval, get_state_store
+    from .health import get_channel_health
+    from .footprint import prune_channel_cache, report_memory, restore_channels
+    from .schedule import KST, TransitionScheduler
+    from .plan import get_rename_plan, next_plan_instant, plan_names
+    from .session import create_resumable_client
+    from .reload import ConfigReloader, ConfigWatcher, get_reload_interval
+    from .commands import (
+        TIME_ANSWERS,
+        create_command_tree,
+        is_time_command_enabled,
+        sync_commands,
+    )
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging, check_discord_token, lazy_import
+    from updater import (
+        update_channel_names,
+        get_channel_ids,
+        reconcile_channels,
+        retry_pending_renames,
+    )
+    from retry_queue import PENDING_RENAMES
+    from rest import RestClient
+    from registry import get_registry
+    from state import get_reconcile_interval, get_state_store
+    from health import get_channel_health
+    from footprint import prune_channel_cache, report_memory, restore_channels
+    from schedule import KST, TransitionScheduler
+    from plan import get_rename_plan, next_plan_instant, plan_names
+    from session import create_resumable_client
+    from reload import ConfigReloader, ConfigWatcher, get_reload_interval
+    from commands import (
+        TIME_ANSWERS,
+        create_command_tree,
+        is_time_command_enabled,
+        sync_commands,
+    )
+
+# 로깅 설정
+logger = setup_logging("discord_runtime")
+
+# 상시 연결을 시작할 때만 로드 (샤드 감독 프로세스는 로드하지 않음)
+discord = lazy_import("discord")
+
+# 연결이 준비되지 않았을 때 다시 시도할 간격
+NOT_READY_RETRY = timedelta(seconds=60)
+
+# 런타임 스냅샷 키 (종료 시 등록된 변경 시점)
+SCHEDULE_SNAPSHOT = "transition_schedule"
+
+
+async def run_update(client_instance, channels=None, now=None, names=None):
+    """같은 이벤트 루프 안에서 채널 이름 업데이트 실행 (names 지정 시 계획의 이름 적용)"""
+    start_time = time.perf_counter()
+
+    try:
+        report = await update_channel_names(
+            client_instance, channels=channels, now=now, names=names
+        )
+    except Exception as e:
+        logger.error(f"[ERROR] 채널 업데이트 중 오류 발생: {e}")
+        return None
+
+    execution_time = time.perf_counter() - start_time
+    logger.info(
+        f"[SUCCESS] {len(report)}개 채널 처리 완료 (실행시간: {execution_time:.2f}초)"
+    )
+    return report
+
+
+def schedule_classes(scheduler, registry, class_keys, now):
+    """스케줄 클래스별로 표시 이름이 실제로 바뀌는 다음 시점을 스케줄러에 등록
+
+    같은 클래스(시간대, 달력, 프로필, 지역, 갱신 간격, 형식)의 채널은 항상 함께 바뀌므로
+    변경 시점은 컴파일된 이름 변경 계획에서 클래스마다 한 번만 조회합니다.
+    """
+    for class_key in class_keys:
+        instant = next_plan_instant(registry, class_key, now)
+        if instant is None:
+            scheduler.remove(class_key)
+            continue
+        scheduler.schedule(class_key, instant)
+        logger.debug(
+            f"[NEXT_UPDATE] {class_key[0]} ({len(registry.by_class[class_key])}개 채널) 다음 변경 예정: {instant.astimezone(KST).strftime('%Y-%m-%d %H:%M')}"
+        )
+
+    next_instant = scheduler.next_instant()
+    if next_instant is not None:
+        logger.info(
+            f"[WAIT] 다음 변경 예정: {next_instant.astimezone(KST).strftime('%Y-%m-%d %H:%M:%S')}"
+        )
+
+
+def save_schedule(scheduler, registry, store=None, now=None):
+    """종료 전 스케줄 클래스별 다음 변경 시점을 계획 지문과 함께 저장"""
+    if store is None:
+        store = get_state_store()
+    if now is None:
+        now = datetime.now(pytz.utc)
+    plan = get_rename_plan(registry, now)
+    entries = [
+        [list(class_key), instant.timestamp()]
+        for class_key, instant in scheduler.snapshot()
+    ]
+    store.save_snapshot(
+        SCHEDULE_SNAPSHOT, {"fingerprint": plan.fingerprint, "entries": entries}
+    )
+    logger.info(f"[SESSION] 스케줄 클래스 {len(entries)}개의 다음 변경 시점을 저장했습니다")
+
+
+def restore_schedule(scheduler, registry, now, store=None):
+    """저장된 변경 시점 중 계획이 같고 아직 오지 않은 것만 복원하고 복원한 스케줄 클래스 키 집합 반환
+
+    설정이나 계획 구간이 바뀌었으면(계획 지문이 다르면) 아무것도 복원하지 않습니다.
+    """
+    if store is None:
+        store = get_state_store()
+    snapshot = store.load_snapshot(SCHEDULE_SNAPSHOT)
+    if not snapshot or snapshot.get("fingerprint") != get_rename_plan(registry, now).fingerprint:
+        return set()
+    restored = set()
+    for class_key, timestamp in snapshot["entries"]:
+        class_key = tuple(class_key)
+        if class_key in registry.by_class and timestamp > now.timestamp():
+            scheduler.schedule(class_key, datetime.fromtimestamp(timestamp, pytz.utc))
+            restored.add(class_key)
+    if restored:
+        logger.info(
+            f"[SESSION] 저장된 스케줄에서 스케줄 클래스 {len(restored)}/{len(registry.by_class)}개의 변경 시점을 복원했습니다"
+        )
+    return restored
+
+
+def create_transition_scheduler(client_instance, registry=None, clock=None):
+    """변경 시점이 된 스케줄 클래스의 채널만 업데이트하는 스케줄러 생성 (clock은 현재 UTC datetime 반환)"""
+    if registry is None:
+        registry = get_registry()
+
+    async def on_transition(class_keys, now):
+        if not client_instance.is_ready():
+            logger.warning(
+                "[WARNING] Discord 연결이 준비되지 않아 잠시 후 다시 시도합니다"
+            )
+            for class_key in class_keys:
+                scheduler.schedule(class_key, now + NOT_READY_RETRY)
+            return
+
+        keys = [
+            key for class_key in class_keys for key in registry.class_members(class_key)
+        ]
+        await run_update(
+            client_instance,
+            channels=keys,
+            now=now,
+            names=plan_names(registry, keys, now),
+        )
+        schedule_classes(scheduler, registry, class_keys, now)
+
+    scheduler = TransitionScheduler(on_transition, clock=clock)
+    return scheduler
+
+
+async def run_reconcile(client_instance, registry=None, interval=None):
+    """주기적으로 Discord 실제 이름과 저장소를 대조해 외부에서 변경된 채널을 다시 적용"""
+    if interval is None:
+        interval = get_reconcile_interval()
+    store = get_state_store()
+
+    while True:
+        await asyncio.sleep(interval)
+        if not client_instance.is_ready():
+            continue
+        try:
+            keys = await reconcile_channels(client_instance, registry, store)
+        except Exception as e:
+            logger.error(f"[ERROR] 채널 이름 대조 중 오류 발생: {e}")
+            continue
+        if keys:
+            await run_update(client_instance, channels=keys)
+        report_memory("정상 상태")
+
+
+async def run_retries(client_instance, registry=None):
+    """재시도 시각이 된 채널마다 대기열의 최신 이름으로 한 번씩 다시 요청"""
+    while True:
+        await PENDING_RENAMES.wait()
+        if not PENDING_RENAMES.due():
+            continue
+        if not client_instance.is_ready():
+            await asyncio.sleep(NOT_READY_RETRY.total_seconds())
+            continue
+        try:
+            await retry_pending_renames(client_instance, registry=registry)
+        except Exception as e:
+            logger.error(f"[ERROR] 채널 이름 재시도 중 오류 발생: {e}")
+
+
+async def run_config_reload(client_instance, scheduler, registry):
+    """설정 파일(CHANNEL_REGISTRY, BOT_CONFIG)이 바뀌면 달라진 채널과 스케줄 클래스만 다시 반영
+
+    연결과 스케줄러 상태는 그대로 두고, 바뀐 채널의 이름만 바로 적용한 뒤
+    타임라인이 달라진 스케줄 클래스의 다음 변경 시점만 다시 등록합니다.
+    """
+    interval = get_reload_interval()
+    reloader = ConfigReloader(registry)
+    watcher = ConfigWatcher(reloader.paths())
+    if interval <= 0 or not watcher.paths:
+        return
+    logger.info(
+        f"[CONFIG] 설정 파일 변경 감시 시작: {', '.join(watcher.paths)} ({interval:g}초 간격)"
+    )
+
+    while True:
+        await asyncio.sleep(interval)
+        if not watcher.poll():
+            continue
+        now = datetime.now(pytz.utc)
+        try:
+            change = reloader.reload(now)
+            if change is None:
+                continue
+            TIME_ANSWERS.clear()
+            for class_key in change["removed_classes"]:
+                scheduler.remove(class_key)
+            keys = change["channels"]
+            if keys and client_instance.is_ready():
+                await restore_channels(
+                    client_instance, [registry[key]["id"] for key in keys]
+                )
+                await run_update(
+                    client_instance,
+                    channels=keys,
+                    now=now,
+                    names=plan_names(registry, keys, now),
+                )
+            schedule_classes(scheduler, registry, change["classes"], now)
+        except Exception as e:
+            logger.error(f"[ERROR] 설정 다시 로드 중 오류 발생: {e}")
+
+
+async def run_transitions(client_instance, scheduler, registry=None):
+    """초기 업데이트 후 변경 시점마다 해당 채널만 업데이트 (현재 시각은 스케줄러의 시계 기준)"""
+    now = scheduler.clock()
+
+    # 봇 초기 실행 시 무조건 한번 업데이트
+    logger.info(
+        f"[IMMEDIATE] 봇 초기 실행 - 현재 상태로 무조건 업데이트합니다 ({now.astimezone(KST).strftime('%H:%M')})"
+    )
+    if registry is None:
+        registry = get_registry()
+    await run_update(
+        client_instance,
+        channels=list(registry),
+        now=now,
+        names=plan_names(registry, list(registry), now),
+    )
+    report_memory("초기 업데이트 후")
+
+    # 재시작 전 저장한 변경 시점이 그대로 유효한 클래스는 다시 계산하지 않음
+    restored = restore_schedule(scheduler, registry, now)
+    schedule_classes(
+        scheduler,
+        registry,
+        [class_key for class_key in registry.by_class if class_key not in restored],
+        now,
+    )
+    reconcile_task = asyncio.create_task(run_reconcile(client_instance, registry))
+    retry_task = asyncio.create_task(run_retries(client_instance, registry))
+    reload_task = asyncio.create_task(
+        run_config_reload(client_instance, scheduler, registry)
+    )
+    try:
+        await scheduler.run()
+    finally:
+        reconcile_task.cancel()
+        retry_task.cancel()
+        reload_task.cancel()
+        save_schedule(scheduler, registry, now=scheduler.clock())
+
+
+def create_client():
+    """상시 연결용 Discord 클라이언트와 스케줄러 생성 (저장된 세션이 있으면 RESUME으로 이어받음)"""
+    client = create_resumable_client()
+    scheduler = create_transition_scheduler(client)
+    tree = create_command_tree(client) if is_time_command_enabled() else None
+    tasks = []
+
+    @client.event
+    async def on_ready():
+        logger.info(f"[LOGIN] 봇이 {client.user}로 로그인했습니다")
+        logger.info(f"[CONNECT] {len(client.guilds)}개 서버에 연결되었습니다")
+        # 재연결로 캐시가 다시 채워질 수 있으므로 매번 정리
+        prune_channel_cache(client, get_channel_ids())
+
+        # 재연결 시에도 on_ready가 호출되므로 스케줄러는 한 번만 시작
+        if tasks:
+            return
+        tasks.append(asyncio.create_task(run_transitions(client, scheduler)))
+        if tree is not None:
+            try:
+                await sync_commands(tree)
+            except discord.HTTPException as e:
+                logger.error(f"[ERROR] 애플리케이션 명령 동기화 실패: {e}")
+
+    @client.event
+    async def on_guild_channel_update(before, after):
+        # 봇이 관리하는 채널 이름이 외부에서 바뀌면 저장소를 고치고 바로 다시 적용
+        registry = get_registry()
+        key = registry.by_id.get(after.id)
+        entry = get_state_store().get(after.id)
+        if key is None or entry is None or entry[0] == after.name:
+            return
+        logger.warning(
+            f"[RECONCILE] {registry[key]['name']} 채널 이름이 외부에서 변경되었습니다: {entry[0]} -> {after.name}"
+        )
+        get_state_store().record(after.id, after.name)
+        await run_update(client, channels=[key])
+
+    @client.event
+    async def on_error(event, *args, **kwargs):
+        logger.error(f"[ERROR] Discord 이벤트 오류 발생: {event}", exc_info=True)
+
+    return client, scheduler
+
+
+async def run_rest_runtime(token):
+    """게이트웨이 없이 REST 세션 하나를 유지하며 스케줄 실행"""
+    # 컨테이너 재시작(SIGTERM)에도 스케줄을 저장하고 종료하도록 작업을 취소
+    try:
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, asyncio.current_task().cancel
+        )
+    except NotImplementedError:
+        pass
+
+    async with RestClient(token) as rest_client:
+        # 저장소에 마지막 적용 이름이 없는 채널만 조회하고 이후에는 PATCH 응답으로 갱신 (격리 채널 제외)
+        store = get_state_store()
+        health = get_channel_health()
+        channel_ids = [
+            i
+            for i in get_channel_ids()
+            if i not in store and not health.is_quarantined(i)
+        ]
+        channels = await rest_client.fetch_channels(channel_ids)
+        logger.info(
+            f"[CONNECT] REST 엔진으로 {len(channels)}개 채널을 조회했습니다 (저장된 채널 {len(store)}개)"
+        )
+
+        scheduler = create_transition_scheduler(rest_client)
+        await run_transitions(rest_client, scheduler)
+
+
+def run_persistent(engine="gateway"):
+    """단일 연결(게이트웨이 또는 REST 세션)을 유지하며 같은 이벤트 루프에서 스케줄 실행"""
+    try:
+        token = check_discord_token()
+    except ValueError as e:
+        logger.error(f"[ERROR] {e}")
+        sys.exit(1)
+
+    try:
+        if engine == "rest":
+            asyncio.run(run_rest_runtime(token))
+        else:
+            client, _ = create_client()
+            client.run(token)
+    except discord.LoginFailure:
+        logger.error("[LOGINF] Discord 토큰이 잘못되었습니다")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        logger.info("[STOP] 사용자에 의해 봇이 중지되었습니다")
+    except asyncio.CancelledError:
+        logger.info("[STOP] 종료 신호로 봇이 중지되었습니다")
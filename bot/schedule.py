@@ -0,0 +1,228 @@
+import asyncio
+import heapq
+import itertools
+from datetime import datetime, time, timedelta
+
+import pytz
+
+try:
+    from .utils import setup_logging
+    from .updater import (
+        get_holiday_info,
+        is_night_time,
+        night_window,
+        render_channel_name,
+    )
+    from .profiles import next_status_boundary
+    from .registry import DEFAULT_INTERVAL, REGION_CALENDARS, get_registry
+    from .metrics import SCHEDULE_LAG
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+    from updater import (
+        get_holiday_info,
+        is_night_time,
+        night_window,
+        render_channel_name,
+    )
+    from profiles import next_status_boundary
+    from registry import DEFAULT_INTERVAL, REGION_CALENDARS, get_registry
+    from metrics import SCHEDULE_LAG
+
+# 로깅 설정
+logger = setup_logging("discord_schedule")
+
+# 스케줄 기준 시간대 (한국 시간)
+KST = pytz.timezone("Asia/Seoul")
+
+# 다음 변경 시점 탐색 시 확인할 최대 후보 수 (무한 루프 방지)
+MAX_TRANSITION_STEPS = 500
+
+# 콜백이 실패한 채널을 다시 실행할 때까지의 대기 시간
+CALLBACK_RETRY = timedelta(seconds=60)
+
+
+def next_transitions(registry, now, next_instant=None):
+    """now 이후 가장 먼저 이름이 바뀌는 시점과 그 시점에 바뀌는 스케줄 클래스 목록
+
+    next_instant(registry, class_key, now) 미지정 시 next_class_change_time을 사용합니다.
+    야간 시간인 지역의 클래스는 깨어나는 시점 전까지 후보에 오르지 않으므로 비용이 없습니다.
+    """
+    if next_instant is None:
+        next_instant = next_class_change_time
+    instants = {}
+    for class_key in registry.by_class:
+        instant = next_instant(registry, class_key, now)
+        if instant is not None:
+            instants.setdefault(instant, []).append(class_key)
+    if not instants:
+        return None, []
+    instant = min(instants)
+    return instant, instants[instant]
+
+
+def calculate_next_update_time(current_time=None, registry=None):
+    """다음 업데이트가 실제로 필요한 시점 (레지스트리 채널 중 가장 먼저 이름이 바뀌는 시점, 한국 시간)"""
+    if current_time is None:
+        current_time = datetime.now(KST)
+    if current_time.tzinfo is None:
+        current_time = KST.localize(current_time)
+    if registry is None:
+        registry = get_registry()
+
+    instant, _ = next_transitions(registry, current_time)
+    if instant is None:
+        # 채널이 없으면 1시간 후 다시 확인
+        return current_time.astimezone(KST) + timedelta(hours=1)
+    return instant.astimezone(KST)
+
+
+def next_daily_instant(tz, local_now, hour, minute=0):
+    """local_now 이후 처음 오는 현지 시각 hour:minute (UTC 기준 aware datetime)"""
+    day = local_now.date()
+    candidate = tz.localize(datetime.combine(day, time(hour, minute)))
+    if candidate <= local_now:
+        candidate = tz.localize(
+            datetime.combine(day + timedelta(days=1), time(hour, minute))
+        )
+    return candidate
+
+
+def next_candidate_time(name, info, now):
+    """now 이후 채널 이름이 바뀔 수 있는 가장 빠른 후보 시점"""
+    tz = pytz.timezone(info["tz"])
+    local_now = now.astimezone(tz)
+    _, night_start, night_end = night_window(info)
+
+    # 야간 모드 시작/종료, 현지 자정 (휴일/주말 전환) - 모두 채널 시간대 기준
+    candidates = [
+        next_daily_instant(tz, local_now, night_start),
+        next_daily_instant(tz, local_now, night_end),
+        next_daily_instant(tz, local_now, 0),
+    ]
+
+    # 평일 주간에는 시간 표시 갱신 시점과 근무 상태 경계가 추가됨
+    region = info.get("region", name)
+    calendar = info.get("calendar", REGION_CALENDARS.get(region, region))
+    holiday_name, _ = get_holiday_info(local_now.date(), calendar)
+    if not is_night_time(now, info) and holiday_name is None:
+        interval = info.get("interval", DEFAULT_INTERVAL)
+        minute_start = local_now.replace(second=0, microsecond=0)
+        minute_of_day = local_now.hour * 60 + local_now.minute
+        step = interval - minute_of_day % interval
+        next_grid = tz.normalize(minute_start + timedelta(minutes=step))
+        candidates.append(next_grid)
+
+        # 근무 상태(💼/🍜/🏠)가 바뀌는 다음 경계 (컴파일된 경계 목록에서 조회)
+        boundary = next_status_boundary(info.get("profile", region), minute_of_day)
+        if boundary is not None:
+            candidates.append(
+                tz.normalize(minute_start + timedelta(minutes=boundary - minute_of_day))
+            )
+
+    return min(candidates)
+
+
+def next_change_time(name, info, now):
+    """now 이후 채널에 표시되는 이름이 실제로 바뀌는 정확한 시점 계산"""
+    current_name = render_channel_name(name, info, now)
+    instant = now
+    for _ in range(MAX_TRANSITION_STEPS):
+        instant = next_candidate_time(name, info, instant)
+        if render_channel_name(name, info, instant) != current_name:
+            return instant
+    return instant
+
+
+def next_class_change_time(registry, class_key, now):
+    """스케줄 클래스의 다음 변경 시점 (클래스 대표 채널 기준으로 한 번만 계산)"""
+    members = registry.by_class.get(class_key)
+    if not members:
+        return None
+    key = members[0]
+    return next_change_time(key, registry[key], now)
+
+
+class TransitionScheduler:
+    """채널별 다음 변경 시점을 힙에 보관하고 가장 빠른 시점까지 정확히 대기하는 스케줄러"""
+
+    def __init__(self, callback, clock=None):
+        self.callback = callback
+        self.clock = clock or (lambda: datetime.now(pytz.utc))
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def schedule(self, key, instant):
+        """채널의 다음 실행 시점 등록 (기존 시점은 무효화)"""
+        self._entries[key] = instant
+        heapq.heappush(self._heap, (instant, next(self._counter), key))
+        if self._heap[0][2] == key:
+            self._wakeup.set()
+
+    def remove(self, key):
+        """채널을 스케줄에서 제거 (힙 항목은 꺼낼 때 무시됨)"""
+        self._entries.pop(key, None)
+
+    def snapshot(self):
+        """등록된 (키, 실행 시점) 목록 (재시작 후 schedule로 복원)"""
+        return list(self._entries.items())
+
+    def next_instant(self):
+        """가장 빠른 유효 실행 시점"""
+        while self._heap:
+            instant, _, key = self._heap[0]
+            if self._entries.get(key) == instant:
+                return instant
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now):
+        """now까지 실행 시점이 된 채널 키 목록을 꺼냄"""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            instant, _, key = heapq.heappop(self._heap)
+            if self._entries.get(key) == instant:
+                del self._entries[key]
+                due.append(key)
+        return due
+
+    async def run(self):
+        """다음 변경 시점까지 대기 후 콜백 실행을 반복"""
+        while True:
+            self._wakeup.clear()
+            instant = self.next_instant()
+            if instant is None:
+                await self._wakeup.wait()
+                continue
+
+            delay = (instant - self.clock()).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            # 타이머가 약간 일찍 깨어나도 예정 시점 기준으로 이름을 계산
+            actual = self.clock()
+            SCHEDULE_LAG.observe(max((actual - instant).total_seconds(), 0.0))
+            now = max(actual, instant)
+            keys = self.pop_due(now)
+            if not keys:
+                continue
+            try:
+                await self.callback(keys, now)
+            except Exception as e:
+                # 꺼낸 키를 잃지 않도록 콜백이 다시 등록하지 못한 키는 잠시 후 다시 실행
+                logger.error(
+                    f"[ERROR] 변경 시점 처리 중 오류 발생, {CALLBACK_RETRY.total_seconds():.0f}초 후 다시 시도합니다: {e}",
+                    exc_info=True,
+                )
+                for key in keys:
+                    if key not in self._entries:
+                        self.schedule(key, now + CALLBACK_RETRY)
@@ -0,0 +1,281 @@
+import asyncio
+import inspect
+import os
+import signal
+from functools import lru_cache
+
+try:
+    from .utils import lazy_import, setup_logging
+    from .footprint import create_gateway_client
+    from .metrics import GATEWAY_SESSIONS
+    from .registry import get_registry
+    from .state import get_state_store
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import lazy_import, setup_logging
+    from footprint import create_gateway_client
+    from metrics import GATEWAY_SESSIONS
+    from registry import get_registry
+    from state import get_state_store
+
+# 로깅 설정
+logger = setup_logging("discord_session")
+
+# 게이트웨이 클라이언트를 만들 때만 로드
+discord = lazy_import("discord")
+aiohttp = lazy_import("aiohttp")
+yarl = lazy_import("yarl")
+
+# 저장된 세션으로 RESUME을 시도하는 최대 경과 시간 기본값 (초, 0이면 세션을 저장/재사용하지 않음)
+# Discord는 끊긴 세션의 유지 시간을 공개하지 않으므로, 넘으면 RESUME 대신 바로 IDENTIFY
+DEFAULT_RESUME_WINDOW = 600.0
+
+# 세션을 유지한 채 연결을 닫는 종료 코드 (1000/1001로 닫으면 Discord가 세션을 끝냄)
+SUSPEND_CLOSE_CODE = 4000
+
+# 런타임 스냅샷 키
+SESSION_SNAPSHOT = "gateway_session"
+
+# 세션 재사용이 기대는 discord.py 내부 API (pyproject.toml에서 discord.py 마이너 버전 고정)
+# DiscordWebSocket.from_client로 RESUME 연결을 직접 열 때 넘기는 인자
+RESUME_PARAMS = ("initial", "shard_id", "gateway", "session", "sequence", "resume")
+
+
+def get_resume_window():
+    return float(os.getenv("GATEWAY_RESUME_WINDOW", DEFAULT_RESUME_WINDOW))
+
+
+def channel_payload(channel):
+    """캐시를 다시 채울 때 쓰는 게이트웨이 채널 데이터 (이름 변경에 필요한 필드만)"""
+    payload = {
+        "id": str(channel.id),
+        "type": channel.type.value,
+        "name": channel.name,
+        "position": channel.position,
+        "parent_id": str(channel.category_id) if channel.category_id else None,
+        "permission_overwrites": [],
+    }
+    if hasattr(channel, "bitrate"):
+        payload.update(bitrate=channel.bitrate, user_limit=channel.user_limit)
+    return payload
+
+
+def session_snapshot(client, channel_ids):
+    """RESUME에 필요한 세션 정보와 channel_ids 채널의 캐시 데이터 (세션이 없으면 None)"""
+    ws = client.ws
+    if ws is None or ws.session_id is None or client.user is None:
+        return None
+    keep = set(channel_ids)
+    guilds = []
+    for guild in client.guilds:
+        channels = [channel_payload(c) for c in guild.channels if c.id in keep]
+        if channels:
+            guilds.append({"id": str(guild.id), "name": guild.name, "channels": channels})
+    user = client.user
+    return {
+        "session_id": ws.session_id,
+        "sequence": ws.sequence,
+        "gateway": str(ws.gateway),
+        "user": {
+            "id": str(user.id),
+            "username": user.name,
+            "discriminator": user.discriminator,
+            "global_name": user.global_name,
+            "avatar": None,
+            "bot": user.bot,
+        },
+        "guilds": guilds,
+    }
+
+
+def warm_cache(client, snapshot):
+    """스냅샷의 사용자/서버/채널로 게이트웨이 캐시를 채움 (RESUME은 READY/GUILD_CREATE를 다시 보내지 않음)"""
+    state = client._connection
+    state.user = discord.ClientUser(state=state, data=snapshot["user"])
+    for guild in snapshot["guilds"]:
+        state._add_guild_from_data(guild)
+
+
+def missing_session_internals(client=None):
+    """세션 재사용에 필요하지만 설치된 discord.py에 없는 내부 API 이름 목록 (모두 있으면 빈 목록)
+
+    client를 넘기면 인스턴스에만 생기는 속성(_connection, _ready)도 확인합니다.
+    """
+    missing = []
+    state_class = getattr(getattr(discord, "state", None), "ConnectionState", None)
+    if not hasattr(state_class, "_add_guild_from_data"):
+        missing.append("ConnectionState._add_guild_from_data")
+    gateway = getattr(discord, "gateway", None)
+    if not hasattr(gateway, "ReconnectWebSocket"):
+        missing.append("gateway.ReconnectWebSocket")
+    from_client = getattr(getattr(gateway, "DiscordWebSocket", None), "from_client", None)
+    if from_client is None:
+        missing.append("DiscordWebSocket.from_client")
+    else:
+        parameters = inspect.signature(from_client).parameters
+        missing.extend(
+            f"DiscordWebSocket.from_client({name}=)"
+            for name in RESUME_PARAMS
+            if name not in parameters
+        )
+    if client is not None:
+        missing.extend(
+            f"Client.{name}" for name in ("_connection", "_ready") if not hasattr(client, name)
+        )
+    return missing
+
+
+@lru_cache(maxsize=None)
+def resumable_client_class():
+    """저장된 세션을 이어받는 게이트웨이 클라이언트 클래스 (discord 모듈은 처음 호출할 때 로드)"""
+
+    class ResumableClient(discord.Client):
+        """시작 시 저장된 세션으로 RESUME을 먼저 시도하고, 종료 시 세션을 저장한 뒤 세션을 유지한 채 닫는 클라이언트
+
+        RESUME에 성공하면 스냅샷으로 채운 캐시로 on_ready를 발생시켜 IDENTIFY와 GUILD_CREATE를
+        생략합니다. 세션이 만료되었거나 연결에 실패하면 일반 클라이언트처럼 IDENTIFY 합니다.
+        """
+
+        def __init__(self, *args, session=None, store=None, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.session = session
+            self.store = store
+
+        async def setup_hook(self):
+            # 컨테이너 재시작(SIGTERM)에도 세션을 저장하고 닫음
+            try:
+                asyncio.get_running_loop().add_signal_handler(
+                    signal.SIGTERM, lambda: asyncio.create_task(self.close())
+                )
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        async def connect(self, *, reconnect=True):
+            session, self.session = self.session, None
+            if session is not None:
+                await self.resume_session(session)
+                if self.is_closed():
+                    return
+            GATEWAY_SESSIONS.inc("identified")
+            await super().connect(reconnect=reconnect)
+
+        async def resume_session(self, session):
+            """저장된 세션을 RESUME하고 연결이 끝날 때까지 이벤트 처리 - IDENTIFY가 필요해지면 반환"""
+            logger.info(
+                f"[SESSION] 저장된 게이트웨이 세션으로 RESUME을 시도합니다 (seq {session['sequence']})"
+            )
+            warm_cache(self, session)
+            params = {
+                "initial": False,
+                "shard_id": self.shard_id,
+                "gateway": yarl.URL(session["gateway"]),
+                "session": session["session_id"],
+                "sequence": session["sequence"],
+                "resume": True,
+            }
+            ready_task = asyncio.create_task(self.ready_on_resumed())
+            try:
+                while not self.is_closed():
+                    try:
+                        self.ws = await asyncio.wait_for(
+                            discord.gateway.DiscordWebSocket.from_client(self, **params),
+                            timeout=60.0,
+                        )
+                        while True:
+                            await self.ws.poll_event()
+                    except discord.gateway.ReconnectWebSocket as e:
+                        self.dispatch("disconnect")
+                        if not e.resume:
+                            GATEWAY_SESSIONS.inc("invalidated")
+                            logger.info(
+                                "[SESSION] 저장된 세션이 만료되어 새로 IDENTIFY 합니다"
+                            )
+                            return
+                        params.update(
+                            sequence=self.ws.sequence,
+                            session=self.ws.session_id,
+                            gateway=self.ws.gateway,
+                        )
+            except (
+                OSError,
+                discord.HTTPException,
+                discord.GatewayNotFound,
+                discord.ConnectionClosed,
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+            ) as e:
+                if not self.is_closed():
+                    logger.warning(
+                        f"[SESSION] 세션 연결이 끊겨 새로 IDENTIFY 합니다: {e}"
+                    )
+            finally:
+                ready_task.cancel()
+
+        async def ready_on_resumed(self):
+            """RESUMED를 받으면 스냅샷 캐시로 준비 완료 처리 후 on_ready 발생"""
+            await self.wait_for("resumed")
+            GATEWAY_SESSIONS.inc("resumed")
+            logger.info(
+                f"[SESSION] 게이트웨이 세션을 이어받았습니다 (IDENTIFY 생략, 캐시된 서버 {len(self.guilds)}개)"
+            )
+            self._ready.set()
+            self.dispatch("ready")
+
+        async def close(self):
+            if not self.is_closed():
+                self.suspend_session()
+            await super().close()
+
+        def suspend_session(self):
+            """세션 스냅샷을 저장하고, 이후 연결을 닫을 때 세션을 유지하는 종료 코드를 쓰도록 함"""
+            if self.store is None or self.ws is None:
+                return
+            snapshot = session_snapshot(self, get_registry().ids())
+            if snapshot is None:
+                return
+            self.store.save_snapshot(SESSION_SNAPSHOT, snapshot)
+            ws = self.ws
+            close_ws = ws.close
+
+            async def close_keeping_session(code=SUSPEND_CLOSE_CODE):
+                await close_ws(code=SUSPEND_CLOSE_CODE)
+
+            ws.close = close_keeping_session
+            logger.info(
+                f"[SESSION] 게이트웨이 세션을 저장했습니다 (seq {snapshot['sequence']}, 채널 {sum(len(g['channels']) for g in snapshot['guilds'])}개)"
+            )
+
+    return ResumableClient
+
+
+def create_resumable_client(store=None, **kwargs):
+    """저장된 세션을 이어받는 게이트웨이 클라이언트 생성 (GATEWAY_RESUME_WINDOW=0이면 일반 클라이언트)"""
+    window = get_resume_window()
+    if window <= 0:
+        return create_gateway_client(**kwargs)
+    missing = missing_session_internals()
+    if missing:
+        warn_session_fallback(missing)
+        return create_gateway_client(**kwargs)
+    if store is None:
+        store = get_state_store()
+    client = create_gateway_client(
+        client_class=resumable_client_class(),
+        session=store.load_snapshot(SESSION_SNAPSHOT, max_age=window),
+        store=store,
+        **kwargs,
+    )
+    missing = missing_session_internals(client)
+    if missing:
+        # 세션을 이어받지도 저장하지도 않는 일반 클라이언트로 동작
+        warn_session_fallback(missing)
+        client.session = None
+        client.store = None
+    return client
+
+
+def warn_session_fallback(missing):
+    logger.warning(
+        f"[SESSION] discord.py {discord.__version__}에 세션 재사용에 필요한 내부 API가 없어 "
+        f"일반 IDENTIFY로 연결합니다: {', '.join(missing)}"
+    )
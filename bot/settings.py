@@ -0,0 +1,140 @@
+import json
+import os
+
+try:
+    from .utils import setup_logging
+    from .profiles import STATUS_TABLES, WORKING_HOURS, compile_profile, register_profile
+    from .render import RENDER_CACHE
+    from .holiday_index import (
+        CALENDAR_EMOJIS,
+        HOLIDAY_SHORT_NAMES,
+        refresh_holiday_labels,
+    )
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+    from profiles import STATUS_TABLES, WORKING_HOURS, compile_profile, register_profile
+    from render import RENDER_CACHE
+    from holiday_index import (
+        CALENDAR_EMOJIS,
+        HOLIDAY_SHORT_NAMES,
+        refresh_holiday_labels,
+    )
+
+# 로깅 설정
+logger = setup_logging("discord_settings")
+
+# 코드에 정의된 기본값 (설정 파일 값은 항상 이 위에 덮어써 다시 읽어도 결과가 같음)
+DEFAULT_CALENDAR_EMOJIS = {
+    code: dict(emojis) for code, emojis in CALENDAR_EMOJIS.items()
+}
+DEFAULT_SHORT_NAMES = dict(HOLIDAY_SHORT_NAMES)
+
+
+def get_settings_path():
+    """공휴일 이모지/축약 이름/근무 시간 설정 파일 경로 (BOT_CONFIG, 없으면 None)"""
+    return os.getenv("BOT_CONFIG") or None
+
+
+def parse_settings(data):
+    """설정 파일 내용을 검증해 {"holiday_emojis", "holiday_short_names", "working_hours"}로 정리
+
+    {"holiday_emojis": {"KR": {공휴일명: 이모지}}, "holiday_short_names": {공휴일명: 축약},
+    "working_hours": {프로필: [["09:30", "18:30", "work"], ...]}} 형식이며 모든 키는 선택입니다.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("설정 파일은 JSON 객체여야 합니다")
+    unknown = set(data) - {"holiday_emojis", "holiday_short_names", "working_hours"}
+    if unknown:
+        raise ValueError(f"알 수 없는 설정 항목입니다: {', '.join(sorted(unknown))}")
+
+    emojis = data.get("holiday_emojis") or {}
+    short_names = data.get("holiday_short_names") or {}
+    if not isinstance(emojis, dict) or not all(
+        isinstance(mapping, dict) for mapping in emojis.values()
+    ):
+        raise ValueError("holiday_emojis는 {국가 코드: {공휴일명: 이모지}} 형식이어야 합니다")
+    if not isinstance(short_names, dict):
+        raise ValueError("holiday_short_names는 {공휴일명: 축약 이름} 형식이어야 합니다")
+
+    working_hours = {}
+    for profile, periods in (data.get("working_hours") or {}).items():
+        try:
+            working_hours[profile] = compile_profile(
+                tuple(period) for period in periods
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"잘못된 근무 시간 프로필입니다 ({profile}): {e}") from None
+
+    return {
+        "holiday_emojis": {code: dict(mapping) for code, mapping in emojis.items()},
+        "holiday_short_names": dict(short_names),
+        "working_hours": working_hours,
+    }
+
+
+def load_settings(path=None):
+    """설정 파일을 읽어 검증한 설정 반환 (경로가 없으면 빈 설정)"""
+    path = path or get_settings_path()
+    if not path:
+        return parse_settings({})
+    with open(path, encoding="utf-8") as f:
+        return parse_settings(json.load(f))
+
+
+def replace_mapping(mapping, values):
+    """딕셔너리를 제자리에서 교체 (다른 모듈이 import한 참조도 새 값을 보도록) 후 변경 여부 반환"""
+    if mapping == values:
+        return False
+    mapping.clear()
+    mapping.update(values)
+    return True
+
+
+def apply_settings(settings):
+    """검증된 설정을 기본값 위에 적용하고 (공휴일 표시 변경 여부, 바뀐 근무 시간 프로필 집합) 반환
+
+    근무 시간 프로필은 추가/교체만 합니다 (사용 중인 프로필이 사라지지 않도록).
+    """
+    labels_changed = False
+    for code in set(DEFAULT_CALENDAR_EMOJIS) | set(settings["holiday_emojis"]):
+        values = dict(DEFAULT_CALENDAR_EMOJIS.get(code, {}))
+        values.update(settings["holiday_emojis"].get(code, {}))
+        mapping = CALENDAR_EMOJIS.setdefault(code, {})
+        labels_changed |= replace_mapping(mapping, values)
+    labels_changed |= replace_mapping(
+        HOLIDAY_SHORT_NAMES, {**DEFAULT_SHORT_NAMES, **settings["holiday_short_names"]}
+    )
+
+    changed_profiles = set()
+    for profile, periods in WORKING_HOURS.items():
+        table = settings["working_hours"].get(profile) or compile_profile(periods)
+        if STATUS_TABLES.get(profile) != table:
+            register_profile(profile, periods, table=table)
+            changed_profiles.add(profile)
+    for profile, table in settings["working_hours"].items():
+        if profile not in WORKING_HOURS and STATUS_TABLES.get(profile) != table:
+            register_profile(profile, None, table=table)
+            changed_profiles.add(profile)
+
+    if labels_changed:
+        refresh_holiday_labels()
+    if labels_changed or changed_profiles:
+        # 렌더링 캐시 키에는 공휴일 표시/근무 시간 내용이 없으므로 전체 무효화
+        RENDER_CACHE.clear()
+    return labels_changed, changed_profiles
+
+
+_APPLIED = False
+
+
+def ensure_settings():
+    """프로세스 시작 시 설정 파일을 한 번 적용 (레지스트리 검증 전에 프로필이 등록되도록)"""
+    global _APPLIED
+    if _APPLIED:
+        return
+    path = get_settings_path()
+    if path:
+        apply_settings(load_settings(path))
+        logger.info(f"[CONFIG] {path} 설정을 적용했습니다")
+    _APPLIED = True
@@ -0,0 +1,365 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from datetime import datetime
+
+import pytz
+
+try:
+    from .utils import setup_logging, check_discord_token
+    from .updater import update_channel_names
+    from .ratelimit import RENAME_BUDGET, get_rename_rps
+    from .rest import RestClient
+    from .registry import ChannelRegistry, get_registry, set_registry
+    from .runtime import run_reconcile, run_retries
+    from .metrics import METRICS, Counter, Gauge, process_rss_bytes
+    from .footprint import create_gateway_client, prune_channel_cache
+    from .state import DEFAULT_STATE_PATH
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging, check_discord_token
+    from updater import update_channel_names
+    from ratelimit import RENAME_BUDGET, get_rename_rps
+    from rest import RestClient
+    from registry import ChannelRegistry, get_registry, set_registry
+    from runtime import run_reconcile, run_retries
+    from metrics import METRICS, Counter, Gauge, process_rss_bytes
+    from footprint import create_gateway_client, prune_channel_cache
+    from state import DEFAULT_STATE_PATH
+
+# 로깅 설정
+logger = setup_logging("discord_sharding")
+
+# 워커가 스케줄 실행 결과를 돌려줄 때까지 기다리는 최대 시간 (초, SHARD_TICK_TIMEOUT로 변경)
+# 첫 실행은 게이트웨이 연결이 끝난 뒤 처리되므로 넉넉하게 잡음
+DEFAULT_TICK_TIMEOUT = 120.0
+# 워커 종료 요청 후 기다리는 시간 (초)
+WORKER_STOP_TIMEOUT = 10.0
+
+WORKER_RESTARTS = METRICS.register(
+    Counter(
+        "discord_bot_worker_restarts_total",
+        "비정상 종료되어 다시 시작한 샤드 워커 수",
+        ("worker",),
+    )
+)
+
+WORKER_RSS = METRICS.register(
+    Gauge(
+        "discord_bot_worker_resident_memory_bytes",
+        "샤드 워커 프로세스의 마지막 보고 RSS 바이트",
+        ("worker",),
+    )
+)
+
+
+def shard_for_guild(guild_id, shard_count):
+    """Discord 샤드 계산식 ((guild_id >> 22) % shard_count) - 서버 ID가 없으면 0번 샤드"""
+    if not guild_id:
+        return 0
+    return (guild_id >> 22) % shard_count
+
+
+def worker_shards(worker_id, worker_count, shard_count):
+    """워커가 맡을 샤드 ID 목록 (샤드를 워커 수로 나눈 나머지로 배분)"""
+    return [
+        shard_id for shard_id in range(shard_count) if shard_id % worker_count == worker_id
+    ]
+
+
+def shard_registry(registry, shard_ids, shard_count):
+    """shard_ids에 속한 서버의 채널만 담은 레지스트리"""
+    shard_ids = set(shard_ids)
+    return ChannelRegistry(
+        {
+            key: record
+            for key, record in registry.items()
+            if shard_for_guild(record["guild_id"], shard_count) in shard_ids
+        }
+    )
+
+
+def shard_state_path(path, shard_ids):
+    """워커별 적용 이름 저장소 경로 (기본 경로에 맡은 샤드 ID를 붙임, 메모리 전용은 그대로)
+
+    워커마다 따로 저장소를 열어 여러 프로세스가 하나의 SQLite 파일에 동시에 쓰지 않도록 합니다.
+    """
+    if path == ":memory:":
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.shard{'-'.join(map(str, shard_ids))}{ext}"
+
+
+async def connect_worker_client(engine, token, shard_ids, shard_count, channel_ids):
+    """워커용 연결 생성 - 게이트웨이는 맡은 샤드만 연결하고 준비될 때까지 대기"""
+    if engine == "rest":
+        client = RestClient(token)
+        await client.start()
+        return client, None
+
+    import discord
+
+    client = create_gateway_client(
+        discord.AutoShardedClient, shard_ids=shard_ids, shard_count=shard_count
+    )
+    connect_task = asyncio.create_task(client.start(token))
+    ready_task = asyncio.create_task(client.wait_until_ready())
+    await asyncio.wait((connect_task, ready_task), return_when=asyncio.FIRST_COMPLETED)
+    if connect_task.done():
+        # 로그인 실패 등으로 연결이 끝났으면 예외 전달
+        ready_task.cancel()
+        connect_task.result()
+    prune_channel_cache(client, channel_ids)
+    return client, connect_task
+
+
+async def run_worker(worker_id, shard_ids, shard_count, engine, connection):
+    """맡은 샤드의 채널만 업데이트하는 워커 - 감독 프로세스의 실행 요청마다 결과 반환"""
+    token = check_discord_token()
+    registry = set_registry(shard_registry(get_registry(), shard_ids, shard_count))
+    # 초당 요청 예산은 맡은 샤드 비율만큼 나눠 가짐 (워커 전체 합이 RENAME_RPS를 넘지 않도록)
+    RENAME_BUDGET.rate = get_rename_rps() * len(shard_ids) / shard_count
+    # 적용 이름 저장소는 워커마다 따로 사용 (저장소를 처음 열기 전에 경로 지정)
+    os.environ["BOT_STATE_DB"] = shard_state_path(
+        os.getenv("BOT_STATE_DB", DEFAULT_STATE_PATH), shard_ids
+    )
+    # 분산 구간은 감독 프로세스가 기다리는 시간의 절반 안에서만 사용 (나머지는 예산 대기와 재시도)
+    tick_timeout = float(os.getenv("SHARD_TICK_TIMEOUT", DEFAULT_TICK_TIMEOUT))
+    spread_limit = float(os.getenv("RENAME_SPREAD_LIMIT", tick_timeout / 2))
+    os.environ["RENAME_SPREAD_LIMIT"] = str(min(spread_limit, tick_timeout / 2))
+    logger.info(
+        f"[WORKER] 워커 {worker_id} 시작 - 샤드 {shard_ids}/{shard_count}, 채널 {len(registry)}개"
+    )
+
+    client, connect_task = await connect_worker_client(
+        engine, token, shard_ids, shard_count, registry.ids()
+    )
+    tasks = [
+        asyncio.create_task(run_retries(client, registry)),
+        asyncio.create_task(run_reconcile(client, registry)),
+    ]
+    loop = asyncio.get_running_loop()
+
+    try:
+        while True:
+            try:
+                message = await loop.run_in_executor(None, connection.recv)
+            except EOFError:
+                # 감독 프로세스가 종료됨
+                break
+            if message is None:
+                break
+
+            start_time = time.perf_counter()
+            # 이번 실행에서 이름이 바뀌는 채널 중 이 워커가 맡은 채널만 처리 (None이면 전체)
+            channels = message["channels"]
+            if channels is not None:
+                channels = [key for key in channels if key in registry]
+            try:
+                report = await update_channel_names(
+                    client,
+                    channels=channels,
+                    now=datetime.fromtimestamp(message["now"], pytz.utc),
+                    registry=registry,
+                )
+            except Exception as e:
+                logger.error(f"[ERROR] 워커 {worker_id} 채널 업데이트 중 오류 발생: {e}")
+                report = []
+
+            statuses = {}
+            for result in report:
+                statuses[result["status"]] = statuses.get(result["status"], 0) + 1
+            # 측정값은 변화량만 넘기고 초기화 (감독 프로세스가 합산)
+            connection.send(
+                {
+                    "worker": worker_id,
+                    "tick": message["tick"],
+                    "statuses": statuses,
+                    "elapsed": time.perf_counter() - start_time,
+                    "metrics": METRICS.snapshot(),
+                    "rss": process_rss_bytes(),
+                }
+            )
+            METRICS.reset()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await client.close()
+        if connect_task is not None:
+            connect_task.cancel()
+
+
+def worker_main(worker_id, shard_ids, shard_count, engine, connection):
+    """워커 프로세스 진입점"""
+    import discord
+
+    try:
+        asyncio.run(run_worker(worker_id, shard_ids, shard_count, engine, connection))
+    except discord.LoginFailure:
+        logger.error("[LOGINF] Discord 토큰이 잘못되었습니다")
+        raise SystemExit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+class ShardSupervisor:
+    """샤드 워커 프로세스를 띄우고 스케줄 실행을 나눠 보내며 결과를 합산하는 감독자
+
+    채널 레지스트리는 서버(guild) 기준 샤드로 나누고, 샤드는 워커 프로세스에 고르게 배분합니다.
+    비정상 종료된 워커는 다음 실행 전(또는 ensure_alive 호출 시) 다시 시작합니다.
+    """
+
+    def __init__(
+        self, worker_count=None, shard_count=None, engine="gateway", tick_timeout=None
+    ):
+        if worker_count is None:
+            worker_count = int(os.getenv("SHARD_WORKERS", 0)) or os.cpu_count() or 1
+        if shard_count is None:
+            shard_count = int(os.getenv("SHARD_COUNT", 0)) or worker_count
+        if tick_timeout is None:
+            tick_timeout = float(os.getenv("SHARD_TICK_TIMEOUT", DEFAULT_TICK_TIMEOUT))
+
+        # 샤드보다 많은 워커는 할 일이 없으므로 샤드 수로 제한
+        self.worker_count = max(1, min(worker_count, shard_count))
+        self.shard_count = shard_count
+        self.engine = engine
+        self.tick_timeout = tick_timeout
+        # {워커 ID: (프로세스, 파이프 연결)}
+        self.workers = {}
+        self._tick = 0
+        self._lock = threading.Lock()
+        self._context = multiprocessing.get_context("spawn")
+
+    def shards_for(self, worker_id):
+        return worker_shards(worker_id, self.worker_count, self.shard_count)
+
+    def _spawn(self, worker_id):
+        connection, worker_connection = self._context.Pipe()
+        process = self._context.Process(
+            target=worker_main,
+            args=(
+                worker_id,
+                self.shards_for(worker_id),
+                self.shard_count,
+                self.engine,
+                worker_connection,
+            ),
+            name=f"shard-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        worker_connection.close()
+        self.workers[worker_id] = (process, connection)
+
+    def start(self):
+        logger.info(
+            f"[SHARDS] 워커 {self.worker_count}개로 샤드 {self.shard_count}개를 실행합니다 (엔진: {self.engine})"
+        )
+        with self._lock:
+            for worker_id in range(self.worker_count):
+                self._spawn(worker_id)
+
+    def _restart(self, worker_id):
+        process, connection = self.workers[worker_id]
+        if process.is_alive():
+            process.terminate()
+        process.join(WORKER_STOP_TIMEOUT)
+        connection.close()
+        WORKER_RESTARTS.inc(str(worker_id))
+        self._spawn(worker_id)
+
+    def _ensure_alive(self):
+        restarted = []
+        for worker_id, (process, _) in list(self.workers.items()):
+            if process.is_alive():
+                continue
+            logger.warning(
+                f"[SHARDS] 워커 {worker_id}가 종료되었습니다 (exit code: {process.exitcode}) - 다시 시작합니다"
+            )
+            self._restart(worker_id)
+            restarted.append(worker_id)
+        return restarted
+
+    def ensure_alive(self):
+        """비정상 종료된 워커를 다시 시작하고 다시 시작한 워커 ID 목록 반환"""
+        with self._lock:
+            return self._ensure_alive()
+
+    def _collect(self, message, statuses):
+        """워커 응답의 측정값을 합산하고 현재 실행의 결과면 상태별 개수를 더함"""
+        METRICS.merge(message["metrics"])
+        WORKER_RSS.set(message["rss"], str(message["worker"]))
+        if message["tick"] != self._tick:
+            return False
+        for status, count in message["statuses"].items():
+            statuses[status] = statuses.get(status, 0) + count
+        return True
+
+    def tick(self, now, channels=None):
+        """모든 워커에 스케줄 실행(channels 지정 시 해당 채널 키만)을 보내고 상태별 채널 수 합계 반환"""
+        with self._lock:
+            self._ensure_alive()
+            self._tick += 1
+            statuses = {}
+            pending = {}
+
+            for worker_id, (_, connection) in list(self.workers.items()):
+                try:
+                    # 이전 실행에서 늦게 도착한 응답은 측정값만 합산
+                    while connection.poll():
+                        self._collect(connection.recv(), statuses)
+                    connection.send(
+                        {
+                            "tick": self._tick,
+                            "now": now.timestamp(),
+                            "channels": channels,
+                        }
+                    )
+                except (OSError, EOFError) as e:
+                    logger.warning(
+                        f"[SHARDS] 워커 {worker_id}에 실행 요청 실패: {e} - 다시 시작합니다"
+                    )
+                    self._restart(worker_id)
+                    continue
+                pending[worker_id] = connection
+
+            responded = 0
+            deadline = time.monotonic() + self.tick_timeout
+            for worker_id, connection in pending.items():
+                try:
+                    while connection.poll(max(deadline - time.monotonic(), 0)):
+                        if self._collect(connection.recv(), statuses):
+                            responded += 1
+                            break
+                    else:
+                        logger.warning(
+                            f"[SHARDS] 워커 {worker_id}가 {self.tick_timeout:.0f}초 안에 응답하지 않았습니다"
+                        )
+                except (OSError, EOFError):
+                    logger.warning(f"[SHARDS] 워커 {worker_id}의 연결이 끊어졌습니다")
+
+        updated = statuses.get("updated", 0)
+        total = sum(statuses.values())
+        worker_rss = sum(value for _, _, value in WORKER_RSS.samples())
+        logger.info(
+            f"[SHARDS] 워커 {responded}/{self.worker_count}개 응답 - {total}개 채널 중 {updated}개 업데이트 (워커 RSS 합계 {worker_rss / 1024 / 1024:.1f}MB)"
+        )
+        return statuses
+
+    def stop(self):
+        """모든 워커에 종료 요청 후 정리"""
+        with self._lock:
+            for process, connection in self.workers.values():
+                try:
+                    connection.send(None)
+                except (OSError, EOFError):
+                    pass
+            for process, connection in self.workers.values():
+                process.join(WORKER_STOP_TIMEOUT)
+                if process.is_alive():
+                    process.terminate()
+                connection.close()
+            self.workers.clear()
+        logger.info("[SHARDS] 모든 워커를 종료했습니다")
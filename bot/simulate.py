@@ -0,0 +1,486 @@
+import argparse
+import json
+import sys
+import time
+from array import array
+from datetime import date, datetime, timedelta
+
+import pytz
+
+try:
+    from .utils import setup_logging
+    from .profiles import MINUTES_PER_DAY, STATUS_BOUNDARIES, STATUS_EMOJIS, STATUS_TABLES
+    from .render import format_minute, get_offset_cache
+    from .registry import get_registry
+    from .holiday_index import CALENDAR_EMOJIS, DEFAULT_HOLIDAY_EMOJI, get_holiday_index
+    from .schedule import next_class_change_time
+    from .updater import is_night_hour, night_window, render_channel_name
+    from .plan import NIGHT_STATE, compile_plan, expand_name, local_instant, local_midnight
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+    from profiles import MINUTES_PER_DAY, STATUS_BOUNDARIES, STATUS_EMOJIS, STATUS_TABLES
+    from render import format_minute, get_offset_cache
+    from registry import get_registry
+    from holiday_index import CALENDAR_EMOJIS, DEFAULT_HOLIDAY_EMOJI, get_holiday_index
+    from schedule import next_class_change_time
+    from updater import is_night_hour, night_window, render_channel_name
+    from plan import NIGHT_STATE, compile_plan, expand_name, local_instant, local_midnight
+
+# 로깅 설정
+logger = setup_logging("discord_simulate")
+
+KST = pytz.timezone("Asia/Seoul")
+
+# 변경 목록 파일 형식 (첫 줄 식별자, 둘째 줄 JSON 헤더, 이후 열별 바이너리)
+SIMULATION_MAGIC = b"TZSIM\n"
+SIMULATION_VERSION = 1
+SIMULATION_COLUMNS = (("instant", "q"), ("class", "H"), ("state", "I"))
+
+# 불일치 종류별로 출력하는 예시 수
+MAX_EXAMPLES = 5
+
+# 이름 렌더링 교차 확인에 쓰는 클래스별 표본 수 기본값
+DEFAULT_RENDER_SAMPLES = 200
+
+
+class StateTable:
+    """(문구, 상태 이모지) 또는 야간 상태를 번호로 바꿔 보관하는 상태 목록"""
+
+    def __init__(self):
+        self.states = []
+        self._ids = {}
+
+    def intern(self, state):
+        state_id = self._ids.get(state)
+        if state_id is None:
+            state_id = self._ids[state] = len(self.states)
+            self.states.append(state)
+        return state_id
+
+
+def weekday_minutes(info):
+    """평일 하루의 분별 표시 상태 기준 분 (야간은 -1)과 갱신 격자만으로는 놓치는 분 목록
+
+    스케줄러는 자정, 갱신 간격, 야간 시작/종료로 이루어진 갱신 격자와 근무 상태 경계에서
+    이름을 바꾸므로 각 분에는 직전 갱신 시각의 이름이 표시됩니다. 근무 상태 경계가 격자에
+    없으면 그 변경은 경계 후보로만 실행되므로, 격자 시각만으로 표시했을 때 근무 상태가 실제와
+    달라지는 분을 따로 모아 알립니다.
+    """
+    _, night_start, night_end = night_window(info)
+    table = STATUS_TABLES[info["profile"]]
+    grid = {0, night_start * 60, night_end * 60} | set(
+        range(0, MINUTES_PER_DAY, info["interval"])
+    )
+    fires = grid | set(STATUS_BOUNDARIES[info["profile"]])
+
+    shown = array("h", [-1]) * MINUTES_PER_DAY
+    stale = []
+    last_fire = 0
+    last_grid = 0
+    for minute in range(MINUTES_PER_DAY):
+        if minute in fires:
+            last_fire = minute
+        if minute in grid:
+            last_grid = minute
+        if is_night_hour(minute // 60, night_start, night_end):
+            continue
+        shown[minute] = last_fire
+        if table[last_grid] != table[minute]:
+            stale.append(minute)
+    return shown, stale
+
+
+def day_templates(info, entries, states):
+    """날짜 종류(평일 0, 휴일/주말 항목 번호)별 하루 변경 목록 [(분, 상태 번호)]와 평일 누락 분"""
+    _, night_start, night_end = night_window(info)
+    shown, stale = weekday_minutes(info)
+    table = STATUS_TABLES[info["profile"]]
+    night = states.intern(NIGHT_STATE)
+
+    templates = {}
+    for entry_id, entry in enumerate(entries):
+        codes = array("I", bytes(4 * MINUTES_PER_DAY))
+        for minute in range(MINUTES_PER_DAY):
+            if is_night_hour(minute // 60, night_start, night_end):
+                codes[minute] = night
+            elif entry_id:
+                codes[minute] = states.intern(entry)
+            else:
+                fire = shown[minute]
+                codes[minute] = states.intern(
+                    (format_minute(fire), STATUS_EMOJIS[table[fire]])
+                )
+        templates[entry_id] = [
+            (minute, codes[minute])
+            for minute in range(MINUTES_PER_DAY)
+            if minute == 0 or codes[minute] != codes[minute - 1]
+        ]
+    return templates, stale
+
+
+def simulate_class(info, start_ts, end_ts, states):
+    """스케줄 클래스 하나의 [start_ts, end_ts) 변경 열 (시각 배열, 상태 번호 배열)과 요약
+
+    날짜별 공휴일 항목을 공휴일 색인에서 한 번에 잘라 오고, 날짜 종류별 하루 변경 목록을
+    각 날짜의 현지 자정에 더해 이어 붙입니다 (분 단위 함수 호출 없음).
+    """
+    offsets = get_offset_cache(info["tz"])
+    first_day, _ = offsets.local_day_minute(start_ts)
+    last_day, _ = offsets.local_day_minute(end_ts)
+    count = last_day - first_day + 1
+
+    # 첫날과 마지막 날을 모두 덮도록 공휴일 색인 범위 확인
+    get_holiday_index(date.fromordinal(first_day))
+    index = get_holiday_index(date.fromordinal(last_day))
+    flags, entry_ids, entries = index.day_entries(info["calendar"], first_day, count)
+    templates, stale = day_templates(info, entries, states)
+
+    instants = array("q")
+    codes = array("I")
+    previous = None
+    for offset in range(count):
+        midnight = local_midnight(offsets, first_day + offset)
+        for minute, code in templates[entry_ids[offset]]:
+            instant = local_instant(offsets, midnight, minute)
+            if instant >= end_ts:
+                break
+            if instant < start_ts:
+                previous = code
+                continue
+            if code == previous:
+                continue
+            if not instants and instant > start_ts and previous is not None:
+                # 구간 시작 시각의 상태를 첫 행으로 기록
+                instants.append(start_ts)
+                codes.append(previous)
+            instants.append(instant)
+            codes.append(code)
+            previous = code
+
+    weekdays = sum(1 for entry_id in entry_ids if not entry_id)
+    return instants, codes, {
+        "first_day": first_day,
+        "flags": flags,
+        "off_days": count - weekdays,
+        "stale_minutes": stale,
+        "stale_days": weekdays if stale else 0,
+    }
+
+
+def simulate(registry, start, end):
+    """레지스트리 전체의 [start, end) 구간을 스케줄 클래스별로 시뮬레이션"""
+    start_ts = int(start.timestamp())
+    end_ts = int(end.timestamp())
+    states = StateTable()
+    classes = []
+    for class_key, members in registry.by_class.items():
+        info = registry[members[0]]
+        instants, codes, summary = simulate_class(info, start_ts, end_ts, states)
+        classes.append(
+            dict(
+                summary,
+                key=class_key,
+                members=list(members),
+                instants=instants,
+                states=codes,
+            )
+        )
+    return {"start": start_ts, "end": end_ts, "states": states.states, "classes": classes}
+
+
+def check_plan(registry, result):
+    """컴파일된 이름 변경 계획과 시뮬레이션 결과 비교 - 불일치 목록 [(클래스 키, 시각, 설명)]"""
+    plan = compile_plan(
+        registry,
+        datetime.fromtimestamp(result["start"], pytz.utc),
+        datetime.fromtimestamp(result["end"], pytz.utc),
+    )
+    states = result["states"]
+    mismatches = []
+    for entry, simulated in zip(plan.classes, result["classes"]):
+        planned = dict(
+            zip(entry["instants"], (plan.states[s] for s in entry["states"]))
+        )
+        actual = dict(
+            zip(simulated["instants"], (states[s] for s in simulated["states"]))
+        )
+        for instant in sorted(planned.keys() | actual.keys()):
+            if planned.get(instant) != actual.get(instant):
+                mismatches.append(
+                    (
+                        simulated["key"],
+                        instant,
+                        f"계획 {planned.get(instant)} / 시뮬레이션 {actual.get(instant)}",
+                    )
+                )
+    return mismatches
+
+
+def check_scheduler(registry, result):
+    """next_class_change_time을 따라간 실행 시각과 변경 시각 비교 - (누락 목록, 빈 실행 목록)"""
+    end = datetime.fromtimestamp(result["end"], pytz.utc)
+    missed = []
+    idle = []
+    for simulated in result["classes"]:
+        class_key = simulated["key"]
+        fires = set()
+        now = datetime.fromtimestamp(result["start"], pytz.utc)
+        while True:
+            now = next_class_change_time(registry, class_key, now)
+            if now is None or now >= end:
+                break
+            fires.add(int(now.timestamp()))
+        transitions = set(simulated["instants"][1:])
+        missed.extend((class_key, instant) for instant in sorted(transitions - fires))
+        idle.extend((class_key, instant) for instant in sorted(fires - transitions))
+    return missed, idle
+
+
+def check_render(registry, result, samples=DEFAULT_RENDER_SAMPLES):
+    """클래스별로 고르게 뽑은 변경 시각에서 render_channel_name 결과와 시뮬레이션 이름 비교"""
+    states = result["states"]
+    mismatches = []
+    for simulated in result["classes"]:
+        key = simulated["members"][0]
+        info = registry[key]
+        channel = {
+            "region": info["region"],
+            "emoji": info["emoji"],
+            "template": info["template"],
+            "night_text": info.get("night_text"),
+        }
+        rows = len(simulated["instants"])
+        step = max(rows // samples, 1) if samples else rows + 1
+        for row in range(0, rows, step):
+            instant = simulated["instants"][row]
+            expected = expand_name(channel, states[simulated["states"][row]])
+            rendered = render_channel_name(
+                key, info, datetime.fromtimestamp(instant, pytz.utc)
+            )
+            if rendered != expected:
+                mismatches.append(
+                    (simulated["key"], instant, f"{rendered!r} != {expected!r}")
+                )
+    return mismatches
+
+
+def unmapped_holidays(result, registry):
+    """구간 안에서 이모지 매핑이 없어 기본 이모지로 표시되는 공휴일 {달력: {공휴일명}}"""
+    unmapped = {}
+    for simulated in result["classes"]:
+        calendar = registry[simulated["members"][0]]["calendar"]
+        emojis = CALENDAR_EMOJIS.get(calendar)
+        if emojis is None:
+            continue
+        index = get_holiday_index(date.fromordinal(simulated["first_day"]))
+        for offset, flag in enumerate(simulated["flags"]):
+            if not flag:
+                continue
+            name = index.holiday_name(
+                calendar, date.fromordinal(simulated["first_day"] + offset)
+            )
+            if name is not None and emojis.get(name, DEFAULT_HOLIDAY_EMOJI) == DEFAULT_HOLIDAY_EMOJI:
+                unmapped.setdefault(calendar, set()).add(name)
+    return unmapped
+
+
+def write_transitions(path, result):
+    """변경 목록을 열 단위 파일로 저장 (시각 int64, 클래스 uint16, 상태 uint32 + 날짜별 휴일 플래그)"""
+    columns = {name: array(typecode) for name, typecode in SIMULATION_COLUMNS}
+    for class_index, simulated in enumerate(result["classes"]):
+        columns["instant"].extend(simulated["instants"])
+        columns["class"].extend([class_index] * len(simulated["instants"]))
+        columns["state"].extend(simulated["states"])
+
+    header = {
+        "version": SIMULATION_VERSION,
+        "start": result["start"],
+        "end": result["end"],
+        "rows": len(columns["instant"]),
+        "columns": SIMULATION_COLUMNS,
+        "states": result["states"],
+        "classes": [
+            {
+                "key": list(simulated["key"]),
+                "members": simulated["members"],
+                "first_day": simulated["first_day"],
+                "days": len(simulated["flags"]),
+            }
+            for simulated in result["classes"]
+        ],
+    }
+    with open(path, "wb") as f:
+        f.write(SIMULATION_MAGIC)
+        f.write(json.dumps(header, ensure_ascii=False).encode() + b"\n")
+        for name, _ in SIMULATION_COLUMNS:
+            f.write(columns[name].tobytes())
+        for simulated in result["classes"]:
+            f.write(bytes(simulated["flags"]))
+
+
+def read_transitions(path):
+    """write_transitions로 저장한 파일을 (헤더, {열 이름: array}, [클래스별 휴일 플래그])로 읽기"""
+    with open(path, "rb") as f:
+        if f.readline() != SIMULATION_MAGIC:
+            raise ValueError(f"시뮬레이션 변경 목록 파일이 아닙니다: {path}")
+        header = json.loads(f.readline())
+        if header.get("version") != SIMULATION_VERSION:
+            raise ValueError(f"지원하지 않는 파일 버전입니다: {header.get('version')}")
+        columns = {}
+        for name, typecode in header["columns"]:
+            column = array(typecode)
+            column.frombytes(f.read(column.itemsize * header["rows"]))
+            columns[name] = column
+        flags = [bytearray(f.read(entry["days"])) for entry in header["classes"]]
+    return header, columns, flags
+
+
+def log_examples(tag, examples, describe):
+    for example in examples[:MAX_EXAMPLES]:
+        logger.warning(f"[{tag}] {describe(example)}")
+    if len(examples) > MAX_EXAMPLES:
+        logger.warning(f"[{tag}] ... 외 {len(examples) - MAX_EXAMPLES}건")
+
+
+def format_instant(instant):
+    return datetime.fromtimestamp(instant, KST).strftime("%Y-%m-%d %H:%M")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m bot.simulate",
+        description="날짜 구간 전체의 채널 이름 변경을 시뮬레이션하고 스케줄/계획/렌더링과 교차 확인",
+    )
+    parser.add_argument(
+        "--start",
+        type=date.fromisoformat,
+        default=date(date.today().year, 1, 1),
+        help="시작 날짜 (한국 시간 자정 기준, 기본: 올해 1월 1일)",
+    )
+    parser.add_argument("--days", type=int, default=365, help="시뮬레이션 일 수")
+    parser.add_argument(
+        "--channels",
+        type=int,
+        default=None,
+        help="기본 채널 설정을 반복한 가상 채널 수 (미지정 시 채널 레지스트리 사용)",
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=DEFAULT_RENDER_SAMPLES,
+        help="클래스별 렌더링 교차 확인 표본 수 (0이면 생략)",
+    )
+    parser.add_argument(
+        "--no-scheduler",
+        dest="scheduler",
+        action="store_false",
+        help="next_class_change_time 교차 확인 생략",
+    )
+    parser.add_argument("--output", help="변경 목록 파일 저장 경로")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """구간 시뮬레이션: python -m bot.simulate [옵션] - 불일치가 있으면 1 반환"""
+    options = parse_args(argv)
+    if options.channels:
+        try:
+            from .benchmark import synthetic_registry
+        except ImportError:
+            # 직접 실행될 때를 위한 대체 import
+            from benchmark import synthetic_registry
+        registry = synthetic_registry(options.channels)
+    else:
+        registry = get_registry()
+
+    start = KST.localize(datetime.combine(options.start, datetime.min.time()))
+    end = KST.normalize(start + timedelta(days=options.days))
+
+    started = time.perf_counter()
+    result = simulate(registry, start, end)
+    elapsed = time.perf_counter() - started
+    rows = sum(len(simulated["instants"]) for simulated in result["classes"])
+    renames = sum(
+        len(simulated["instants"]) * len(simulated["members"])
+        for simulated in result["classes"]
+    )
+    logger.info(
+        f"[SIM] {len(registry)}개 채널 ({len(result['classes'])}개 스케줄 클래스), {options.start} 부터 {options.days}일: 변경 {rows:,}행 / 채널 기준 {renames:,}건 ({elapsed:.2f}초)"
+    )
+    for simulated in result["classes"]:
+        logger.info(
+            f"[SIM] {simulated['key'][0]} ({simulated['key'][1]}, {simulated['key'][4]}분 간격): 변경 {len(simulated['instants']):,}회, 휴일/주말 {simulated['off_days']}일"
+        )
+
+    if options.output:
+        write_transitions(options.output, result)
+        logger.info(f"[SIM] 변경 목록 저장: {options.output}")
+
+    failures = 0
+
+    stale = [s for s in result["classes"] if s["stale_minutes"]]
+    for simulated in stale:
+        minutes = simulated["stale_minutes"]
+        failures += len(minutes) * simulated["stale_days"]
+        logger.warning(
+            f"[STALE] {simulated['key'][0]}: 근무 상태 경계가 갱신 격자 밖에 있어 평일마다 {len(minutes)}분 동안 격자 갱신만으로는 근무 상태가 바뀌지 않습니다 (첫 분: {format_minute(minutes[0])}, {simulated['stale_days']}일)"
+        )
+
+    started = time.perf_counter()
+    mismatches = check_plan(registry, result)
+    failures += len(mismatches)
+    log_examples(
+        "PLAN",
+        mismatches,
+        lambda m: f"{m[0][0]} {format_instant(m[1])}: {m[2]}",
+    )
+    logger.info(
+        f"[SIM] 이름 변경 계획 비교: 불일치 {len(mismatches)}건 ({time.perf_counter() - started:.2f}초)"
+    )
+
+    if options.scheduler:
+        started = time.perf_counter()
+        missed, idle = check_scheduler(registry, result)
+        failures += len(missed)
+        log_examples(
+            "MISSED",
+            missed,
+            lambda m: f"{m[0][0]} {format_instant(m[1])} 변경을 스케줄러가 실행하지 않습니다",
+        )
+        log_examples(
+            "IDLE",
+            idle,
+            lambda m: f"{m[0][0]} {format_instant(m[1])} 실행 시 이름이 바뀌지 않습니다",
+        )
+        logger.info(
+            f"[SIM] 스케줄러 비교: 누락 {len(missed)}건, 빈 실행 {len(idle)}건 ({time.perf_counter() - started:.2f}초)"
+        )
+
+    if options.samples:
+        started = time.perf_counter()
+        mismatches = check_render(registry, result, options.samples)
+        failures += len(mismatches)
+        log_examples(
+            "RENDER",
+            mismatches,
+            lambda m: f"{m[0][0]} {format_instant(m[1])}: {m[2]}",
+        )
+        logger.info(
+            f"[SIM] 렌더링 비교: 불일치 {len(mismatches)}건 ({time.perf_counter() - started:.2f}초)"
+        )
+
+    for calendar, names in unmapped_holidays(result, registry).items():
+        logger.warning(
+            f"[EMOJI] {calendar} 공휴일 이모지 매핑 없음 (기본 {DEFAULT_HOLIDAY_EMOJI} 사용): {', '.join(sorted(names))}"
+        )
+
+    if failures:
+        logger.error(f"[SIM] 불일치 {failures:,}건이 발견되었습니다")
+        return 1
+    logger.info("[SIM] 모든 확인을 통과했습니다")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+import json
+import os
+import sqlite3
+import time
+
+try:
+    from .utils import setup_logging
+except ImportError:
+    # 직접 실행될 때를 위한 대체 import
+    from utils import setup_logging
+
+# 로깅 설정
+logger = setup_logging("discord_state")
+
+# 마지막으로 적용한 채널 이름 저장소 기본 위치 (BOT_STATE_DB로 변경, ":memory:"는 메모리 전용)
+DEFAULT_STATE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "state.db"
+)
+
+# Discord 실제 이름과 대조하는 주기 기본값 (초, STATE_RECONCILE_INTERVAL로 변경)
+DEFAULT_RECONCILE_INTERVAL = 6 * 3600
+
+STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS applied_names (
+    channel_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    applied_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS state_meta (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runtime_snapshots (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    saved_at REAL NOT NULL
+);
+"""
+
+
+class AppliedNameStore:
+    """채널별로 마지막으로 적용한 이름과 시각을 보관하는 write-through 저장소
+
+    조회는 메모리 사본에서만 하므로 네트워크/디스크 I/O가 없고,
+    기록은 메모리와 SQLite에 동시에 반영합니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.getenv("BOT_STATE_DB", DEFAULT_STATE_PATH)
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(STATE_SCHEMA)
+        self._names = {
+            channel_id: (name, applied_at)
+            for channel_id, name, applied_at in self._connection.execute(
+                "SELECT channel_id, name, applied_at FROM applied_names"
+            )
+        }
+        row = self._connection.execute(
+            "SELECT value FROM state_meta WHERE key = 'last_reconciled'"
+        ).fetchone()
+        self.last_reconciled = row[0] if row else None
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, channel_id):
+        return channel_id in self._names
+
+    def get(self, channel_id):
+        """(이름, 적용 시각) 또는 None"""
+        return self._names.get(channel_id)
+
+    def is_current(self, channel_id, name):
+        """저장된 이름과 같은지 확인 (I/O 없음)"""
+        entry = self._names.get(channel_id)
+        return entry is not None and entry[0] == name
+
+    def record(self, channel_id, name, applied_at=None):
+        """적용한 이름 기록 (메모리와 SQLite에 즉시 반영)"""
+        applied_at = applied_at or time.time()
+        self._names[channel_id] = (name, applied_at)
+        self._connection.execute(
+            "INSERT OR REPLACE INTO applied_names (channel_id, name, applied_at) VALUES (?, ?, ?)",
+            (channel_id, name, applied_at),
+        )
+        self._connection.commit()
+
+    def forget(self, channel_id):
+        """기록 삭제 - 다음 렌더링 때 다시 적용됨"""
+        if self._names.pop(channel_id, None) is not None:
+            self._connection.execute(
+                "DELETE FROM applied_names WHERE channel_id = ?", (channel_id,)
+            )
+            self._connection.commit()
+
+    def reconcile(self, observed_names):
+        """Discord에서 확인한 실제 이름({채널 ID: 이름})과 비교해 다른 채널 ID 목록 반환
+
+        저장된 이름과 다르면(수동 변경 등) 기록을 실제 이름으로 교체합니다.
+        """
+        mismatched = []
+        for channel_id, actual_name in observed_names.items():
+            entry = self._names.get(channel_id)
+            if entry is not None and entry[0] == actual_name:
+                continue
+            if entry is not None:
+                mismatched.append(channel_id)
+            self.record(channel_id, actual_name)
+        self.last_reconciled = time.time()
+        self._connection.execute(
+            "INSERT OR REPLACE INTO state_meta (key, value) VALUES ('last_reconciled', ?)",
+            (self.last_reconciled,),
+        )
+        self._connection.commit()
+        return mismatched
+
+    def reconcile_due(self, interval=None):
+        """마지막 대조 후 interval(초)이 지났는지 여부"""
+        if interval is None:
+            interval = get_reconcile_interval()
+        return (
+            self.last_reconciled is None
+            or time.time() - self.last_reconciled >= interval
+        )
+
+    def save_snapshot(self, key, value):
+        """재시작 후 이어서 쓸 런타임 상태(JSON으로 저장할 수 있는 값) 기록"""
+        self._connection.execute(
+            "INSERT OR REPLACE INTO runtime_snapshots (key, value, saved_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value, ensure_ascii=False), time.time()),
+        )
+        self._connection.commit()
+
+    def load_snapshot(self, key, max_age=None):
+        """기록된 런타임 상태 (없거나, max_age초보다 오래되었거나, 읽을 수 없으면 None)"""
+        row = self._connection.execute(
+            "SELECT value, saved_at FROM runtime_snapshots WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, saved_at = row
+        if max_age is not None and time.time() - saved_at > max_age:
+            return None
+        try:
+            return json.loads(value)
+        except ValueError as e:
+            logger.warning(f"[WARNING] 런타임 스냅샷을 읽을 수 없습니다 ({key}): {e}")
+            return None
+
+    def close(self):
+        self._connection.close()
+
+
+def get_reconcile_interval():
+    return float(os.getenv("STATE_RECONCILE_INTERVAL", DEFAULT_RECONCILE_INTERVAL))
+
+
+_STORE = None
+
+
+def get_state_store():
+    """프로세스 공용 적용 이름 저장소 (최초 호출 시 열기)"""
+    global _STORE
+    if _STORE is None:
+        _STORE = AppliedNameStore()
+    return _STORE
+
+
+def set_state_store(store):
+    """프로세스 공용 적용 이름 저장소 교체 (None이면 다음 호출 시 다시 열기)"""
+    global _STORE
+    _STORE = store
+    return store
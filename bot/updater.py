@@ -1,302 +1,164 @@
-import discord
-import holidays
+import asyncio
 import os
-from datetime import datetime, timedelta
+from functools import lru_cache
+import time
+from datetime import datetime
 import pytz
 
 try:
-    from .utils import setup_logging
+    from .utils import lazy_import, setup_logging
+    from .rest import RestChannel, RestClient
+    from .ratelimit import (
+        RENAME_BUCKETS,
+        RENAME_BUDGET,
+        get_spread_window,
+        spread_delay,
+    )
+    from .retry_queue import PENDING_RENAMES
+    from .state import get_state_store
+    from .health import get_channel_health
+    from .metrics import (
+        CHANNEL_UPDATES,
+        DISPATCH_DELAY,
+        LOOKUPS,
+        PATCH_LATENCY,
+        RENAME_DRIFT,
+        TICK_DURATION,
+    )
+    from .profiles import STATUS_EMOJIS, get_status_code, get_status_emoji
+    from .render import RENDER_CACHE, format_minute, local_date, local_day_minute
+    from .registry import (
+        DEFAULT_CHANNELS,
+        DEFAULT_NIGHT_END,
+        DEFAULT_NIGHT_START,
+        DEFAULT_TEMPLATE,
+        REGION_CALENDARS,
+        get_registry,
+    )
+    from .holiday_index import get_holiday_index
 except ImportError:
-    from utils import setup_logging
+    from utils import lazy_import, setup_logging
+    from rest import RestChannel, RestClient
+    from ratelimit import (
+        RENAME_BUCKETS,
+        RENAME_BUDGET,
+        get_spread_window,
+        spread_delay,
+    )
+    from retry_queue import PENDING_RENAMES
+    from state import get_state_store
+    from health import get_channel_health
+    from metrics import (
+        CHANNEL_UPDATES,
+        DISPATCH_DELAY,
+        LOOKUPS,
+        PATCH_LATENCY,
+        RENAME_DRIFT,
+        TICK_DURATION,
+    )
+    from profiles import STATUS_EMOJIS, get_status_code, get_status_emoji
+    from render import RENDER_CACHE, format_minute, local_date, local_day_minute
+    from registry import (
+        DEFAULT_CHANNELS,
+        DEFAULT_NIGHT_END,
+        DEFAULT_NIGHT_START,
+        DEFAULT_TEMPLATE,
+        REGION_CALENDARS,
+        get_registry,
+    )
+    from holiday_index import get_holiday_index
 
 # 로깅 설정
 logger = setup_logging("discord_updater")
 
-# 채널 설정
-CHANNELS = {
-    "SEOUL": {
-        "id": 1384147639293055036,
-        "tz": "Asia/Seoul",
-        "emoji": "🇰🇷",
-        "name": "서울",
-    },
-    "HCMC": {
-        "id": 1384147698747445401,
-        "tz": "Asia/Ho_Chi_Minh",
-        "emoji": "🇻🇳",
-        "name": "호치민",
-    },
-}
-
-KR_HOLIDAYS = holidays.KR()
-VN_HOLIDAYS = holidays.VN()
-
-# 한국 공휴일별 이모지 매핑
-KR_HOLIDAY_EMOJIS = {
-    # 국경일/기념일 - 국기 사용
-    "현충일": "🇰🇷",  # Memorial Day
-    "광복절": "🇰🇷",  # Liberation Day
-    "삼일절": "🇰🇷",  # Independence Movement Day
-    "제헌절": "🇰🇷",  # Constitution Day
-    "개천절": "🇰🇷",  # National Foundation Day
-    "한글날": "🇰🇷",  # Hangeul Day
-    # 설날 관련 - 복주머니
-    "설날": "🧧",  # Seollal (Lunar New Year)
-    "설날 전날": "🧧",
-    "설날 다음날": "🧧",
-    "설날 대체 휴일": "🧧",
-    # 신정 관련 - 파티/축하
-    "신정": "🎉",  # New Year's Day
-    "신정연휴": "🎉",
-    # 특별한 날들
-    "어린이날": "🎈",  # Children's Day
-    "부처님오신날": "🙏",  # Buddha's Birthday
-    "추석": "🌕",  # Chuseok (Korean Thanksgiving)
-    "추석 전날": "🌕",
-    "추석 다음날": "🌕",
-    "추석 대체 휴일": "🌕",
-    "기독탄신일": "🎄",  # Christmas Day
-    # 선거/정치 관련
-    "국회의원 선거일": "🗳️",  # Election Day
-    "대통령선거": "🗳️",
-    "지방선거": "🗳️",
-}
-
-# 베트남 공휴일별 이모지 매핑
-VN_HOLIDAY_EMOJIS = {
-    # 신정
-    "Tết Dương lịch": "🎉",  # New Year's Day
-    # 구정/설날 (Tết Nguyên Đán)
-    "29 Tết": "🧧",
-    "Giao thừa Tết Nguyên Đán": "🧧",
-    "Tết Nguyên Đán": "🧧",
-    "Mùng hai Tết Nguyên Đán": "🧧",
-    "Mùng ba Tết Nguyên Đán": "🧧",
-    "Mùng bốn Tết Nguyên Đán": "🧧",
-    "Mùng năm Tết Nguyên Đán": "🧧",
-    # 국가 기념일
-    "Ngày Giỗ Tổ Hùng Vương": "🇻🇳",  # Hung Kings' Commemoration Day
-    "Ngày Chiến thắng": "🇻🇳",  # Victory Day
-    "Quốc khánh": "🇻🇳",  # National Day
-    # 노동절
-    "Ngày Quốc tế Lao động": "👷",  # International Workers' Day
-}
-
-# 딕셔너리에 없는 공휴일을 위한 기본 이모지
-DEFAULT_HOLIDAY_EMOJI = "🗓️"
-
-
-# 긴 공휴일명 축약 매핑
-HOLIDAY_SHORT_NAMES = {
-    # 베트남 설날 관련 축약
-    "Giao thừa Tết Nguyên Đán": "Tết Eve",
-    "Mùng hai Tết Nguyên Đán": "Tết Day2",
-    "Mùng ba Tết Nguyên Đán": "Tết Day3",
-    "Mùng bốn Tết Nguyên Đán": "Tết Day4",
-    "Mùng năm Tết Nguyên Đán": "Tết Day5",
-    "Ngày Giỗ Tổ Hùng Vương": "Hùng Vương",
-    "Ngày Quốc tế Lao động": "Labor Day",
-    # 한국 공휴일 축약
-    "국회의원 선거일": "선거일",
-    "설날 대체 휴일": "설날 대체",
-    "추석 대체 휴일": "추석 대체",
-}
+# 네트워크 요청이 필요할 때만 로드 (모든 채널이 최신이면 import하지 않음)
+discord = lazy_import("discord")
+aiohttp = lazy_import("aiohttp")
 
+# 기본 채널 설정 (CHANNEL_REGISTRY로 JSON/SQLite 레지스트리 지정 가능)
+CHANNELS = DEFAULT_CHANNELS
 
-def is_off_day(date, country):
-    """주말 또는 공휴일 여부 확인"""
-    weekday = date.weekday()
+# 야간 모드 시간 기본값 (채널 시간대 기준 22:00 ~ 07:00, 채널별 night_start/night_end로 변경)
+NIGHT_START_HOUR = DEFAULT_NIGHT_START
+NIGHT_END_HOUR = DEFAULT_NIGHT_END
 
-    if weekday >= 5:  # 토요일(5), 일요일(6)
-        return True
+# 동시에 보낼 수 있는 채널 이름 변경 요청 수 기본값
+DEFAULT_MAX_CONCURRENT_RENAMES = 10
 
-    if country == "SEOUL":
-        return date in KR_HOLIDAYS
-    elif country == "HCMC":
-        return date in VN_HOLIDAYS
+# 서브프로세스 실행에서 실패한 이름 변경을 종료 전에 재시도하며 기다리는 최대 시간(초)
+DEFAULT_RETRY_BUDGET = 15.0
 
-    return False
+# 반복되면 채널을 격리하는 결과 (재시도해도 같은 결과가 나오는 오류)
+HEALTH_FAILURES = ("missing", "unsupported", "forbidden", "not_found")
 
 
-def get_holiday_info(date, country):
-    """공휴일 정보 반환 (공휴일명, 이모지)"""
-    weekday = date.weekday()
+@lru_cache(maxsize=None)
+def transient_errors():
+    """재시도하면 성공할 수 있는 일시적인 오류 (5xx, 연결 오류, 타임아웃)"""
+    return (discord.DiscordServerError, aiohttp.ClientError, OSError)
 
-    # 공휴일 처리 (주말보다 우선)
-    if country == "SEOUL":
-        if date in KR_HOLIDAYS:
-            holiday_name = KR_HOLIDAYS[date]
-            # 축약된 이름이 있으면 사용, 없으면 원래 이름 사용
-            display_name = HOLIDAY_SHORT_NAMES.get(holiday_name, holiday_name)
-            emoji = KR_HOLIDAY_EMOJIS.get(holiday_name, DEFAULT_HOLIDAY_EMOJI)
-            return display_name, emoji
-    elif country == "HCMC":
-        if date in VN_HOLIDAYS:
-            holiday_name = VN_HOLIDAYS[date]
-            # 축약된 이름이 있으면 사용, 없으면 원래 이름 사용
-            display_name = HOLIDAY_SHORT_NAMES.get(holiday_name, holiday_name)
-            emoji = VN_HOLIDAY_EMOJIS.get(holiday_name, DEFAULT_HOLIDAY_EMOJI)
-            return display_name, emoji
-
-    # 주말 처리 (공휴일이 아닐 경우에만)
-    if weekday == 5:  # 토요일
-        return "Saturday", "🌤️"
-    elif weekday == 6:  # 일요일
-        return "Sunday", "☀️"
-
-    return None, None
-
-
-def calculate_next_update_time(current_time=None):
-    """다음 업데이트가 실제로 필요한 시점을 계산"""
-    if current_time is None:
-        current_time = datetime.now(pytz.timezone("Asia/Seoul"))
-
-    # 한국 시간 기준으로 계산
-    korea_tz = pytz.timezone("Asia/Seoul")
-    if current_time.tzinfo is None:
-        current_time = korea_tz.localize(current_time)
-    else:
-        current_time = current_time.astimezone(korea_tz)
-
-    current_hour = current_time.hour
-    current_minute = current_time.minute
-    current_date = current_time.date()
-
-    # 디버깅을 위한 로그 추가
-    logger.debug(f"[DEBUG] 현재 시간: {current_time.strftime('%Y-%m-%d %H:%M')}")
-
-    # 1. 야간 시간 (22:01 ~ 06:59): 우선 자정 체크, 그 다음 07:00
-    # 7시대는 정상 모드 복구 시간이므로 야간 시간에서 제외
-    if (
-        (current_hour == 22 and current_minute > 0)
-        or (current_hour > 22)
-        or current_hour < 7
-    ):
-        # 자정에 주말 변경이 있는지 먼저 체크
-        tomorrow = current_date + timedelta(days=1)
-        today_weekend = is_off_day(current_date, "SEOUL")
-        tomorrow_weekend = is_off_day(tomorrow, "SEOUL")
-
-        # 주말 상태가 바뀌면 자정에 업데이트 필요
-        if today_weekend != tomorrow_weekend:
-            return korea_tz.localize(datetime.combine(tomorrow, datetime.min.time()))
-
-        # 둘 다 주말이거나 둘 다 평일이면서 공휴일 이름이 바뀔 수 있음
-        if today_weekend and tomorrow_weekend:
-            # 주말 → 주말: 자정에 Saturday → Sunday 또는 Sunday → 평일 체크
-            return korea_tz.localize(datetime.combine(tomorrow, datetime.min.time()))
-        elif not today_weekend and not tomorrow_weekend:
-            # 평일 → 평일: 다음날 07:00
-            return korea_tz.localize(
-                datetime.combine(tomorrow, datetime.min.time().replace(hour=7))
-            )
-        else:
-            # 이미 위에서 처리됨
-            return korea_tz.localize(datetime.combine(tomorrow, datetime.min.time()))
-
-    # 2. 22:00 정각: 야간모드 전환이므로 즉시 실행 필요
-    if current_hour == 22 and current_minute == 0:
-        return current_time
-
-    # 3. 07:00~07:59: 정상모드 복구이므로 즉시 실행 필요
-    if current_hour == 7:
-        return current_time
-
-    # 4. 평일 업무시간 (07:00-21:50): 다음 10분 단위
-    # 두 지역 중 하나라도 평일이면 10분 단위 업데이트 필요
-    seoul_is_off_day = is_off_day(current_date, "SEOUL")
-    hcmc_is_off_day = is_off_day(current_date, "HCMC")
-
-    if 7 <= current_hour < 22 and not (seoul_is_off_day and hcmc_is_off_day):
-        # 현재 분을 10분 단위로 올림
-        next_minute = ((current_minute // 10) + 1) * 10
-
-        if next_minute >= 60:
-            # 다음 시간으로
-            next_hour = current_hour + 1
-            next_minute = 0
-
-            if next_hour >= 22:
-                # 22시가 되면 야간모드
-                return korea_tz.localize(
-                    datetime.combine(current_date, datetime.min.time().replace(hour=22))
-                )
-        else:
-            next_hour = current_hour
 
-        return korea_tz.localize(
-            datetime.combine(
-                current_date,
-                datetime.min.time().replace(hour=next_hour, minute=next_minute),
-            )
-        )
+@lru_cache(maxsize=None)
+def guild_channel_types():
+    """이름 변경을 지원하는 게이트웨이 채널 타입 (DM 채널 제외)"""
+    return (discord.TextChannel, discord.VoiceChannel, discord.CategoryChannel)
 
-    # 5. 주말/공휴일 체크 (두 지역 모두 휴일인 경우)
-    if seoul_is_off_day and hcmc_is_off_day:
-        # 주말/공휴일인 경우: 자정에 상태 변경 체크
-        next_day = current_time + timedelta(days=1)
 
-        # 자정에 공휴일 상태가 바뀔 수 있으므로 자정 체크
-        midnight_tomorrow = korea_tz.localize(
-            datetime.combine(next_day, datetime.min.time())
-        )
+def is_off_day(date, country):
+    """주말 또는 공휴일 여부 확인 (컴파일된 공휴일 색인 조회)"""
+    LOOKUPS.inc("holiday")
+    index = get_holiday_index(date)
+    return index.is_off_day(REGION_CALENDARS.get(country, country), date)
 
-        # 내일도 휴일인지 확인
-        if is_off_day(next_day, "SEOUL"):
-            # 계속 휴일이면 자정에 한번 체크 (Saturday → Sunday 등)
-            return midnight_tomorrow
-        else:
-            # 내일이 평일이면 자정에 주말 → 평일 전환
-            return midnight_tomorrow
 
-    # 기본값: 1시간 후 (예외 상황)
-    return current_time + timedelta(hours=1)
+def get_holiday_info(date, country):
+    """공휴일 정보 반환 (공휴일명, 이모지) - 공휴일이 주말보다 우선"""
+    LOOKUPS.inc("holiday")
+    index = get_holiday_index(date)
+    return index.holiday_info(REGION_CALENDARS.get(country, country), date)
 
 
 def get_availability_status(now, country):
-    """연락 가능 상태에 따른 이모지 반환 (평일 전용)"""
-    hour = now.hour
-    minute = now.minute
+    """연락 가능 상태에 따른 이모지 반환 (평일 전용, 컴파일된 근무 시간 테이블 조회)"""
+    LOOKUPS.inc("status")
+    return get_status_emoji(country, now)
+
+
+def is_supported_channel(channel):
+    """이름을 변경할 수 있는 길드 채널인지 확인 (게이트웨이/REST 엔진 공통)"""
+    if isinstance(channel, RestChannel):
+        return channel.is_supported
+    return isinstance(channel, guild_channel_types())
+
+
+def get_channel_ids():
+    """레지스트리에 등록된 모든 채널 ID 목록"""
+    return get_registry().ids()
 
-    if country == "SEOUL":
-        # 한국 시간 기준
-        if (
-            (9 < hour < 11)
-            or (hour == 9 and minute >= 30)
-            or (hour == 11 and minute < 30)
-        ):  # 9:30-11:29 업무
-            return "💼"  # 연락 가능
-        elif (hour == 11 and minute >= 30) or (
-            hour == 12 and minute < 30
-        ):  # 11:30-12:29 점심
-            return "🍜"  # 점심 시간 (연락 불가)
-        elif (
-            (12 < hour < 18)
-            or (hour == 12 and minute >= 30)
-            or (hour == 18 and minute < 30)
-        ):  # 12:30-18:29 업무
-            return "💼"  # 연락 가능
-        elif hour > 18 or (hour == 18 and minute >= 30):  # 18:30 이후 퇴근
-            return "🏠"  # 퇴근 후 (연락 불가)
-        else:
-            return "🏠"  # 출근 전 (연락 불가)
-    else:  # HCMC
-        # 베트남 시간 기준
-        if (8 < hour < 12) or (hour == 8 and minute >= 30):  # 8:30-11:59 업무
-            return "💼"  # 연락 가능
-        elif hour == 12 or (hour == 13 and minute < 30):  # 12:00-13:29 점심
-            return "🍜"  # 점심 시간 (연락 불가)
-        elif (
-            (13 < hour < 17)
-            or (hour == 13 and minute >= 30)
-            or (hour == 17 and minute < 30)
-        ):  # 13:30-17:29 업무
-            return "💼"  # 연락 가능
-        elif hour > 17 or (hour == 17 and minute >= 30):  # 17:30 이후 퇴근
-            return "🏠"  # 퇴근 후 (연락 불가)
-        else:
-            return "🏠"  # 출근 전 (연락 불가)
+
+def night_window(info=None):
+    """채널의 야간 시간 (시간대, 시작 시, 종료 시) - info 미지정 시 한국 시간 기본값"""
+    if info is None:
+        return "Asia/Seoul", NIGHT_START_HOUR, NIGHT_END_HOUR
+    return (
+        info["tz"],
+        info.get("night_start", NIGHT_START_HOUR),
+        info.get("night_end", NIGHT_END_HOUR),
+    )
+
+
+def is_night_hour(hour, start, end):
+    """현지 시(hour)가 야간 시간 [start, end)에 속하는지 확인 (자정을 넘는 구간 포함)"""
+    if start > end:
+        return hour >= start or hour < end
+    return start <= hour < end
+
+
+def is_night_time(now, info=None):
+    """야간 모드 시간 여부 확인 - 채널 시간대의 현지 시각 기준 (info 미지정 시 한국 시간 22:00 ~ 06:59)"""
+    tz, start, end = night_window(info)
+    _, minute_of_day = local_day_minute(tz, now)
+    return is_night_hour(minute_of_day // 60, start, end)
 
 
 def get_night_mode_status(country):
@@ -307,99 +169,499 @@ def get_night_mode_status(country):
         return "nghỉ ngơi", "🌙"  # 베트남어 (휴식)
 
 
-async def update_channel_names(client_instance):
-    """모든 채널의 이름을 현재 시간으로 업데이트"""
-    updated_count = 0
+def render_channel_name(name, info, now=None, night_mode=None):
+    """채널에 표시할 이름 생성 (night_mode 미지정 시 채널 현지 시각 기준 야간 여부로 판단)
 
-    # 야간 모드 체크
-    is_night_mode = os.getenv("NIGHT_MODE", "false").lower() == "true"
-    if is_night_mode:
-        logger.info("[NIGHT_MODE] 야간 모드에서 실행 중입니다")
+    같은 (달력, 프로필, 형식, 이모지, 현지 분, 모드) 조합은 렌더링 캐시에서 재사용합니다.
+    """
+    if now is None:
+        now = datetime.now(pytz.utc)
+    if night_mode is None:
+        night_mode = is_night_time(now, info)
 
-    for name, info in CHANNELS.items():
-        try:
-            channel = client_instance.get_channel(info["id"])
-            if not channel:
-                logger.warning(
-                    f"[WARNING] 채널을 찾을 수 없습니다 (ID: {info['id']}, {info['name']})"
-                )
-                continue
+    region = info.get("region", name)
+    template = info.get("template", DEFAULT_TEMPLATE)
 
-            # 길드 채널인지 확인 (DM 채널 제외)
-            if not isinstance(
-                channel,
-                (discord.TextChannel, discord.VoiceChannel, discord.CategoryChannel),
-            ):
-                logger.warning(
-                    f"[WARNING] 지원하지 않는 채널 타입입니다 (ID: {info['id']}, {info['name']})"
-                )
-                continue
-
-            # 야간 모드 처리
-            if is_night_mode:
-                # 야간 모드에서는 수면 상태 표시
-                night_text, night_emoji = get_night_mode_status(name)
-                new_name = (
-                    f"{info['emoji']}∥{night_text}-{night_emoji}"  # Discord 호환 형식
-                )
-                logger.info(
-                    f"[NIGHT_MODE] {info['name']} - {night_text} ({night_emoji})"
-                )
-            else:
-                # 일반 모드에서는 기존 로직 사용
-                # 현재 시간 계산
-                tz = pytz.timezone(info["tz"])
-                now = datetime.now(tz)
-
-                # 휴일/주말 체크
-                holiday_name, holiday_emoji = get_holiday_info(now.date(), name)
-                if holiday_name:
-                    # 휴일/주말인 경우 - 공휴일명과 해당 이모지 사용
-                    time_str = holiday_name
-                    status_emoji = holiday_emoji
-                    new_name = f"{info['emoji']}∥{time_str}-{status_emoji}"  # Discord 호환 형식
-                    logger.info(
-                        f"[HOLIDAY] {info['name']} - {holiday_name} ({holiday_emoji})"
-                    )
-                else:
-                    # 평일인 경우 - 시간과 업무 상태 이모지 사용
-                    # Discord 호환을 위해 유니코드 유사 문자 사용
-                    time_str = now.strftime("%H：%M")  # : 대신 ：(fullwidth colon) 사용
-                    status_emoji = get_availability_status(now, name)
-                    new_name = f"{info['emoji']}∥{time_str}-{status_emoji}"  # | 대신 ∥(double vertical line) 사용
-
-            # 채널 이름이 이미 같다면 스킵
-            if channel.name == new_name:
+    # 야간 모드에서는 시간과 무관하게 수면 상태 표시
+    if night_mode:
+        night_text = info.get("night_text")
+        return RENDER_CACHE.get_or_render(
+            ("night", region, night_text, info["emoji"], template),
+            lambda: render_night_name(region, info["emoji"], template, night_text),
+        )
+
+    # 채널 시간대 기준 현지 날짜/분 (시간대별 오프셋 캐시 사용)
+    day_ordinal, minute_of_day = local_day_minute(info["tz"], now)
+    calendar = info.get("calendar", REGION_CALENDARS.get(region, region))
+    profile = info.get("profile", region)
+    return RENDER_CACHE.get_or_render(
+        (calendar, profile, info["emoji"], template, day_ordinal, minute_of_day),
+        lambda: render_day_name(
+            calendar, profile, info["emoji"], template, day_ordinal, minute_of_day
+        ),
+    )
+
+
+def render_night_name(region, emoji, template, night_text=None):
+    """야간 모드 이름 생성"""
+    default_text, night_emoji = get_night_mode_status(region)
+    return template.format(
+        emoji=emoji, text=night_text or default_text, status=night_emoji
+    )
+
+
+def day_text_status(holiday, profile, minute_of_day):
+    """현지 날짜의 공휴일 정보((이름, 이모지))와 하루 중 분으로 (표시 문구, 상태 이모지) 결정"""
+    # 휴일/주말인 경우 - 공휴일명과 해당 이모지 사용
+    holiday_name, holiday_emoji = holiday
+    if holiday_name:
+        return holiday_name, holiday_emoji
+
+    # 평일인 경우 - 시간과 업무 상태 이모지 사용
+    LOOKUPS.inc("status")
+    return (
+        format_minute(minute_of_day),
+        STATUS_EMOJIS[get_status_code(profile, minute_of_day)],
+    )
+
+
+def render_day_name(calendar, profile, emoji, template, day_ordinal, minute_of_day):
+    """현지 날짜/분 기준 이름 생성"""
+    text, status = day_text_status(
+        get_holiday_info(local_date(day_ordinal), calendar), profile, minute_of_day
+    )
+    return template.format(emoji=emoji, text=text, status=status)
+
+
+async def update_channel(
+    client_instance,
+    name,
+    info,
+    night_mode,
+    semaphore,
+    now=None,
+    store=None,
+    new_name=None,
+    health=None,
+    spread=0.0,
+    budget=None,
+):
+    """채널 하나의 이름을 업데이트하고 결과 보고서(dict) 반환
+
+    store(마지막 적용 이름 저장소)의 값과 렌더링 결과가 같으면 네트워크 요청 없이 건너뜁니다.
+    new_name 지정 시 렌더링하지 않고 그 이름을 적용합니다 (재시도 대기열).
+    일시적인 오류로 실패하면 재시도 대기열에 넣고, 재시도 대기 중인 채널은
+    요청 없이 대기열의 이름만 최신 값으로 바꿉니다.
+    채널을 찾을 수 없거나 권한이 없는 등 같은 오류가 반복되면 health(채널 상태)에서
+    격리하고, 확인 시각이 될 때까지 요청하지 않습니다.
+    spread(초)를 지정하면 이름이 바뀐 정도와 채널 ID로 정한 구간 안의 시각까지 기다린 뒤 보내고,
+    요청은 budget(초당 요청 예산, 기본 프로세스 공용 예산) 안에서만 보냅니다.
+    """
+    if health is None:
+        health = get_channel_health()
+    if budget is None:
+        budget = RENAME_BUDGET
+    result = {
+        "channel": name,
+        "id": info["id"],
+        "status": "error",
+        "name": None,
+        "elapsed": 0.0,
+    }
+    start_time = time.perf_counter()
+    # 구조화 로그 필드 (채널별 로그는 종류별로 샘플링됨)
+    log_fields = {"channel": info["id"], "channel_name": info["name"]}
+
+    try:
+        # 격리된 채널은 확인 시각 전까지 요청하지 않음
+        if not health.admits(info["id"]):
+            result["status"] = "quarantined"
+            return result
+        if health.is_quarantined(info["id"]):
+            logger.info(f"[PROBE] 격리된 {info['name']} 채널 상태를 확인합니다", extra=log_fields)
+
+        channel = client_instance.get_channel(info["id"])
+        if not channel:
+            logger.warning(
+                f"[WARNING] 채널을 찾을 수 없습니다 (ID: {info['id']}, {info['name']})",
+                extra=log_fields,
+            )
+            result["status"] = "missing"
+            return result
+
+        # 길드 채널인지 확인 (DM 채널 제외)
+        if not is_supported_channel(channel):
+            logger.warning(
+                f"[WARNING] 지원하지 않는 채널 타입입니다 (ID: {info['id']}, {info['name']})",
+                extra=log_fields,
+            )
+            result["status"] = "unsupported"
+            return result
+
+        if new_name is None:
+            new_name = render_channel_name(name, info, now, night_mode)
+            logger.debug(f"[RENDER] {info['name']} - {new_name}", extra=log_fields)
+
+        result["name"] = new_name
+
+        # 마지막으로 적용한 이름과 같다면 스킵 (로컬 캐시의 이름이 다르면 수동 변경으로 보고 다시 적용)
+        if store is not None and store.is_current(info["id"], new_name):
+            if channel.name is None or channel.name == new_name:
                 logger.debug(
-                    f"[SKIP] {info['name']} 채널 이름이 이미 최신입니다: {new_name}"
+                    f"[SKIP] {info['name']} 채널 이름이 저장된 값과 같습니다: {new_name}",
+                    extra=log_fields,
                 )
-                continue
-
-            # 채널 이름 업데이트
-            await channel.edit(name=new_name)
-            logger.info(
-                f"[SUCCESS] {info['name']} 채널 업데이트: {channel.name} -> {new_name}"
+                result["status"] = "unchanged"
+                return result
+            logger.warning(
+                f"[RECONCILE] {info['name']} 채널 이름이 외부에서 변경되었습니다: {new_name} -> {channel.name}",
+                extra=log_fields,
             )
-            updated_count += 1
 
-        except discord.Forbidden:
-            logger.error(
-                f"[FORBIDDEN] {info['name']} 채널 수정 권한이 없습니다 (ID: {info['id']})"
+        # 채널 이름이 이미 같다면 스킵
+        if channel.name == new_name:
+            logger.debug(
+                f"[SKIP] {info['name']} 채널 이름이 이미 최신입니다: {new_name}",
+                extra=log_fields,
             )
-        except discord.NotFound:
-            logger.error(
-                f"[NOTFOUND] {info['name']} 채널을 찾을 수 없습니다 (ID: {info['id']})"
+            if store is not None:
+                store.record(info["id"], new_name)
+            result["status"] = "unchanged"
+            return result
+
+        # 같은 시점에 바뀌는 채널은 분산 구간에 나눠 보냄 (크게 바뀐 이름 먼저)
+        dispatch_delay = 0.0
+        if spread:
+            previous_name = channel.name
+            if previous_name is None and store is not None:
+                previous_name = (store.get(info["id"]) or (None,))[0]
+            dispatch_delay = spread_delay(info["id"], previous_name, new_name, spread)
+            if dispatch_delay > 0:
+                await asyncio.sleep(dispatch_delay)
+
+        # 재시도 대기 중이면 요청하지 않고 적용할 이름만 최신 값으로 교체 (중간 이름은 보내지 않음)
+        if PENDING_RENAMES.is_waiting(info["id"]):
+            PENDING_RENAMES.submit(info["id"], new_name)
+            logger.debug(
+                f"[QUEUED] {info['name']} 채널 재시도 대기 중: {new_name}",
+                extra=log_fields,
             )
-        except Exception as e:
-            logger.error(f"[ERROR] {info['name']} 채널 업데이트 실패: {e}")
+            result["status"] = "queued"
+            return result
+
+        # 채널별 이름 변경 제한(10분에 2회) 확인 - 초과 시 가능해지는 시각에 재시도
+        wait_time = RENAME_BUCKETS.acquire(info["id"])
+        if wait_time > 0:
+            PENDING_RENAMES.fail(info["id"], new_name, wait_time)
+            logger.warning(
+                f"[RATELIMIT] {info['name']} 채널 이름 변경 제한 - {wait_time:.0f}초 후 가능",
+                extra=log_fields,
+            )
+            result["status"] = "rate_limited"
+            return result
+
+        # 채널 이름 업데이트 (동시 요청 수 제한)
+        old_name = channel.name
+        try:
+            async with semaphore:
+                # 초당 요청 예산 - 큰 규모에서도 Discord 전역 제한 아래로 유지
+                dispatch_delay += await budget.acquire()
+                DISPATCH_DELAY.observe(dispatch_delay)
+                patch_start = time.perf_counter()
+                await channel.edit(name=new_name)
+                PATCH_LATENCY.observe(time.perf_counter() - patch_start, name)
+        except BaseException:
+            RENAME_BUCKETS.release(info["id"])
+            raise
+
+        # 이름 기준 시각(스케줄 예정 시각) 대비 실제 변경 완료까지의 지연
+        if now is not None:
+            RENAME_DRIFT.observe(max(time.time() - now.timestamp(), 0.0))
+
+        if store is not None:
+            store.record(info["id"], new_name)
+
+        logger.info(
+            f"[SUCCESS] {info['name']} 채널 업데이트: {old_name} -> {new_name}",
+            extra=log_fields,
+        )
+        result["status"] = "updated"
+
+    except discord.RateLimited as e:
+        RENAME_BUCKETS.block(info["id"], e.retry_after)
+        delay = PENDING_RENAMES.fail(info["id"], result["name"], e.retry_after)
+        logger.warning(
+            f"[RATELIMIT] {info['name']} 채널 요청 제한 - {delay:.0f}초 후 재시도",
+            extra=log_fields,
+        )
+        result["status"] = "rate_limited"
+    except discord.Forbidden:
+        logger.error(
+            f"[FORBIDDEN] {info['name']} 채널 수정 권한이 없습니다 (ID: {info['id']})",
+            extra=log_fields,
+        )
+        result["status"] = "forbidden"
+    except discord.NotFound:
+        logger.error(
+            f"[NOTFOUND] {info['name']} 채널을 찾을 수 없습니다 (ID: {info['id']})",
+            extra=log_fields,
+        )
+        result["status"] = "not_found"
+    except transient_errors() as e:
+        delay = PENDING_RENAMES.fail(info["id"], result["name"])
+        logger.warning(
+            f"[RETRY] {info['name']} 채널 업데이트 실패 - {delay:.0f}초 후 재시도: {e!r}",
+            extra=log_fields,
+        )
+        result["status"] = "retrying"
+    except Exception as e:
+        logger.error(f"[ERROR] {info['name']} 채널 업데이트 실패: {e}", extra=log_fields)
+        result["status"] = "error"
+    finally:
+        # 적용했거나 재시도해도 소용없는 채널은 대기열에서 제거
+        if result["status"] not in ("queued", "rate_limited", "retrying"):
+            PENDING_RENAMES.discard(info["id"])
+        if result["status"] in HEALTH_FAILURES:
+            delay = health.fail(info["id"], result["status"])
+            if delay is not None:
+                logger.warning(
+                    f"[QUARANTINE] {info['name']} 채널 격리 ({result['status']}) - {delay / 60:.0f}분 후 다시 확인",
+                    extra=log_fields,
+                )
+        elif result["status"] in ("updated", "unchanged") and health.recover(
+            info["id"]
+        ):
+            logger.info(f"[RECOVER] {info['name']} 채널이 정상으로 돌아왔습니다", extra=log_fields)
+        result["elapsed"] = time.perf_counter() - start_time
+        CHANNEL_UPDATES.inc(result["status"])
+
+    return result
+
+
+async def update_channel_names(
+    client_instance,
+    night_mode=None,
+    max_concurrency=None,
+    channels=None,
+    now=None,
+    registry=None,
+    store=None,
+    health=None,
+    names=None,
+    spread=None,
+    budget=None,
+):
+    """채널 이름을 동시에 업데이트하고 채널별 결과 보고서 반환
+
+    night_mode 미지정 시 채널마다 현지 시각 기준으로 야간 여부를 판단하고 (True/False 지정 시 전체 강제),
+    channels 지정 시 레지스트리에서 해당 채널 키만 업데이트합니다.
+    names({채널 키: 이름}) 지정 시 렌더링하지 않고 그 이름을 적용합니다 (이름 변경 계획).
+    max_concurrency 미지정 시 MAX_CONCURRENT_RENAMES 환경변수(기본 10)를 사용합니다.
+    store/health 미지정 시 프로세스 공용 적용 이름 저장소/채널 상태를 사용합니다.
+    이름 변경은 budget(초당 요청 예산, 기본 RENAME_RPS) 안에서 spread(초) 구간에 나눠 보내며,
+    spread 미지정 시 채널 수와 예산으로 정합니다 (get_spread_window).
+    """
+    if now is None:
+        now = datetime.now(pytz.utc)
+
+    # 야간 모드를 강제한 경우에만 전체 적용 (기본은 채널별 현지 야간 시간)
+    if night_mode:
+        logger.info("[NIGHT_MODE] 모든 채널을 야간 모드로 실행합니다")
+
+    if max_concurrency is None:
+        max_concurrency = int(
+            os.getenv("MAX_CONCURRENT_RENAMES", DEFAULT_MAX_CONCURRENT_RENAMES)
+        )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    if registry is None:
+        registry = get_registry()
+    if channels is None:
+        channels = list(registry)
+    if store is None:
+        store = get_state_store()
+    if health is None:
+        health = get_channel_health()
+    if budget is None:
+        budget = RENAME_BUDGET
+    if spread is None:
+        spread = get_spread_window(len(channels), budget.rate)
+    if spread:
+        logger.info(
+            f"[DISPATCH] {len(channels)}개 채널의 이름 변경을 {spread:.0f}초에 나눠 보냅니다"
+        )
 
+    tick_start = time.perf_counter()
+    report = await asyncio.gather(
+        *(
+            update_channel(
+                client_instance,
+                name,
+                registry[name],
+                night_mode,
+                semaphore,
+                now,
+                store,
+                new_name=names.get(name) if names else None,
+                health=health,
+                spread=spread,
+                budget=budget,
+            )
+            for name in channels
+        )
+    )
+    TICK_DURATION.observe(time.perf_counter() - tick_start)
+    updated_count = sum(1 for result in report if result["status"] == "updated")
     if updated_count == 0:
-        mode_text = "야간 모드" if is_night_mode else "일반 모드"
-        logger.info(f"[INFO] {mode_text}에서 업데이트가 필요한 채널이 없습니다")
+        logger.info("[INFO] 업데이트가 필요한 채널이 없습니다")
     else:
-        mode_text = "야간 모드" if is_night_mode else "일반 모드"
+        logger.info(f"[COMPLETE] 총 {updated_count}개 채널이 업데이트되었습니다")
+    quarantined_count = len(health)
+    if quarantined_count:
+        logger.info(f"[QUARANTINE] {quarantined_count}개 채널이 격리되어 있습니다")
+
+    return report
+
+
+async def retry_pending_renames(
+    client_instance,
+    max_concurrency=None,
+    registry=None,
+    store=None,
+    pending=None,
+    health=None,
+    budget=None,
+):
+    """재시도 시각이 된 채널마다 대기열의 최신 이름으로 한 번씩 요청하고 결과 보고서 반환
+
+    재시도는 이미 백오프로 흩어져 있으므로 분산 구간 없이 budget(초당 요청 예산)만 적용합니다.
+    """
+    if max_concurrency is None:
+        max_concurrency = int(
+            os.getenv("MAX_CONCURRENT_RENAMES", DEFAULT_MAX_CONCURRENT_RENAMES)
+        )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    if registry is None:
+        registry = get_registry()
+    if store is None:
+        store = get_state_store()
+    if pending is None:
+        pending = PENDING_RENAMES
+
+    keys = []
+    for channel_id in pending.due():
+        key = registry.by_id.get(channel_id)
+        if key is None:
+            # 레지스트리에서 빠진 채널은 재시도하지 않음
+            pending.discard(channel_id)
+            continue
+        keys.append(key)
+
+    report = await asyncio.gather(
+        *(
+            update_channel(
+                client_instance,
+                key,
+                registry[key],
+                False,
+                semaphore,
+                store=store,
+                new_name=pending.get(registry[key]["id"])["name"],
+                health=health,
+                budget=budget,
+            )
+            for key in keys
+        )
+    )
+    if report:
+        updated_count = sum(1 for result in report if result["status"] == "updated")
         logger.info(
-            f"[COMPLETE] {mode_text}에서 총 {updated_count}개 채널이 업데이트되었습니다"
+            f"[RETRY] {len(report)}개 채널 재시도 - {updated_count}개 업데이트, 대기 중 {len(pending)}개"
         )
+    return report
+
+
+async def drain_pending_renames(client_instance, budget=None, registry=None, store=None):
+    """budget(초) 안에 재시도 시각이 오는 채널을 모두 재시도 (서브프로세스 종료 전 사용)
+
+    budget 미지정 시 RETRY_BUDGET 환경변수(기본 15초)를 사용합니다.
+    """
+    if budget is None:
+        budget = float(os.getenv("RETRY_BUDGET", DEFAULT_RETRY_BUDGET))
+    deadline = PENDING_RENAMES.clock() + budget
 
-    return updated_count
+    while True:
+        next_due = PENDING_RENAMES.next_due()
+        if next_due is None or next_due > deadline:
+            break
+        await PENDING_RENAMES.wait(timeout=deadline - PENDING_RENAMES.clock())
+        await retry_pending_renames(client_instance, registry=registry, store=store)
+
+    if len(PENDING_RENAMES):
+        logger.warning(
+            f"[RETRY] {len(PENDING_RENAMES)}개 채널은 다음 실행에서 다시 적용합니다"
+        )
+
+
+def all_names_current(
+    night_mode=None, now=None, registry=None, store=None, health=None, channels=None
+):
+    """채널(channels 미지정 시 전체)의 렌더링 결과가 저장된 마지막 적용 이름과 같은지 확인
+
+    네트워크 요청이 없으며, 확인 시각 전인 격리 채널은 요청하지 않으므로 제외합니다.
+    """
+    if now is None:
+        now = datetime.now(pytz.utc)
+    if registry is None:
+        registry = get_registry()
+    if store is None:
+        store = get_state_store()
+    if health is None:
+        health = get_channel_health()
+    if channels is None:
+        channels = list(registry)
+    return all(
+        store.is_current(
+            registry[name]["id"],
+            render_channel_name(name, registry[name], now, night_mode),
+        )
+        for name in channels
+        if health.admits(registry[name]["id"])
+    )
+
+
+async def reconcile_channels(client_instance, registry=None, store=None, health=None):
+    """Discord의 실제 채널 이름을 저장소와 대조해 외부에서 변경된 채널 키 목록 반환
+
+    게이트웨이 엔진은 캐시된 채널 이름을, REST 엔진은 GET으로 조회한 이름을 사용합니다.
+    격리된 채널은 조회하지 않습니다.
+    """
+    if registry is None:
+        registry = get_registry()
+    if store is None:
+        store = get_state_store()
+    if health is None:
+        health = get_channel_health()
+
+    if isinstance(client_instance, RestClient):
+        channels = await client_instance.fetch_channels(
+            [i for i in registry.ids() if not health.is_quarantined(i)]
+        )
+    else:
+        channels = [client_instance.get_channel(i) for i in registry.ids()]
+
+    observed = {
+        channel.id: channel.name
+        for channel in channels
+        if channel is not None and channel.name is not None
+    }
+    mismatched = [registry.by_id[i] for i in store.reconcile(observed)]
+    for key in mismatched:
+        logger.warning(
+            f"[RECONCILE] {registry[key]['name']} 채널 이름이 외부에서 변경되었습니다: {observed[registry[key]['id']]}"
+        )
+    logger.info(
+        f"[RECONCILE] {len(observed)}개 채널 이름 대조 완료 - 외부 변경 {len(mismatched)}개"
+    )
+    return mismatched
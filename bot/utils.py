@@ -1,20 +1,200 @@
+import atexit
+import importlib.util
+import json
 import logging
+import logging.handlers
+import queue
 import sys
 import os
+import threading
+import time
+from datetime import datetime, timezone
+
+# 텍스트 로그 형식
+LOG_TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# 채널별 로그 샘플링 기본값 - 창(초)마다 같은 종류의 채널 로그는 처음 N개만 출력
+DEFAULT_LOG_SAMPLE_BURST = 20
+DEFAULT_LOG_SAMPLE_WINDOW = 60.0
+
+# LogRecord 기본 속성 (나머지는 extra로 넘긴 구조화 필드)
+RESERVED_RECORD_FIELDS = set(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "taskName"}
+
+_LOG_LISTENER = None
+_LOG_SAMPLER = None
+
+
+def is_json_logging():
+    """JSON 로그 모드 여부 (LOG_FORMAT=json)"""
+    return os.getenv("LOG_FORMAT", "text").lower() == "json"
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 레코드 하나를 JSON 객체로 출력 (extra로 넘긴 필드 포함)"""
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in RESERVED_RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ChannelLogSampler(logging.Filter):
+    """채널별 로그(extra의 channel 필드가 있는 레코드)를 종류별로 샘플링하는 필터
+
+    로거와 메시지 태그([SUCCESS] 등)가 같은 채널 로그는 window초마다 처음 burst개만 통과시키고,
+    나머지는 개수만 세어 다음 창이 시작될 때 요약 한 줄로 남깁니다. 오류(ERROR 이상)와
+    채널과 무관한 로그는 그대로 통과하므로 채널 수가 늘어도 로그 양은 일정합니다.
+    """
+
+    def __init__(self, burst=None, window=None, clock=time.monotonic):
+        super().__init__()
+        if burst is None:
+            burst = int(os.getenv("LOG_SAMPLE_BURST", DEFAULT_LOG_SAMPLE_BURST))
+        if window is None:
+            window = float(os.getenv("LOG_SAMPLE_WINDOW", DEFAULT_LOG_SAMPLE_WINDOW))
+        self.burst = burst
+        self.window = window
+        self.clock = clock
+        self._lock = threading.Lock()
+        # {(로거, 태그): [창 시작 시각, 통과 수, 생략 수]}
+        self._counts = {}
+
+    def filter(self, record):
+        if (
+            self.burst <= 0
+            or record.levelno >= logging.ERROR
+            or getattr(record, "channel", None) is None
+        ):
+            return True
+        key = (record.name, str(record.msg).split(" ", 1)[0])
+        now = self.clock()
+        with self._lock:
+            entry = self._counts.get(key)
+            if entry is None or now - entry[0] >= self.window:
+                suppressed = entry[2] if entry else 0
+                entry = self._counts[key] = [now, 0, 0]
+                if suppressed:
+                    record._sampled = suppressed
+            if entry[1] < self.burst:
+                entry[1] += 1
+                return True
+            entry[2] += 1
+            return False
+
+    def flush(self):
+        """생략된 로그 수 [(로거, 태그, 생략 수)]를 반환하고 초기화"""
+        with self._lock:
+            summary = [
+                (name, tag, entry[2])
+                for (name, tag), entry in self._counts.items()
+                if entry[2]
+            ]
+            self._counts.clear()
+        return summary
+
+
+class SampledSummaryFilter(logging.Filter):
+    """샘플링으로 생략된 로그 수를 다음에 통과한 같은 종류의 레코드 뒤에 붙임"""
+
+    def filter(self, record):
+        suppressed = getattr(record, "_sampled", None)
+        if suppressed:
+            record.msg = f"{record.msg} (이전 창에서 같은 로그 {suppressed}개 생략)"
+            record.sampled = suppressed
+        return True
+
+
+def configure_logging():
+    """루트 로거 설정 (최초 한 번)
+
+    LOG_FORMAT=json이면 한 줄에 JSON 객체 하나씩 출력하고, LOG_ASYNC=true면 로그 호출은
+    큐에 레코드를 넣기만 하고 백그라운드 리스너 스레드가 stdout에 씁니다.
+    """
+    global _LOG_LISTENER, _LOG_SAMPLER
+    root = logging.getLogger()
+    if _LOG_SAMPLER is not None or root.handlers:
+        return root
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        JsonFormatter() if is_json_logging() else logging.Formatter(LOG_TEXT_FORMAT)
+    )
+    stream_handler.addFilter(SampledSummaryFilter())
+    _LOG_SAMPLER = ChannelLogSampler()
+
+    if os.getenv("LOG_ASYNC", "false").lower() == "true":
+        log_queue = queue.SimpleQueue()
+        handler = logging.handlers.QueueHandler(log_queue)
+        _LOG_LISTENER = logging.handlers.QueueListener(
+            log_queue, stream_handler, respect_handler_level=True
+        )
+        _LOG_LISTENER.start()
+    else:
+        handler = stream_handler
+    atexit.register(stop_logging)
+    # 샘플링은 큐에 넣기 전에 적용해 생략되는 레코드는 비용이 거의 없음
+    handler.addFilter(_LOG_SAMPLER)
+
+    root.setLevel(logging.INFO)
+    root.addHandler(handler)
+    return root
+
+
+def stop_logging():
+    """큐에 남은 로그를 모두 쓰고 리스너 종료, 샘플링으로 생략된 로그 수 요약"""
+    global _LOG_LISTENER
+    if _LOG_SAMPLER is not None:
+        for name, tag, suppressed in _LOG_SAMPLER.flush():
+            logging.getLogger(name).info(f"[LOG] {tag} 로그 {suppressed}개 생략")
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER = None
 
 
 def setup_logging(logger_name: str) -> logging.Logger:
     """공통 로깅 설정"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-        ],
-    )
+    configure_logging()
     return logging.getLogger(logger_name)
 
 
+def log_separator(logger):
+    """실행 구분선 (텍스트 로그에서만 출력)"""
+    if not is_json_logging():
+        logger.info("-" * 50)
+
+
+def lazy_import(name):
+    """처음 속성에 접근할 때 실제로 로드되는 모듈 반환 (이미 로드됐으면 그대로 반환)
+
+    discord/aiohttp처럼 무거운 모듈을 네트워크가 필요 없는 경로에서 import하지 않기 위해 사용합니다.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
 def check_discord_token() -> str:
     """Discord 토큰 환경변수 확인 및 반환"""
     token = os.getenv("DISCORD_BOT_TOKEN")
@@ -0,0 +1,55 @@
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 저장소에 현재 이름을 기록한 직후 봇 모듈을 실행하고 discord 로드 여부를 출력
+SKIP_RUNNER = """
+import json, runpy, sys
+from bot.registry import get_registry
+from bot.state import get_state_store
+from bot.updater import render_channel_name
+
+get_state_store().reconcile(
+    {record["id"]: render_channel_name(key, record) for key, record in get_registry().items()}
+)
+try:
+    runpy.run_module("bot.bot", run_name="__main__")
+    code = None
+except SystemExit as e:
+    code = e.code
+print(json.dumps({"code": code, "discord": sorted(m for m in sys.modules if m.startswith("discord"))}))
+"""
+
+
+def test_skip_path_does_not_import_discord(tmp_path):
+    registry = tmp_path / "channels.json"
+    registry.write_text(
+        json.dumps(
+            {"channels": {"SEOUL": {"id": 1, "tz": "Asia/Seoul", "emoji": "🇰🇷", "name": "서울"}}}
+        ),
+        encoding="utf-8",
+    )
+    env = dict(
+        os.environ,
+        DISCORD_BOT_TOKEN="test-token",
+        BOT_STATE_DB=str(tmp_path / "state.db"),
+        CHANNEL_REGISTRY=str(registry),
+        BOT_CHANNELS="",
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", SKIP_RUNNER],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.stdout, result.stderr
+    outcome = json.loads(result.stdout.strip().splitlines()[-1])
+    assert outcome["code"] == 0
+    # lazy_import가 등록한 지연 모듈 외에 discord 하위 모듈이 로드되지 않아야 함
+    assert "discord.client" not in outcome["discord"]
+    assert outcome["discord"] in ([], ["discord"])
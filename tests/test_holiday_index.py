@@ -0,0 +1,57 @@
+from datetime import date
+
+import pytest
+
+from bot import holiday_index
+from bot.holiday_index import HolidayIndex, load_snapshot, save_snapshot
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, monkeypatch):
+    path = tmp_path / "holiday_snapshot.json"
+    monkeypatch.setenv("HOLIDAY_SNAPSHOT", str(path))
+    monkeypatch.setattr(holiday_index, "_INDEX", None)
+    return path
+
+
+def stale_index(holidays_version, calendars=("KR", "VN")):
+    start_year, end_year = holiday_index.default_year_range()
+    # 실제 달력에 없는 공휴일 - 다시 생성되면 사라짐
+    names = {date(start_year + 1, 7, 7): "없는 공휴일"}
+    return HolidayIndex(
+        start_year, end_year, {code: dict(names) for code in calendars}, holidays_version
+    )
+
+
+def test_snapshot_round_trip_keeps_holidays_version(snapshot_path):
+    save_snapshot(stale_index("0.1"))
+    assert load_snapshot().holidays_version == "0.1"
+
+
+def test_snapshot_from_same_version_is_reused(snapshot_path):
+    save_snapshot(stale_index(holiday_index.installed_holidays_version()))
+    start_year = holiday_index.default_year_range()[0]
+
+    index = holiday_index.get_holiday_index()
+
+    assert index.holiday_name("KR", date(start_year + 1, 7, 7)) == "없는 공휴일"
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        stale_index("0.1"),
+        stale_index(holiday_index.installed_holidays_version(), calendars=("KR",)),
+    ],
+    ids=["holidays-version", "countries"],
+)
+def test_outdated_snapshot_is_rebuilt(snapshot_path, index):
+    save_snapshot(index)
+    start_year = holiday_index.default_year_range()[0]
+
+    rebuilt = holiday_index.get_holiday_index()
+
+    assert rebuilt.holiday_name("KR", date(start_year + 1, 7, 7)) is None
+    assert rebuilt.holidays_version == holiday_index.installed_holidays_version()
+    assert set(rebuilt.holidays) == set(holiday_index.CALENDAR_EMOJIS)
+    assert load_snapshot().holidays_version == rebuilt.holidays_version
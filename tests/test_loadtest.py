@@ -0,0 +1,17 @@
+from bot.loadtest import parse_args, run_load_test
+
+
+def test_spread_and_budget_follow_the_simulated_clock():
+    options = parse_args(
+        ["--channels", "40", "--hours", "10", "--rps", "5", "--spread", "60"]
+    )
+
+    result = run_load_test(options)
+
+    assert result["diverged"] == 0
+    assert result["ticks"] > 0
+    assert result["patches"] >= result["planned_renames"]
+    assert result["simulated_sec"] >= 10 * 3600
+    # 분산 구간(60초)만큼 늦게 적용된 이름이 있어도 실제로는 기다리지 않음
+    assert result["late_max_sec"] > 30
+    assert result["elapsed_sec"] < 30
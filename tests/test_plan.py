@@ -0,0 +1,55 @@
+from datetime import datetime
+
+import pytz
+
+from bot.plan import compile_plan, patch_plan, plan_fingerprint
+from bot.registry import DEFAULT_CHANNELS, ChannelRegistry
+
+START = pytz.utc.localize(datetime(2026, 10, 1))
+END = pytz.utc.localize(datetime(2026, 10, 3))
+
+
+def channel_entries():
+    channels = {key: dict(entry) for key, entry in DEFAULT_CHANNELS.items()}
+    channels["SEOUL_2"] = dict(DEFAULT_CHANNELS["SEOUL"], id=3, region="SEOUL")
+    return channels
+
+
+def test_fingerprint_is_stable_and_tracks_the_registry():
+    start_ts, end_ts = int(START.timestamp()), int(END.timestamp())
+    registry = ChannelRegistry(channel_entries())
+    fingerprint = plan_fingerprint(registry, start_ts, end_ts)
+
+    assert plan_fingerprint(ChannelRegistry(channel_entries()), start_ts, end_ts) == fingerprint
+    assert plan_fingerprint(registry, start_ts, end_ts + 3600) != fingerprint
+
+    registry.add("HCMC", dict(DEFAULT_CHANNELS["HCMC"], emoji="🏍️"))
+    assert plan_fingerprint(registry, start_ts, end_ts) != fingerprint
+
+
+def test_patched_plan_matches_a_fresh_compile():
+    registry = ChannelRegistry(channel_entries())
+    plan = compile_plan(registry, START, END)
+
+    # 클래스 이동(간격 변경), 새 채널 추가, 클래스가 그대로인 설정 변경(이모지)
+    registry.add("SEOUL_2", dict(registry["SEOUL_2"], interval=5))
+    registry.add("TOKYO", {"id": 4, "tz": "Asia/Tokyo", "emoji": "🇯🇵", "profile": "SEOUL"})
+    registry.add("HCMC", dict(DEFAULT_CHANNELS["HCMC"], emoji="🏍️"))
+
+    compiled = patch_plan(plan, registry, moved={3, 4})
+
+    fresh = compile_plan(registry, START, END)
+    assert compiled == 2
+    assert plan.fingerprint == fresh.fingerprint
+    assert list(plan.entries()) == list(fresh.entries())
+
+
+def test_stale_class_is_recompiled():
+    registry = ChannelRegistry(channel_entries())
+    plan = compile_plan(registry, START, END)
+    seoul_class = registry.class_of("SEOUL")
+
+    compiled = patch_plan(plan, registry, stale={seoul_class})
+
+    assert compiled == 1
+    assert list(plan.entries()) == list(compile_plan(registry, START, END).entries())
@@ -0,0 +1,79 @@
+import pytest
+
+from bot.ratelimit import RenameBuckets, RequestBudget
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_rename_buckets_allow_two_renames_per_ten_minutes():
+    clock = FakeClock()
+    buckets = RenameBuckets(clock=clock)
+
+    assert buckets.acquire("SEOUL") == 0
+    clock.now += 100
+    assert buckets.acquire("SEOUL") == 0
+    assert buckets.remaining("SEOUL") == 0
+    # 첫 요청이 윈도우를 벗어날 때까지 대기
+    assert buckets.acquire("SEOUL") == pytest.approx(500)
+    # 다른 채널은 영향 없음
+    assert buckets.acquire("HCMC") == 0
+
+    clock.now += 500
+    assert buckets.remaining("SEOUL") == 1
+    assert buckets.acquire("SEOUL") == 0
+
+
+def test_rename_buckets_release_returns_the_slot():
+    clock = FakeClock()
+    buckets = RenameBuckets(clock=clock)
+    buckets.acquire("SEOUL")
+    buckets.acquire("SEOUL")
+
+    buckets.release("SEOUL")
+
+    assert buckets.remaining("SEOUL") == 1
+    assert buckets.acquire("SEOUL") == 0
+
+
+def test_rename_buckets_block_until_retry_after():
+    clock = FakeClock()
+    buckets = RenameBuckets(clock=clock)
+
+    buckets.block("SEOUL", 30)
+
+    assert buckets.remaining("SEOUL") == 0
+    assert buckets.acquire("SEOUL") == pytest.approx(30)
+    clock.now += 30
+    assert buckets.acquire("SEOUL") == 0
+
+    buckets.block("SEOUL", 30)
+    buckets.clear()
+    assert buckets.remaining("SEOUL") == 2
+
+
+def test_request_budget_spaces_requests_after_burst():
+    clock = FakeClock()
+    budget = RequestBudget(rate=10, burst=2, clock=clock)
+
+    waits = [budget.reserve() for _ in range(5)]
+
+    assert waits == pytest.approx([0.0, 0.0, 0.1, 0.2, 0.3])
+
+    # 예약한 시각이 지나면 다시 burst만큼 바로 보낼 수 있음
+    clock.now += 10
+    assert [budget.reserve() for _ in range(3)] == pytest.approx([0.0, 0.0, 0.1])
+
+    budget.reset()
+    assert budget.reserve() == 0.0
+
+
+@pytest.mark.parametrize("rate", [0, None])
+def test_request_budget_without_rate_is_unlimited(rate):
+    budget = RequestBudget(rate=rate, clock=FakeClock())
+    assert all(budget.reserve() == 0.0 for _ in range(100))
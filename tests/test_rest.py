@@ -0,0 +1,106 @@
+import asyncio
+
+import discord
+import pytest
+
+from bot.fake_discord import FakeDiscord
+from bot.loadtest import SimulatedClock, SimulatedEventLoop
+from bot.rest import MAX_RETRIES, RestClient, parse_rate_limit
+
+
+async def rename_through(fake, channel_id, name):
+    api_base = await fake.start()
+    try:
+        async with RestClient("test", api_base=api_base) as client:
+            await client.get_channel(channel_id).edit(name=name)
+    finally:
+        await fake.stop()
+
+
+def run_simulated(clock, coro):
+    """백오프 대기를 실제로 기다리지 않도록 시뮬레이션 시계의 이벤트 루프에서 실행"""
+    with asyncio.Runner(loop_factory=lambda: SimulatedEventLoop(clock)) as runner:
+        return runner.run(coro)
+
+
+def test_parse_rate_limit_prefers_json_body():
+    headers = {"Retry-After": "3", "X-RateLimit-Global": "false"}
+    assert parse_rate_limit(headers, {"retry_after": 0.5, "global": True}) == (0.5, True)
+
+
+def test_parse_rate_limit_falls_back_to_headers_for_non_json_body():
+    html = "<html>error code: 1015</html>"
+    assert parse_rate_limit({"Retry-After": "2"}, html) == (2.0, False)
+    assert parse_rate_limit(
+        {"Retry-After": "2", "X-RateLimit-Reset-After": "1.25"}, html
+    ) == (1.25, False)
+    assert parse_rate_limit({"X-RateLimit-Global": "true"}, html) == (1.0, True)
+
+
+def test_non_json_429_is_retried():
+    fake = FakeDiscord(cloudflare_rate=0.5, retry_after=0.01, seed=1)
+    fake.add_channel(1, name="old")
+
+    asyncio.run(rename_through(fake, 1, "new"))
+
+    assert fake.stats["rate_limited"] > 0
+    assert fake.channel_name(1) == "new"
+
+
+def test_global_429_holds_every_request():
+    fake = FakeDiscord(global_limit=1)
+    for channel_id in (1, 2, 3):
+        fake.add_channel(channel_id, name="old")
+
+    async def rename_all():
+        api_base = await fake.start()
+        try:
+            async with RestClient("test", api_base=api_base) as client:
+                await asyncio.gather(
+                    *(client.get_channel(channel_id).edit(name="new") for channel_id in (1, 2, 3))
+                )
+                return client._global_reset
+        finally:
+            await fake.stop()
+
+    global_reset = asyncio.run(rename_all())
+
+    assert fake.stats["global_limited"] > 0
+    assert global_reset > 0
+    assert all(fake.channel_name(channel_id) == "new" for channel_id in (1, 2, 3))
+
+
+def test_server_errors_are_retried_until_success():
+    clock = SimulatedClock(0.0)
+    fake = FakeDiscord(error_rate=0.5, seed=3, clock=clock)
+    fake.add_channel(1, name="old")
+
+    run_simulated(clock, rename_through(fake, 1, "new"))
+
+    assert 0 < fake.stats["server_errors"] <= MAX_RETRIES
+    assert fake.channel_name(1) == "new"
+
+
+def test_outage_raises_server_error_after_retries():
+    clock = SimulatedClock(0.0)
+    fake = FakeDiscord(clock=clock)
+    fake.add_channel(1, name="old")
+    fake.add_outage(0.0, 3600.0)
+
+    with pytest.raises(discord.DiscordServerError):
+        run_simulated(clock, rename_through(fake, 1, "new"))
+
+    assert fake.stats["server_errors"] == MAX_RETRIES + 1
+    assert fake.channel_name(1) == "old"
+
+
+def test_long_retry_after_raises_rate_limited():
+    fake = FakeDiscord(ratelimit_rate=1.0, retry_after=10)
+    fake.add_channel(1, name="old")
+
+    with pytest.raises(discord.RateLimited) as excinfo:
+        asyncio.run(rename_through(fake, 1, "new"))
+
+    assert excinfo.value.retry_after == 10
+    assert fake.stats["rate_limited"] == 1
+    assert fake.channel_name(1) == "old"
@@ -0,0 +1,67 @@
+from bot.retry_queue import PendingRenames
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_submit_keeps_latest_name_and_retry_time():
+    clock = FakeClock()
+    pending = PendingRenames(clock=clock)
+
+    pending.fail("SEOUL", "🇰🇷∥09:00-💼")
+    due = pending.get("SEOUL")["due"]
+    pending.submit("SEOUL", "🇰🇷∥09:10-💼")
+
+    entry = pending.get("SEOUL")
+    assert len(pending) == 1
+    assert entry["name"] == "🇰🇷∥09:10-💼"
+    assert entry["due"] == due
+    assert entry["attempts"] == 1
+    assert pending.is_waiting("SEOUL")
+
+
+def test_new_entry_is_due_immediately():
+    pending = PendingRenames(clock=FakeClock())
+
+    pending.submit("SEOUL", "이름")
+
+    assert pending.due() == ["SEOUL"]
+    assert not pending.is_waiting("SEOUL")
+
+
+def test_fail_backs_off_exponentially_up_to_max_delay():
+    pending = PendingRenames(base_delay=2, max_delay=30, clock=FakeClock())
+
+    delays = [pending.fail("SEOUL", "이름") for _ in range(6)]
+
+    assert delays == [2, 4, 8, 16, 30, 30]
+
+
+def test_longer_retry_after_wins_over_backoff():
+    pending = PendingRenames(clock=FakeClock())
+
+    assert pending.fail("SEOUL", "이름", retry_after=60) == 60
+    assert pending.fail("HCMC", "이름", retry_after=0.5) == 2
+
+
+def test_due_and_discard_follow_the_clock():
+    clock = FakeClock()
+    pending = PendingRenames(clock=clock)
+    pending.fail("SEOUL", "이름")
+    pending.fail("HCMC", "이름", retry_after=10)
+
+    assert pending.due() == []
+    assert pending.next_due() == clock.now + 2
+
+    clock.now += 2
+    assert pending.due() == ["SEOUL"]
+
+    pending.discard("SEOUL")
+    assert pending.next_due() == clock.now + 8
+    pending.clear()
+    assert pending.next_due() is None
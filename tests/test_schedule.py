@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from bot.registry import DEFAULT_CHANNELS, ChannelRegistry
+from bot.schedule import next_change_time
+from bot.updater import render_channel_name
+
+REGISTRY = ChannelRegistry(
+    dict(
+        DEFAULT_CHANNELS,
+        SEOUL_LATE={
+            "id": 3,
+            "tz": "Asia/Seoul",
+            "emoji": "🌙",
+            "region": "SEOUL",
+            "interval": 7,
+            "night_start": 1,
+            "night_end": 9,
+        },
+    )
+)
+
+# 평일, 주말, 공휴일(한글날, 국경일)을 포함하는 시작 시각 (UTC)
+STARTS = [
+    datetime(2026, 10, 8, 0, 0),
+    datetime(2026, 10, 8, 12, 58),
+    datetime(2026, 10, 9, 3, 17),
+    datetime(2026, 10, 10, 15, 0),
+    datetime(2026, 9, 1, 22, 44),
+    datetime(2026, 9, 2, 1, 59),
+]
+
+
+def is_update_minute(key, instant):
+    """갱신 간격 격자의 분이거나 상태(근무/야간/휴일)가 바뀌는 분인지 확인"""
+    record = REGISTRY[key]
+    local = instant.astimezone(pytz.timezone(record["tz"]))
+    if (local.hour * 60 + local.minute) % record["interval"] == 0:
+        return True
+    status_only = dict(record, template="{status}")
+    previous = instant - timedelta(minutes=1)
+    return render_channel_name(key, status_only, instant) != render_channel_name(
+        key, status_only, previous
+    )
+
+
+def brute_force_change(key, now, limit=timedelta(days=3)):
+    """1분씩 렌더링해 표시 이름이 처음 바뀌는 갱신 시각 찾기"""
+    record = REGISTRY[key]
+    current = render_channel_name(key, record, now)
+    instant = now
+    while instant - now < limit:
+        instant += timedelta(minutes=1)
+        if render_channel_name(
+            key, record, instant
+        ) != current and is_update_minute(key, instant):
+            return instant
+    raise AssertionError(f"{key}: {limit} 안에 이름이 바뀌지 않았습니다")
+
+
+@pytest.mark.parametrize("key", list(REGISTRY))
+def test_next_change_time_matches_minute_scan(key):
+    for start in STARTS:
+        now = pytz.utc.localize(start)
+        # 연속된 변경 시점을 따라가며 비교
+        for _ in range(8):
+            expected = brute_force_change(key, now)
+            assert next_change_time(key, REGISTRY[key], now) == expected, now
+            now = expected
@@ -0,0 +1,33 @@
+import logging
+
+import discord
+
+from bot import session
+from bot.state import AppliedNameStore
+
+
+def test_installed_discord_has_session_internals():
+    assert session.missing_session_internals() == []
+
+
+def test_missing_internals_fall_back_to_identify(monkeypatch, caplog):
+    monkeypatch.delattr(discord.state.ConnectionState, "_add_guild_from_data")
+    store = AppliedNameStore(":memory:")
+    store.save_snapshot(session.SESSION_SNAPSHOT, {"session_id": "abc", "sequence": 1})
+
+    with caplog.at_level(logging.WARNING, logger="discord_session"):
+        client = session.create_resumable_client(store=store)
+
+    assert type(client) is discord.Client
+    assert "ConnectionState._add_guild_from_data" in caplog.text
+
+
+def test_resumable_client_keeps_saved_session():
+    store = AppliedNameStore(":memory:")
+    snapshot = {"session_id": "abc", "sequence": 1}
+    store.save_snapshot(session.SESSION_SNAPSHOT, snapshot)
+
+    client = session.create_resumable_client(store=store)
+
+    assert isinstance(client, session.resumable_client_class())
+    assert client.session == snapshot
@@ -0,0 +1,31 @@
+import json
+import os
+import subprocess
+import sys
+
+from bot.sharding import shard_state_path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_shard_state_path_is_separate_per_worker():
+    assert shard_state_path("/data/state.db", [0, 2]) == "/data/state.shard0-2.db"
+    assert shard_state_path("/data/state.db", [1, 3]) == "/data/state.shard1-3.db"
+    assert shard_state_path(":memory:", [0]) == ":memory:"
+
+
+def test_supervisor_import_does_not_load_discord_client():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys, bot.sharding; "
+            "print(json.dumps(sorted(m for m in sys.modules if m.startswith('discord'))))",
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.stdout, result.stderr
+    assert "discord.client" not in json.loads(result.stdout)
@@ -0,0 +1,33 @@
+from bot.state import AppliedNameStore
+
+
+def test_reconcile_reports_manual_renames_and_records_actual_names():
+    store = AppliedNameStore(":memory:")
+    store.record(1, "🇰🇷∥09:00-💼")
+    store.record(2, "🇻🇳∥07:00-💼")
+
+    mismatched = store.reconcile({1: "🇰🇷∥09:00-💼", 2: "수동 변경", 3: "새 채널"})
+
+    # 기록이 없던 채널은 불일치로 보지 않고 실제 이름만 기록
+    assert mismatched == [2]
+    assert store.is_current(2, "수동 변경")
+    assert store.is_current(3, "새 채널")
+    assert store.reconcile({1: "🇰🇷∥09:00-💼", 2: "수동 변경"}) == []
+
+
+def test_reconcile_updates_last_reconciled(tmp_path):
+    path = str(tmp_path / "state.db")
+    store = AppliedNameStore(path)
+    assert store.reconcile_due(interval=3600)
+
+    store.reconcile({1: "이름"})
+
+    assert not store.reconcile_due(interval=3600)
+    assert store.reconcile_due(interval=0)
+    store.close()
+
+    # 재시작 후에도 마지막 대조 시각과 기록이 유지됨
+    reopened = AppliedNameStore(path)
+    assert reopened.last_reconciled == store.last_reconciled
+    assert reopened.is_current(1, "이름")
+    reopened.close()